@@ -8,11 +8,25 @@ from .nodes import (
     node_determine_verdict,
     node_check_reflect,
     node_reflect,
+    anode_extract_claim,
+    anode_generate_queries,
+    anode_search,
+    anode_score_evidence,
+    anode_determine_verdict,
+    anode_check_reflect,
+    anode_reflect,
 )
 
 
-def build_agent_graph():
-    """ 
+def route_after_check(state: AgentState) -> str:
+    """
+    check_reflect sets last_action to 'reflect' or 'finish'.
+    """
+    return "reflect" if state.get("last_action") == "reflect" else "finish"
+
+
+def _wire_graph(nodes: dict):
+    """
     Graph flow:
     extract_claim -> generate_queries -> search -> score_evidence -> determine_verdict -> check_reflect
     if check_reflect sets last_action == 'reflect' -> reflect -> search -> score -> determine_verdict -> check_reflect...
@@ -20,13 +34,8 @@ def build_agent_graph():
     """
     graph = StateGraph(AgentState)
 
-    graph.add_node("extract_claim", node_extract_claim)
-    graph.add_node("generate_queries", node_generate_queries)
-    graph.add_node("search", node_search)
-    graph.add_node("score_evidence", node_score_evidence)
-    graph.add_node("determine_verdict", node_determine_verdict)
-    graph.add_node("check_reflect", node_check_reflect)
-    graph.add_node("reflect", node_reflect)
+    for name, fn in nodes.items():
+        graph.add_node(name, fn)
 
     graph.set_entry_point("extract_claim")
 
@@ -36,14 +45,44 @@ def build_agent_graph():
     graph.add_edge("score_evidence", "determine_verdict")
     graph.add_edge("determine_verdict", "check_reflect")
 
-    # reflection loop: check_reflect -> reflect -> search
-    graph.add_edge("check_reflect", "reflect")
+    # reflection loop: check_reflect -> reflect -> search, otherwise finish
+    graph.add_conditional_edges(
+        "check_reflect",
+        route_after_check,
+        {"reflect": "reflect", "finish": END},
+    )
     graph.add_edge("reflect", "search")
 
-    # if no reflection, allow check_reflect -> END
-    graph.add_edge("check_reflect", END)
+    return graph.compile()
 
-    # after reflection loop, continue normal path (edges already create loops)
-    graph.add_edge("determine_verdict", END)
 
-    return graph.compile()
+def build_agent_graph():
+    """
+    Sync graph, run with agent.invoke(...).
+    """
+    return _wire_graph({
+        "extract_claim": node_extract_claim,
+        "generate_queries": node_generate_queries,
+        "search": node_search,
+        "score_evidence": node_score_evidence,
+        "determine_verdict": node_determine_verdict,
+        "check_reflect": node_check_reflect,
+        "reflect": node_reflect,
+    })
+
+
+def build_async_agent_graph():
+    """
+    Async graph, run with await agent.ainvoke(...) or agent.astream(...).
+    Searches go through the shared async MCP client, so many runs
+    can share one event loop.
+    """
+    return _wire_graph({
+        "extract_claim": anode_extract_claim,
+        "generate_queries": anode_generate_queries,
+        "search": anode_search,
+        "score_evidence": anode_score_evidence,
+        "determine_verdict": anode_determine_verdict,
+        "check_reflect": anode_check_reflect,
+        "reflect": anode_reflect,
+    })
@@ -1,6 +1,18 @@
 import requests
+import httpx
 import os
 import socket
+import sys
+
+# ----- Make project root importable for the shared infra.search package -----
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from infra.search.results import as_evidence
+from infra.search.serialization import loads
+from infra.search.adaptive_timeout import adaptive_timeouts
+from infra.search.cost_ledger import charge_upstream
 
 MCP_BASE = "http://localhost:8001"
 MCP_URL = f"{MCP_BASE}/tools/search/call"
@@ -8,28 +20,84 @@ MCP_KEY = os.getenv("MCP_API_KEY", "")
 
 print("Using MCP client connecting to:", MCP_BASE, "(", socket.gethostbyname('localhost'), ")")
 
+# Shared async client: one connection pool for every agent run in the event loop
+_async_client = None
+
+
+def _headers():
+    headers = {"Content-Type": "application/json"}
+    if MCP_KEY:
+        headers["X-API-KEY"] = MCP_KEY
+    return headers
+
 
-def mcp_search(query: str, top_k: int = 3):
+def mcp_search(query: str, top_k: int = 3, priority: str = "interactive", ledger=None):
     """
-    Calls the MCP search tool and returns list of results.
+    Calls the MCP search tool and returns list of Evidence records.
+    priority is the outbound scheduler class used by the MCP side.
+    ledger: optional CostLedger charged for the round trip; returns []
+    without calling MCP once the budget is used up.
     """
+    if not charge_upstream(ledger, "mcp"):
+        return []
     payload = {
         "args": [query],
-        "kwargs": {},
+        "kwargs": {"top_k": top_k, "priority": priority},
     }
 
-    headers = {"Content-Type": "application/json"}
-    if MCP_KEY:
-        headers["X-API-KEY"] = MCP_KEY
+    try:
+        timeout = adaptive_timeouts.timeout_for("mcp")
+        with adaptive_timeouts.measure("mcp", timeout, requests.Timeout):
+            resp = requests.post(MCP_URL, json=payload, headers=_headers(), timeout=timeout)
+        resp.raise_for_status()
+        data = loads(resp.content)
+        if not isinstance(data, dict):
+            return []
+        return as_evidence(data.get("result", []))
+    except Exception as e:
+        print("MCP search error:", e)
+        return []
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(timeout=10)
+    return _async_client
+
+
+async def amcp_search(query: str, top_k: int = 3, priority: str = "interactive", ledger=None):
+    """
+    Async variant of mcp_search.
+    Uses a shared httpx.AsyncClient so concurrent agent runs
+    wait on the event loop instead of holding a thread each.
+    """
+    if not charge_upstream(ledger, "mcp"):
+        return []
+    payload = {
+        "args": [query],
+        "kwargs": {"top_k": top_k, "priority": priority},
+    }
 
     try:
-        resp = requests.post(MCP_URL, json=payload, headers=headers, timeout=10)
+        timeout = adaptive_timeouts.timeout_for("mcp")
+        with adaptive_timeouts.measure("mcp", timeout, httpx.TimeoutException):
+            resp = await _get_async_client().post(MCP_URL, json=payload, headers=_headers(), timeout=timeout)
         resp.raise_for_status()
-        data = resp.json()
+        data = loads(resp.content)
         if not isinstance(data, dict):
             return []
-        return data.get("result", [])
+        return as_evidence(data.get("result", []))
     except Exception as e:
         print("MCP search error:", e)
         return []
 
+
+async def aclose_mcp_client():
+    """
+    Close the shared async client (called on app shutdown).
+    """
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
@@ -1,108 +1,309 @@
-from .state import AgentState
+from .state import AgentState, STATE_DEFAULTS
 from app.services.agent_service import extract_claim, generate_queries, score_sources, determine_verdict
-from agent.mcp_client import mcp_search
-import random
+from agent.mcp_client import mcp_search, amcp_search
+from agent.query_planner import query_planner, USEFUL_SCORE
+from infra.search.rate_limiter import PRIORITY_INTERACTIVE, PRIORITY_REFLECTION
+from infra.search.evidence_index import get_evidence_index
+from fastapi.concurrency import run_in_threadpool
+import asyncio
+import time
 
+# results per query, same as mcp_search's default
+MCP_TOP_K = 3
 
-def node_extract_claim(state: AgentState) -> AgentState:
-    state.claim = extract_claim(state.text)
-    state.reasoning.append("Claim extracted.")
-    return state
+# Nodes return partial updates: only the keys they change. `reasoning` and
+# `sources` are reducer channels, so nodes return just the new items.
 
 
-def node_generate_queries(state: AgentState) -> AgentState:
-    state.queries = generate_queries(state.claim)
-    state.reasoning.append("Queries generated.")
-    return state
+def node_extract_claim(state: AgentState) -> dict:
+    update = {k: v for k, v in STATE_DEFAULTS.items() if k not in state}
+    update["claim"] = extract_claim(state["text"])
+    update["reasoning"] = ["Claim extracted."]
+    return update
 
 
-def node_search(state: AgentState) -> AgentState:
+def node_generate_queries(state: AgentState) -> dict:
+    return {
+        "queries": generate_queries(state["claim"]),
+        "reasoning": ["Queries generated."],
+    }
+
+
+def node_search(state: AgentState) -> dict:
     """
     Perform MCP search for each query. Collect all results.
     THIS VERSION GUARANTEES THAT mcp_search() IS CALLED.
     """
-    all_results = []
-    queries = state.queries or []
+    results_per_query = []
+    queries, exhausted = _queries_within_budget(state)
+    local_queries, local_results, remote = _split_local(queries)
 
-    for q in queries:
+    for q in remote:
         print("DEBUG: calling MCP search for query:", q)
-        res = mcp_search(q)
+        res = mcp_search(q, priority=_search_priority(state), ledger=state.get("cost_ledger"))
         print("DEBUG: MCP returned:", res)
+        results_per_query.append(res)
+    _remember(results_per_query)
+
+    return _collect_search_results(state, local_results + results_per_query, exhausted, len(local_results),
+                                   queries=local_queries + remote)
+
+
+def _split_local(queries: list):
+    """
+    Answer queries from the local evidence index where it has enough recall.
+    Returns (answered queries, local results per answered query, queries that need MCP).
+    """
+    index = get_evidence_index()
+    local_queries, local_results, remote = [], [], []
+    for q in queries:
+        hits = index.lookup(q, top_k=MCP_TOP_K)
+        if hits is None:
+            remote.append(q)
+        else:
+            local_queries.append(q)
+            local_results.append(hits)
+    return local_queries, local_results, remote
+
+
+def _search_priority(state: AgentState) -> str:
+    """
+    Reflection retries yield to first-pass (interactive) searches upstream.
+    """
+    return PRIORITY_REFLECTION if state.get("attempts", 0) > 0 else PRIORITY_INTERACTIVE
+
+
+def _queries_within_budget(state: AgentState):
+    """
+    Trim this pass's queries to the remaining search budget.
+    Returns (queries, exhausted_budget_name_or_None).
+    """
+    queries = state.get("queries") or []
+    max_searches = state.get("max_searches")
+    if max_searches is None:
+        return queries, None
+    remaining = max(0, max_searches - state.get("searches_used", 0))
+    exhausted = "max_searches" if remaining < len(queries) else None
+    return queries[:remaining], exhausted
+
+
+def _budget_exhausted(state: AgentState):
+    """
+    Name of the first budget that is used up, or None.
+    """
+    ledger = state.get("cost_ledger")
+    if ledger is not None and ledger.exhausted:
+        return ledger.exhausted
+    max_searches = state.get("max_searches")
+    if max_searches is not None and state.get("searches_used", 0) >= max_searches:
+        return "max_searches"
+    deadline = state.get("deadline")
+    if deadline is not None and time.monotonic() >= deadline:
+        return "deadline"
+    return None
+
+
+def _remember(results_per_query):
+    """
+    Keep MCP results in this process's evidence index (the MCP server persists them).
+    """
+    index = get_evidence_index()
+    for res in results_per_query:
         if res:
-            all_results.extend(res)
+            index.add(res, persist=False)
 
-    state.sources = all_results
-    state.reasoning.append(f"Searched {len(all_results)} sources via MCP.")
-    return state
 
+def _collect_search_results(state: AgentState, results_per_query: list, exhausted=None, local_count: int = 0,
+                            queries=None) -> dict:
+    """
+    `queries`, aligned with results_per_query, lets sources found by
+    planned reflection queries be credited to their template.
+    """
+    ledger = state.get("cost_ledger")
+    if ledger is not None and ledger.exhausted:
+        exhausted = exhausted or ledger.exhausted
+    update = {"budget_exhausted": exhausted} if exhausted else {}
+    if not results_per_query:
+        # budget left no searches for this pass; keep earlier evidence
+        update["reasoning"] = ["Search skipped: search budget exhausted."]
+        return update
 
-def node_score_evidence(state: AgentState) -> AgentState:
-    scored = score_sources(state.sources or [], (state.claim or "").split()[:8])
-    state.sources = scored
-    state.reasoning.append(f"Scored {len(scored)} sources.")
-    return state
+    all_results = []
+    for res in results_per_query:
+        if res:
+            all_results.extend(res)
 
+    templates = state.get("query_templates") or {}
+    if templates and queries:
+        known = {s.link or s.title for s in state.get("sources") or []}
+        update["answered_templates"] = [
+            templates[q] for q, res in zip(queries, results_per_query) if q in templates and res
+        ]
+        update["source_templates"] = {
+            ev.link or ev.title: templates[q]
+            for q, res in zip(queries, results_per_query) if q in templates
+            for ev in res or [] if (ev.link or ev.title) not in known
+        }
 
-def node_determine_verdict(state: AgentState) -> AgentState:
-    verdict, confidence = determine_verdict(state.sources or [])
-    state.verdict = verdict
-    state.confidence = float(confidence or 0.0)
-    state.reasoning.append(f"Determined verdict: {verdict} (conf={state.confidence:.2f}).")
-    return state
+    # locally answered queries don't spend the web search budget
+    update["searches_used"] = state.get("searches_used", 0) + len(results_per_query) - local_count
+    update["sources"] = all_results
+    if local_count:
+        update["reasoning"] = [
+            f"Collected {len(all_results)} sources; {local_count} of {len(results_per_query)} "
+            f"queries answered from the local evidence index."
+        ]
+    else:
+        update["reasoning"] = [f"Searched {len(all_results)} sources via MCP."]
+    return update
 
 
-# --- Reflection / Retry nodes ---
+def node_score_evidence(state: AgentState) -> dict:
+    # only newly found sources need scoring; earlier ones keep their score
+    unscored = [s for s in state.get("sources") or [] if s.score is None]
+    scored = score_sources(unscored, (state.get("claim") or "").split()[:8])
+    update = {
+        "sources": scored,
+        "reasoning": [f"Scored {len(scored)} sources."],
+    }
+    if state.get("query_templates"):
+        _credit_templates(state, scored)
+        update["query_templates"] = None
+        update["source_templates"] = None
+        update["answered_templates"] = None
+    return update
 
 
-def _refine_query_variations(base: str) -> list:
+def _credit_templates(state: AgentState, scored):
     """
-    Produce several refined query variants from a base claim.
+    Feed the planner: each template whose query came back with results
+    cost one search and found however many new sources scored as useful.
+    Templates whose query returned nothing are not charged: an empty
+    answer can't be told apart from an MCP outage, a refused budget or a
+    negative-cache skip, none of which say anything about the template.
     """
-    # deterministic but varied refinements
-    seeds = [
-        f"{base} official statement",
-        f"{base} statement from government",
-        f"{base} fact check",
-        f"{base} analysis",
-        f"{base} reported by news",
-        f"{base} Reuters",
-        f"{base} BBC",
-        f"{base} The Hindu",
-        f"{base} clarification",
-    ]
-    # randomize order but keep deterministic by shuffle with seed from base
-    r = random.Random(hash(base) & 0xFFFFFFFF)
-    r.shuffle(seeds)
-    return seeds
+    found = state.get("source_templates") or {}
+    answered = set(state.get("answered_templates") or ())
+    useful = {}
+    for ev in scored:
+        name = found.get(ev.link or ev.title)
+        if name is not None and ev.score >= USEFUL_SCORE:
+            useful[name] = useful.get(name, 0) + 1
+    for name in set(state["query_templates"].values()) & answered:
+        query_planner.record(name, searches=1, useful=useful.get(name, 0))
 
 
-def node_check_reflect(state: AgentState) -> AgentState:
+def node_determine_verdict(state: AgentState) -> dict:
+    verdict, confidence = determine_verdict(state.get("sources") or [])
+    confidence = float(confidence or 0.0)
+    return {
+        "verdict": verdict,
+        "confidence": confidence,
+        "reasoning": [f"Determined verdict: {verdict} (conf={confidence:.2f})."],
+    }
+
+
+# --- Reflection / Retry nodes ---
+
+
+def node_check_reflect(state: AgentState) -> dict:
     """
     Decide whether to reflect and retry or finish.
-    If confidence is below threshold and attempts < max_attempts  prepare to reflect.
+    If confidence is below threshold and attempts < max_attempts  prepare to reflect.
     """
     # if no sources or low confidence, consider reflecting
-    conf = state.confidence or 0.0
-    if (not state.sources or len(state.sources) < 2) and state.attempts < state.max_attempts:
-        state.reasoning.append("Reflection triggered: insufficient evidence.")
-        state.last_action = "reflect"
-    elif conf < state.confidence_target and state.attempts < state.max_attempts:
-        state.reasoning.append(f"Reflection triggered: low confidence ({conf:.2f} < {state.confidence_target}).")
-        state.last_action = "reflect"
-    else:
-        state.reasoning.append("No reflection needed; finishing.")
-        state.last_action = "finish"
-    return state
+    sources = state.get("sources") or []
+    conf = state.get("confidence") or 0.0
+    attempts = state.get("attempts", 0)
+    max_attempts = state.get("max_attempts", STATE_DEFAULTS["max_attempts"])
+    target = state.get("confidence_target", STATE_DEFAULTS["confidence_target"])
 
+    wants_reflect = len(sources) < 2 or conf < target
+    exhausted = _budget_exhausted(state)
+    if wants_reflect and exhausted and attempts < max_attempts:
+        return {
+            "budget_exhausted": exhausted,
+            "last_action": "finish",
+            "reasoning": [f"Budget exhausted ({exhausted}); finishing."],
+        }
+    elif len(sources) < 2 and attempts < max_attempts:
+        return {"last_action": "reflect", "reasoning": ["Reflection triggered: insufficient evidence."]}
+    elif conf < target and attempts < max_attempts:
+        return {
+            "last_action": "reflect",
+            "reasoning": [f"Reflection triggered: low confidence ({conf:.2f} < {target})."],
+        }
+    elif wants_reflect:
+        return {
+            "budget_exhausted": "max_attempts",
+            "last_action": "finish",
+            "reasoning": [f"Reflection budget used ({attempts}/{max_attempts}); finishing."],
+        }
+    return {"last_action": "finish", "reasoning": ["No reflection needed; finishing."]}
 
-def node_reflect(state: AgentState) -> AgentState:
+
+def node_reflect(state: AgentState) -> dict:
     """
-    Produce refined queries and increment attempt counter.
+    Plan this pass's refined queries and increment attempt counter.
+    Templates are picked by observed yield within the remaining search
+    budget; earlier queries are not searched again.
     """
-    state.attempts += 1
-    base = state.claim or state.text
-    refined = _refine_query_variations(base)
-    # merge with existing queries but prefer refined first
-    state.queries = refined + (state.queries or [])
-    state.reasoning.append(f"Reflection pass {state.attempts}: generated {len(refined)} refined queries.")
-    return state
+    attempts = state.get("attempts", 0) + 1
+    base = state.get("claim") or state["text"]
+    max_searches = state.get("max_searches")
+    budget = None if max_searches is None else max_searches - state.get("searches_used", 0)
+    tried = state.get("templates_tried") or []
+    planned = query_planner.plan(base, budget=budget, exclude=tried)
+    return {
+        "attempts": attempts,
+        "queries": [query for _, query in planned],
+        "query_templates": {query: name for name, query in planned},
+        "templates_tried": tried + [name for name, _ in planned],
+        "reasoning": [
+            f"Reflection pass {attempts}: planned {len(planned)} refined queries "
+            f"({', '.join(name for name, _ in planned) or 'none left'})."
+        ],
+    }
+
+
+# --- Async variants (used by build_async_agent_graph) ---
+
+
+async def anode_extract_claim(state: AgentState) -> dict:
+    return node_extract_claim(state)
+
+
+async def anode_generate_queries(state: AgentState) -> dict:
+    return node_generate_queries(state)
+
+
+async def anode_search(state: AgentState) -> dict:
+    """
+    Async MCP search: all queries of a pass run concurrently on the event loop.
+    Local index lookups and inserts (CPU-bound, may load the index file)
+    run in the threadpool.
+    """
+    queries, exhausted = _queries_within_budget(state)
+    local_queries, local_results, remote = await run_in_threadpool(_split_local, queries)
+    priority = _search_priority(state)
+    ledger = state.get("cost_ledger")
+    results_per_query = await asyncio.gather(*(amcp_search(q, priority=priority, ledger=ledger) for q in remote))
+    await run_in_threadpool(_remember, results_per_query)
+    return _collect_search_results(state, local_results + list(results_per_query), exhausted, len(local_results),
+                                   queries=local_queries + remote)
+
+
+async def anode_score_evidence(state: AgentState) -> dict:
+    return node_score_evidence(state)
+
+
+async def anode_determine_verdict(state: AgentState) -> dict:
+    return node_determine_verdict(state)
+
+
+async def anode_check_reflect(state: AgentState) -> dict:
+    return node_check_reflect(state)
+
+
+async def anode_reflect(state: AgentState) -> dict:
+    return node_reflect(state)
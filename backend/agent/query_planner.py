@@ -0,0 +1,126 @@
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Reflection query templates, in tie-break order (name, format)
+QUERY_TEMPLATES: Tuple[Tuple[str, str], ...] = (
+    ("fact_check", "{base} fact check"),
+    ("official", "{base} official statement"),
+    ("reuters", "{base} Reuters"),
+    ("news", "{base} reported by news"),
+    ("government", "{base} statement from government"),
+    ("bbc", "{base} BBC"),
+    ("analysis", "{base} analysis"),
+    ("clarification", "{base} clarification"),
+    ("the_hindu", "{base} The Hindu"),
+)
+
+# Queries planned per reflection pass (before the search budget is applied)
+QUERIES_PER_PASS = int(os.getenv("REFLECT_QUERIES_PER_PASS", "3"))
+
+# A newly found source scoring at least this counts as useful evidence
+USEFUL_SCORE = float(os.getenv("PLANNER_USEFUL_SCORE", "0.6"))
+
+# Prior: every template starts as if it had found PRIOR_YIELD useful
+# sources per search over PRIOR_SEARCHES searches, so untried templates
+# still get picked ahead of ones that keep coming back empty
+PRIOR_SEARCHES = 2.0
+PRIOR_YIELD = 0.5
+
+# Observed counters halve every PLANNER_HALF_LIFE seconds, so a template
+# that had a bad spell (or was never picked since) drifts back to the prior
+PLANNER_HALF_LIFE = float(os.getenv("PLANNER_HALF_LIFE", "3600"))
+
+
+class QueryPlanner:
+    """
+    Picks reflection query templates by observed yield: useful new sources
+    per search spent. Ranking is a pure function of the counters, with ties
+    (and the cold start) broken by template order, so it is identical across
+    processes instead of depending on the per-process hash() seed.
+    """
+
+    def __init__(self, templates=QUERY_TEMPLATES, half_life: float = PLANNER_HALF_LIFE):
+        self.templates = tuple(templates)
+        self.half_life = half_life
+        self._formats = dict(self.templates)
+        self._lock = threading.Lock()
+        self._searches: Dict[str, float] = {name: 0.0 for name, _ in self.templates}
+        self._useful: Dict[str, float] = {name: 0.0 for name, _ in self.templates}
+        self._decayed_at = time.monotonic()
+
+    def _decay(self):
+        """
+        Age every counter to now (called with the lock held).
+        """
+        now = time.monotonic()
+        if self.half_life <= 0 or now == self._decayed_at:
+            return
+        factor = 0.5 ** ((now - self._decayed_at) / self.half_life)
+        for name in self._searches:
+            self._searches[name] *= factor
+            self._useful[name] *= factor
+        self._decayed_at = now
+
+    def expected_yield(self, name: str) -> float:
+        return (self._useful[name] + PRIOR_YIELD * PRIOR_SEARCHES) / (self._searches[name] + PRIOR_SEARCHES)
+
+    def ranking(self) -> List[str]:
+        """
+        Template names, best expected yield first.
+        """
+        with self._lock:
+            self._decay()
+            # rounded, so workers with near-identical counters agree on order
+            return [
+                name for _, _, name in sorted(
+                    (-round(self.expected_yield(name), 2), i, name)
+                    for i, (name, _) in enumerate(self.templates)
+                )
+            ]
+
+    def plan(self, base: str, budget: Optional[int] = None, exclude: Iterable[str] = ()) -> List[Tuple[str, str]]:
+        """
+        Queries for one reflection pass.
+
+        Args:
+            base: Claim the templates are applied to
+            budget: Searches left for the run (None: unlimited)
+            exclude: Template names already used for this claim
+
+        Returns:
+            [(template_name, query), ...] at most min(QUERIES_PER_PASS, budget)
+        """
+        k = QUERIES_PER_PASS if budget is None else max(0, min(QUERIES_PER_PASS, budget))
+        skip = set(exclude)
+        names = [name for name in self.ranking() if name not in skip][:k]
+        return [(name, self._formats[name].format(base=base)) for name in names]
+
+    def record(self, name: str, searches: int, useful: int):
+        """
+        Credit a template with the searches it cost and the useful new
+        sources it found.
+        """
+        if name not in self._searches:
+            return
+        with self._lock:
+            self._decay()
+            self._searches[name] += searches
+            self._useful[name] += useful
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            self._decay()
+            return {
+                name: {
+                    "searches": round(self._searches[name], 2),
+                    "useful_sources": round(self._useful[name], 2),
+                    "expected_yield": round(self.expected_yield(name), 3),
+                }
+                for name, _ in self.templates
+            }
+
+
+# Process-wide planner shared by every agent run
+query_planner = QueryPlanner()
@@ -1,16 +1,86 @@
-from typing import List, Optional
-from pydantic import BaseModel
+import operator
+import os
+import sys
+from typing import Annotated, Dict, List, Optional, TypedDict
 
-class AgentState(BaseModel):
+# ----- Make project root importable for the shared infra.search package -----
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from infra.search.results import Evidence
+from infra.search.cost_ledger import CostLedger
+
+
+def merge_sources(existing: List[Evidence], new: List[Evidence]) -> List[Evidence]:
+    """
+    Reducer for `sources`: append new evidence; a record with the same
+    link/title replaces the earlier one (e.g. its scored version).
+    """
+    if not new:
+        return existing or []
+    merged = list(existing or [])
+    index = {(ev.link or ev.title): i for i, ev in enumerate(merged)}
+    for ev in new:
+        key = ev.link or ev.title
+        i = index.get(key)
+        if i is None:
+            index[key] = len(merged)
+            merged.append(ev)
+        else:
+            merged[i] = ev
+    return merged
+
+
+class AgentState(TypedDict, total=False):
+    """
+    Graph state. Nodes return only the keys they change; `reasoning` and
+    `sources` are append-only channels merged by their reducers, so node
+    transitions don't revalidate or copy the whole state.
+    """
     text: str
-    claim: Optional[str] = None
-    queries: Optional[List[str]] = None
-    sources: Optional[List[dict]] = None
-    verdict: Optional[str] = None
-    confidence: Optional[float] = None
-    reasoning: Optional[List[str]] = []
+    claim: Optional[str]
+    queries: Optional[List[str]]
+    sources: Annotated[List[Evidence], merge_sources]
+    verdict: Optional[str]
+    confidence: Optional[float]
+    reasoning: Annotated[List[str], operator.add]
     # reflection / loop control
-    attempts: int = 0
-    max_attempts: int = 3
-    confidence_target: float = 0.60
-    last_action: Optional[str] = None
+    attempts: int
+    max_attempts: int
+    confidence_target: float
+    last_action: Optional[str]
+    # reflection query planning: template behind each query of the current
+    # pass, template behind each source it found, templates whose query
+    # came back with results, templates used so far
+    query_templates: Optional[Dict[str, str]]
+    source_templates: Optional[Dict[str, str]]
+    answered_templates: Optional[List[str]]
+    templates_tried: List[str]
+    # per-run budgets (None = unlimited); deadline is a time.monotonic() timestamp
+    max_searches: Optional[int]
+    searches_used: int
+    deadline: Optional[float]
+    budget_exhausted: Optional[str]
+    # upstream calls (MCP round trips) charged to this run, shared by every node
+    cost_ledger: Optional[CostLedger]
+
+
+STATE_DEFAULTS = {
+    "attempts": 0,
+    "max_attempts": 3,
+    "confidence_target": 0.60,
+    "max_searches": None,
+    "searches_used": 0,
+    "deadline": None,
+}
+
+
+def new_agent_state(text: str, **overrides) -> AgentState:
+    """
+    Initial graph input with defaults filled in.
+    """
+    state = dict(STATE_DEFAULTS)
+    state.update(overrides)
+    state["text"] = text
+    return state
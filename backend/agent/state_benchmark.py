@@ -0,0 +1,143 @@
+"""
+Graph state overhead benchmark.
+
+Per-node cost of LangGraph transitions with the previous pydantic
+AgentState (nodes mutate and return the whole model) versus the
+TypedDict state with reducer channels (nodes return partial updates).
+Node bodies only append one reasoning line and a few sources, so the
+numbers are graph/state overhead, not search or scoring work.
+
+Usage (from backend/):
+    python -m agent.state_benchmark [runs] [passes]
+"""
+
+import sys
+import time
+from typing import List, Optional
+
+from langgraph.graph import StateGraph, END
+from pydantic import BaseModel, ConfigDict
+
+from agent.state import AgentState, new_agent_state
+from infra.search.results import Evidence
+
+
+SOURCES_PER_PASS = 5
+
+
+class LegacyAgentState(BaseModel):
+    """
+    The previous AgentState definition.
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    text: str
+    claim: Optional[str] = None
+    queries: Optional[List[str]] = None
+    sources: Optional[List[Evidence]] = None
+    verdict: Optional[str] = None
+    confidence: Optional[float] = None
+    reasoning: Optional[List[str]] = []
+    attempts: int = 0
+    max_attempts: int = 3
+    confidence_target: float = 0.60
+    last_action: Optional[str] = None
+    max_searches: Optional[int] = None
+    searches_used: int = 0
+    deadline: Optional[float] = None
+    budget_exhausted: Optional[str] = None
+
+
+def _evidence(pass_no: int) -> List[Evidence]:
+    return [
+        Evidence(f"title {pass_no}-{i}", f"https://example.org/{pass_no}/{i}", "snippet " * 20, score=0.5)
+        for i in range(SOURCES_PER_PASS)
+    ]
+
+
+def build_legacy_graph(passes: int):
+    def step(state):
+        state.reasoning.append("step")
+        return state
+
+    def search(state):
+        state.sources = (state.sources or []) + _evidence(state.attempts)
+        state.reasoning.append("search")
+        return state
+
+    def check(state):
+        state.last_action = "reflect" if state.attempts < passes - 1 else "finish"
+        return state
+
+    def reflect(state):
+        state.attempts += 1
+        return state
+
+    return _wire(LegacyAgentState, step, search, check, reflect,
+                 lambda s: "reflect" if s.last_action == "reflect" else "finish")
+
+
+def build_typed_graph(passes: int):
+    def step(state):
+        return {"reasoning": ["step"]}
+
+    def search(state):
+        return {"sources": _evidence(state.get("attempts", 0)), "reasoning": ["search"]}
+
+    def check(state):
+        return {"last_action": "reflect" if state.get("attempts", 0) < passes - 1 else "finish"}
+
+    def reflect(state):
+        return {"attempts": state.get("attempts", 0) + 1}
+
+    return _wire(AgentState, step, search, check, reflect,
+                 lambda s: "reflect" if s.get("last_action") == "reflect" else "finish")
+
+
+def _wire(schema, step, search, check, reflect, route):
+    graph = StateGraph(schema)
+    for name in ("extract_claim", "generate_queries", "score_evidence", "determine_verdict"):
+        graph.add_node(name, step)
+    graph.add_node("search", search)
+    graph.add_node("check_reflect", check)
+    graph.add_node("reflect", reflect)
+    graph.set_entry_point("extract_claim")
+    graph.add_edge("extract_claim", "generate_queries")
+    graph.add_edge("generate_queries", "search")
+    graph.add_edge("search", "score_evidence")
+    graph.add_edge("score_evidence", "determine_verdict")
+    graph.add_edge("determine_verdict", "check_reflect")
+    graph.add_conditional_edges("check_reflect", route, {"reflect": "reflect", "finish": END})
+    graph.add_edge("reflect", "search")
+    return graph.compile()
+
+
+def us_per_node(graph, make_input, runs: int, passes: int) -> float:
+    # 2 entry nodes + 4 nodes per pass + reflect between passes
+    nodes_per_run = 2 + 4 * passes + (passes - 1)
+    graph.invoke(make_input(), {"recursion_limit": 1000})
+    start = time.perf_counter()
+    for _ in range(runs):
+        graph.invoke(make_input(), {"recursion_limit": 1000})
+    return (time.perf_counter() - start) / (runs * nodes_per_run) * 1e6
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    passes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    text = "Drinking bleach cures coronavirus"
+
+    legacy_us = us_per_node(build_legacy_graph(passes), lambda: LegacyAgentState(text=text, reasoning=[]), runs, passes)
+    typed_us = us_per_node(build_typed_graph(passes), lambda: new_agent_state(text), runs, passes)
+
+    print("=" * 80)
+    print("AGENT STATE BENCHMARK")
+    print("=" * 80)
+    print(f"Runs: {runs}, reflection passes per run: {passes}, sources per pass: {SOURCES_PER_PASS}")
+    print(f"Pydantic state (full state per node):   {legacy_us:8.1f} us/node")
+    print(f"TypedDict state (partial updates):      {typed_us:8.1f} us/node")
+    print(f"Speedup:                                {legacy_us / typed_us:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, IdentityResponder
+
+try:
+    import brotli
+except ImportError:  # listed in requirements.txt; without it, clients asking for br get gzip
+    brotli = None
+
+# Brotli quality for dynamic responses; 11 is far too slow per request
+BROTLI_QUALITY = 4
+
+
+def _accepted_encodings(header: str) -> set:
+    """
+    Codings from Accept-Encoding, excluding those with q=0.
+    """
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if coding and params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding)
+    return accepted
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app, minimum_size: int, quality: int = BROTLI_QUALITY, **kwargs):
+        super().__init__(app, minimum_size, **kwargs)
+        self.quality = quality
+        self._compressor = None
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if self._compressor is None:
+            self._compressor = brotli.Compressor(quality=self.quality)
+        if more_body:
+            # flush each chunk so streamed NDJSON lines reach the client
+            return self._compressor.process(body) + self._compressor.flush()
+        return self._compressor.process(body) + self._compressor.finish()
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    Negotiated response compression: brotli when the client accepts it
+    and the brotli package is installed, gzip otherwise. Responses under
+    minimum_size are sent as-is.
+    """
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and brotli is not None:
+            accepted = _accepted_encodings(Headers(scope=scope).get("Accept-Encoding", ""))
+            if "br" in accepted:
+                responder = BrotliResponder(
+                    self.app, self.minimum_size, exclude_content_types=self.exclude_content_types
+                )
+                await responder(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
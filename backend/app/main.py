@@ -1,9 +1,33 @@
 import logging
+import os
+import sys
 
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.routers.verify import router as verify_router
+# ----- Make project root importable for the shared infra.search package -----
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from infra.mcp.responses import FastJSONResponse
+from infra.search.evidence_index import get_evidence_index
+from infra.search.factcheck_index import get_factcheck_index
+from app.compression import CompressionMiddleware
+from app.routers.verify import router as verify_router, prewarm_claim
+from app.routers.agent import router as agent_router
+from app.routers.admin import router as admin_router
+from app.services.prewarm import (
+    prewarm_worker,
+    load_seed_claims,
+    save_replay_log,
+    PREWARM_SEED_FILE,
+    PREWARM_REPLAY_LOG,
+    PREWARM_ON_STARTUP,
+)
+from agent.mcp_client import aclose_mcp_client
+from tools.verdict_cache import recent_claims
 
 logging.basicConfig(
     level=logging.INFO,
@@ -11,7 +35,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger("misinfo_guardian")
 
-app = FastAPI(title="Misinformation Guardian Backend")
+app = FastAPI(title="Misinformation Guardian Backend", default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,6 +45,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip/brotli by Accept-Encoding; badge-sized compact responses stay uncompressed
+app.add_middleware(CompressionMiddleware, minimum_size=500, compresslevel=6)
+
 @app.get("/api/health")
 def health_check():
     logger.info("Health check ping received")
@@ -31,3 +58,32 @@ def health_check():
     }
 
 app.include_router(verify_router, prefix="/api")
+app.include_router(agent_router, prefix="/api")
+app.include_router(admin_router, prefix="/api")
+
+
+@app.on_event("startup")
+async def startup_event():
+    # load the evidence and fact-check indexes now rather than inside the
+    # first request
+    await run_in_threadpool(get_evidence_index)
+    await run_in_threadpool(get_factcheck_index)
+    # warm the caches for the claims seen before the last restart, plus any
+    # seed list, before the first wave of traffic asks for them
+    if PREWARM_ON_STARTUP:
+        claims = load_seed_claims(PREWARM_REPLAY_LOG) + load_seed_claims(PREWARM_SEED_FILE)
+        if claims:
+            prewarm_worker.start(claims, prewarm_claim, source="startup")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    prewarm_worker.cancel()
+    if PREWARM_REPLAY_LOG:
+        try:
+            # recent claims first, then the ones carried over from earlier runs
+            count = save_replay_log(PREWARM_REPLAY_LOG, recent_claims() + load_seed_claims(PREWARM_REPLAY_LOG))
+            logger.info(f"Saved {count} recent claims to {PREWARM_REPLAY_LOG}")
+        except OSError as e:
+            logger.warning(f"Could not save prewarm replay log: {e}")
+    await aclose_mcp_client()
@@ -0,0 +1,153 @@
+import os
+import sys
+
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+# ----- Make project root importable for the shared infra.search package -----
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from infra.search.adaptive_timeout import adaptive_timeouts
+from infra.search.evidence_index import get_evidence_index
+from infra.search.negative_cache import negative_cache
+from infra.search.cost_ledger import cost_meter
+from app.services.cancellation import cancellations
+from app.services.prewarm import (
+    prewarm_worker,
+    load_seed_claims,
+    PREWARM_SEED_FILE,
+    PREWARM_REPLAY_LOG,
+    PREWARM_MAX_CLAIMS,
+)
+from app.routers.verify import early_stop_stats, prewarm_claim
+from agent.query_planner import query_planner
+from tools.verdict_cache import trending, trending_claims, recent_claims, verdict_cache_stats
+
+router = APIRouter()
+
+
+class PrewarmRequest(BaseModel):
+    # file: PREWARM_SEED_FILE, replay: PREWARM_REPLAY_LOG, recent: claims
+    # requested since startup, trending: the trending sketch, claims: inline
+    source: str = "trending"
+    claims: Optional[List[str]] = None
+    n: int = Field(100, ge=1, le=PREWARM_MAX_CLAIMS)
+
+
+@router.get("/admin/timeouts")
+def get_timeouts():
+    """
+    Current adaptive timeout and latency percentiles per upstream provider
+    (as seen by this backend process; the MCP server reports its own at /timeouts).
+    """
+    return adaptive_timeouts.snapshot()
+
+
+@router.get("/admin/evidence-index")
+def get_evidence_index_stats():
+    """
+    Local evidence index size, query latency and local hit rate.
+    """
+    return get_evidence_index().stats()
+
+
+@router.get("/admin/negative-cache")
+def get_negative_cache_stats():
+    """
+    Queries currently skipped per provider because they recently came back
+    empty or failed, and totals since startup.
+    """
+    return negative_cache.stats()
+
+
+@router.get("/admin/cancellations")
+def get_cancellation_stats():
+    """
+    Requests in flight by client id, and how many were cancelled
+    (explicitly or by client disconnect).
+    """
+    return cancellations.stats()
+
+
+@router.get("/admin/early-stop")
+def get_early_stop_stats():
+    """
+    /verify computations that settled their verdict before running every
+    query, and the upstream searches skipped as a result.
+    """
+    return early_stop_stats()
+
+
+@router.get("/admin/query-planner")
+def get_query_planner_stats():
+    """
+    Reflection query templates in planning order, with the searches each
+    has cost and the useful new sources it found.
+    """
+    return {"ranking": query_planner.ranking(), "templates": query_planner.stats()}
+
+
+@router.get("/admin/trending")
+def get_trending(n: int = Query(20, ge=1, le=500)):
+    """
+    Top-n claims by recent request volume (time-decayed Space-Saving
+    sketch). Pinned claims are exempt from verdict cache eviction and
+    refreshed ahead of expiry.
+    """
+    return {"claims": trending(n), "verdict_cache": verdict_cache_stats()}
+
+
+@router.get("/admin/costs")
+def get_cost_stats():
+    """
+    Upstream calls (Serper, DuckDuckGo, MCP round trips) in the last minute
+    and since startup, calls refused by the per-request and per-minute
+    budgets, and per-request cost by endpoint (mean, p95, max).
+    """
+    return cost_meter.stats()
+
+
+@router.post("/admin/prewarm")
+def start_prewarm(payload: PrewarmRequest):
+    """
+    Start a background job that fills the search and verdict caches for
+    seed claims at a low rate and batch search priority. 409 if a job is
+    already running; progress at GET /admin/prewarm.
+    """
+    if payload.source == "file":
+        claims = load_seed_claims(PREWARM_SEED_FILE, limit=payload.n)
+    elif payload.source == "replay":
+        claims = load_seed_claims(PREWARM_REPLAY_LOG, limit=payload.n)
+    elif payload.source == "recent":
+        claims = recent_claims()[:payload.n]
+    elif payload.source == "trending":
+        claims = [entry["label"] or entry["item"] for entry in trending_claims.top(payload.n)]
+    elif payload.source == "claims":
+        claims = (payload.claims or [])[:payload.n]
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown prewarm source: {payload.source}")
+
+    if not prewarm_worker.start(claims, prewarm_claim, source=payload.source):
+        raise HTTPException(status_code=409, detail="A prewarm job is already running")
+    return prewarm_worker.status()
+
+
+@router.get("/admin/prewarm")
+def get_prewarm_status():
+    """
+    Progress of the current (or last) prewarm job: claims done, outcome
+    counts, and estimated time left.
+    """
+    return prewarm_worker.status()
+
+
+@router.post("/admin/prewarm/cancel")
+def cancel_prewarm():
+    """
+    Stop the running prewarm job after the claim in progress.
+    """
+    return {"cancelled": prewarm_worker.cancel()}
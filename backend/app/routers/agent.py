@@ -0,0 +1,106 @@
+import asyncio
+import logging
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from agent.state import new_agent_state
+from app.services.agent_runner import get_agent, agent_response
+from app.services.agent_service import extract_claim
+from app.services.cancellation import cancellations, cancel_on_disconnect
+from infra.mcp.responses import FastJSONResponse
+from tools.verdict_cache import normalize_claim_key, record_claim_request
+from infra.search.serialization import dumps
+from infra.search.cost_ledger import CostLedger, cost_meter
+
+logger = logging.getLogger("misinfo_guardian")
+
+router = APIRouter()
+
+class AgentRequest(BaseModel):
+    id: str | None = None
+    text: str
+
+
+def _record_trending(text: str):
+    claim = extract_claim(text)
+    record_claim_request(normalize_claim_key(claim), claim)
+
+
+@router.post("/agent/run", response_class=FastJSONResponse)
+async def run_agent(payload: AgentRequest, request: Request, debug: bool = False):
+    """
+    debug=1 adds the run's upstream cost (MCP round trips).
+    """
+    _record_trending(payload.text)
+    token = cancellations.register(payload.id)
+    ledger = CostLedger()
+    run = asyncio.ensure_future(get_agent().ainvoke(new_agent_state(payload.text, cost_ledger=ledger)))
+    try:
+        async with cancel_on_disconnect(request, token, run):
+            result = await run
+        response = agent_response(result)
+        if debug:
+            response["cost"] = ledger.summary()
+        return FastJSONResponse(response)
+    except asyncio.CancelledError:
+        if not token.cancelled:
+            raise
+        logger.info(f"Agent run cancelled ({token.reason})")
+        return {
+            "verdict": "unverified",
+            "confidence": 0.10,
+            "claim": payload.text,
+            "search_queries": [],
+            "top_sources": [],
+            "attempts": 0,
+            "reasoning": ["Request cancelled — agent stopped."]
+        }
+    except Exception as e:
+        logger.error(f"Agent error: {str(e)}")
+        return {
+            "verdict": "unverified",
+            "confidence": 0.10,
+            "claim": payload.text,
+            "search_queries": [],
+            "top_sources": [],
+            "attempts": 0,
+            "reasoning": ["Internal error — safe fallback applied."]
+        }
+    finally:
+        if not run.done():
+            run.cancel()
+        cancellations.unregister(payload.id, token)
+        cost_meter.record_request("agent", ledger)
+
+
+@router.post("/agent/stream")
+async def stream_agent(payload: AgentRequest):
+    """
+    Streams one NDJSON line per finished graph node.
+    """
+    _record_trending(payload.text)
+    ledger = CostLedger()
+
+    async def events():
+        latest = {}
+        try:
+            async for update in get_agent().astream(new_agent_state(payload.text, cost_ledger=ledger)):
+                for node, state in update.items():
+                    # updates are partial: only the keys this node changed
+                    state = state or {}
+                    latest.update((k, state[k]) for k in ("verdict", "confidence") if k in state)
+                    yield dumps({
+                        "node": node,
+                        "verdict": latest.get("verdict"),
+                        "confidence": latest.get("confidence"),
+                        "reasoning": (state.get("reasoning") or [])[-1:],
+                    }) + b"\n"
+        except Exception as e:
+            logger.error(f"Agent stream error: {str(e)}")
+            yield dumps({"node": "error", "reasoning": ["Internal error — stream aborted."]}) + b"\n"
+        finally:
+            cost_meter.record_request("agent_stream", ledger)
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
@@ -1,7 +1,13 @@
+import asyncio
 import logging
+import os
+import threading
+import time
+from typing import List, Optional
 
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field
 
 from app.services.agent_service import (
     extract_claim,
@@ -9,64 +15,504 @@ from app.services.agent_service import (
     score_sources,
     determine_verdict
 )
-from tools.search_manager import cached_search
+from app.services.agent_runner import get_agent, agent_response
+from app.services.admission import verify_admission
+from app.services.cancellation import cancellations, cancel_on_disconnect, RequestCancelled
+from agent.state import new_agent_state
+from tools.search_manager import cached_search, is_cached
+from tools.verdict_cache import (
+    get_verdict,
+    get_similar_verdict,
+    put_verdict,
+    refresh_in_background,
+    normalize_claim_key,
+    claim_hash,
+    get_verdict_by_hash,
+    has_fresh_verdict,
+    record_claim_request
+)
+from infra.mcp.responses import FastJSONResponse
+from infra.search.factcheck_index import match_factcheck
+from infra.search.check_worthiness import check_worthiness, CHECK_WORTHY_THRESHOLD
+from infra.search.claim_extractor import is_valid_claim
+from infra.search.rate_limiter import PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from infra.search.cost_ledger import CostLedger, cost_meter
 
 logger = logging.getLogger("misinfo_guardian")
 
 router = APIRouter()
 
+# /verify keeps at most this many unique sources and needs only these fields
+MAX_SOURCES = 5
+SOURCE_FIELDS = ("title", "link", "snippet")
+
+# Stop issuing queries once the verdict can no longer change for the worse:
+# "accurate" (more sources only raise the max score) or MAX_SOURCES unique
+# sources (later results would be cut anyway)
+EARLY_STOP = os.getenv("VERIFY_EARLY_STOP", "1") != "0"
+
+_early_stop_lock = threading.Lock()
+_early_stop_stats = {"computed": 0, "stopped_early": 0, "queries_skipped": 0, "upstream_calls_saved": 0}
+
+# compact=1: just enough to render a badge; full detail via /verify/claim/{claim_hash}
+COMPACT_FIELDS = ("verdict", "confidence", "claim_hash", "links")
+
 class VerifyRequest(BaseModel):
     id: str | None = None
     text: str
 
-@router.post("/verify")
-def verify(payload: VerifyRequest):
+
+class AgentVerifyRequest(VerifyRequest):
+    # per-request budgets for the deep (agent) path
+    max_searches: int = Field(12, ge=1, le=60)
+    max_attempts: int = Field(2, ge=0, le=5)
+    deadline_ms: int = Field(8000, ge=500, le=60000)
+
+
+# Response schemas: documented in OpenAPI only. Handlers return
+# FastJSONResponse directly, so responses are not re-validated or
+# walked by jsonable_encoder on the hot path.
+class SourceOut(BaseModel):
+    title: str = ""
+    link: str = ""
+    snippet: str = ""
+    score: Optional[float] = None
+
+
+class CostOut(BaseModel):
+    calls: dict
+    total: int
+    free: dict
+    denied: int
+    max_calls: Optional[int] = None
+    exhausted: Optional[str] = None
+    elapsed_ms: float
+
+
+class VerifyResponse(BaseModel):
+    verdict: str
+    confidence: float
+    claim: Optional[str] = None
+    claim_hash: Optional[str] = None
+    search_queries: List[str] = []
+    top_sources: List[SourceOut] = []
+    reasoning: List[str] = []
+    searches_saved: Optional[int] = None
+    cost: Optional[CostOut] = None  # debug=1 only
+
+
+class BudgetOut(BaseModel):
+    exhausted: Optional[str] = None
+    searches_used: Optional[int] = None
+    max_searches: int
+    attempts: Optional[int] = None
+    max_attempts: int
+    deadline_ms: int
+
+
+class AgentVerifyResponse(VerifyResponse):
+    mode: str
+    attempts: Optional[int] = None
+    budget: Optional[BudgetOut] = None  # None when the pre-filter answered
+
+
+def compute_verdict(claim: str, refresh: bool = False, cancel=None, priority: str = PRIORITY_INTERACTIVE,
+                    ledger: Optional[CostLedger] = None) -> dict:
+    """
+    Full fast-path pipeline for an extracted claim: search, score, verdict.
+    Sources are scored as each query completes; remaining queries are
+    skipped once the verdict is settled (see EARLY_STOP) or the request's
+    cost budget is used up (see CostLedger).
+    Raises RequestCancelled if `cancel` is cancelled between upstream calls.
+    """
+    queries = generate_queries(claim)
+    claim_tokens = claim.split()[:8]
+
+    seen = set()
+    unique_sources = []
+    scored = []
+    verdict, confidence = determine_verdict(scored)
+    run = 0
+    for q in queries:
+        results = cached_search(q, refresh=refresh, top_k=MAX_SOURCES, fields=SOURCE_FIELDS,
+                                priority=priority, cancel=cancel, ledger=ledger)
+        run += 1
+        new_sources = []
+        for src in results:
+            key = src.link or src.title
+            if key not in seen and len(unique_sources) + len(new_sources) < MAX_SOURCES:  # speed limit
+                seen.add(key)
+                new_sources.append(src)
+        unique_sources.extend(new_sources)
+        scored.extend(score_sources(new_sources, claim_tokens))
+        verdict, confidence = determine_verdict(scored)
+        if EARLY_STOP and (verdict == "accurate" or len(unique_sources) >= MAX_SOURCES):
+            break
+        if ledger is not None and ledger.exhausted:
+            break
+
+    skipped = queries[run:]
+    saved = len(skipped) if refresh else sum(1 for q in skipped if not is_cached(q, top_k=MAX_SOURCES, fields=SOURCE_FIELDS))
+    over_budget = ledger is not None and ledger.exhausted
+    with _early_stop_lock:
+        _early_stop_stats["computed"] += 1
+        if skipped and not over_budget:
+            _early_stop_stats["stopped_early"] += 1
+            _early_stop_stats["queries_skipped"] += len(skipped)
+            _early_stop_stats["upstream_calls_saved"] += saved
+
+    reasoning = [
+        "Claim extracted",
+        "Queries generated",
+        f"Found {len(scored)} evidence sources",
+        f"Max score {max((s.score for s in scored), default=0):.2f}",
+        f"Final verdict: {verdict}"
+    ]
+    if over_budget:
+        reasoning.insert(3, f"Upstream cost budget exhausted ({ledger.exhausted}) after {run} of {len(queries)} queries")
+    elif skipped:
+        reasoning.insert(3, f"Verdict settled after {run} of {len(queries)} queries; {saved} upstream searches saved")
+
+    return {
+        "verdict": verdict,
+        "confidence": float(confidence),
+        "claim": claim,
+        "search_queries": queries[:run],
+        "top_sources": [s.to_dict() for s in scored[:3]],
+        "reasoning": reasoning,
+        "searches_saved": saved,
+    }
+
+
+def early_stop_stats() -> dict:
+    """
+    Fast-path computations, how many settled before running every query,
+    and the upstream searches that saved.
+    """
+    with _early_stop_lock:
+        return dict(_early_stop_stats)
+
+
+def shape_response(result: dict, fields) -> dict:
+    """
+    Keep only the requested top-level fields. "links" is the list of
+    top_sources links, without titles or snippets.
+    """
+    shaped = {}
+    for name in fields:
+        if name == "links":
+            shaped["links"] = [s.get("link") for s in result.get("top_sources") or [] if s.get("link")]
+        elif name in result:
+            shaped[name] = result[name]
+    return shaped
+
+
+@router.post("/verify", response_class=FastJSONResponse, responses={200: {"model": VerifyResponse}})
+async def verify(payload: VerifyRequest, request: Request, fields: Optional[str] = None, compact: bool = False,
+                 debug: bool = False):
+    """
+    fields=verdict,confidence,... returns only those fields;
+    compact=1 is shorthand for verdict, confidence, claim_hash and links;
+    debug=1 adds the request's upstream cost (calls per provider).
+
+    Cached and near-duplicate verdicts are answered on the event loop.
+    Misses go through admission control; when overloaded the request is
+    shed with the safe fallback instead of queueing until it times out.
+    Searching stops early when the client disconnects or cancels by id
+    (POST /verify/cancel/{id}).
+    """
     try:
         claim = extract_claim(payload.text)
-        queries = generate_queries(claim)
-
-        all_sources = []
-        for q in queries:
-            results = cached_search(q)
-            all_sources.extend(results)
-
-        seen = set()
-        unique_sources = []
-        for src in all_sources:
-            key = src.get("link") or src.get("title")
-            if key not in seen:
-                seen.add(key)
-                unique_sources.append(src)
+        key = normalize_claim_key(claim)
+        result = lookup_verdict(claim, key)
+        if result is None or result["verdict"] != "not_a_claim":
+            record_claim_request(key, claim)
+    except Exception as e:
+        logger.error(f"Verification error: {str(e)}")
+        result = _fallback(payload.text)
 
-        unique_sources = unique_sources[:5]  # speed limit
+    ledger = CostLedger()
+    if result is None:
+        if await verify_admission.acquire():
+            token = cancellations.register(payload.id)
+            try:
+                async with cancel_on_disconnect(request, token):
+                    result = await run_in_threadpool(_compute_or_fallback, payload.text, claim, key, token, ledger)
+            finally:
+                cancellations.unregister(payload.id, token)
+                verify_admission.release()
+        else:
+            logger.warning("Verify overloaded; shedding request")
+            result = _fallback(payload.text, "Server busy — safe fallback applied.")
+    cost_meter.record_request("verify", ledger)
 
-        claim_tokens = claim.split()[:8]
-        scored = score_sources(unique_sources, claim_tokens)
+    if compact:
+        result = shape_response(result, COMPACT_FIELDS)
+    elif fields:
+        result = shape_response(result, [f.strip() for f in fields.split(",") if f.strip()])
+    if debug:
+        result = {**result, "cost": ledger.summary()}
+    return FastJSONResponse(result)
 
-        verdict, confidence = determine_verdict(scored)
 
-        return {
-            "verdict": verdict,
-            "confidence": float(confidence),
-            "claim": claim,
-            "search_queries": queries,
-            "top_sources": scored[:3],
-            "reasoning": [
-                "Claim extracted",
-                "Queries generated",
-                f"Found {len(scored)} evidence sources",
-                f"Max score {max((s['score'] for s in scored), default=0):.2f}",
-                f"Final verdict: {verdict}"
-            ]
-        }
+@router.post("/verify/cancel/{request_id}")
+def cancel_verify(request_id: str):
+    """
+    Cancel an in-flight /verify or /verify/agent call sent with this `id`.
+    Its remaining upstream searches and agent passes are skipped.
+    """
+    return {"cancelled": cancellations.cancel(request_id)}
+
 
+@router.get("/verify/claim/{claim_id}", response_class=FastJSONResponse, responses={200: {"model": VerifyResponse}})
+def verify_detail(claim_id: str):
+    """
+    Full cached verdict (sources, queries, reasoning) for a claim_hash
+    returned by an earlier /verify call.
+    """
+    result = get_verdict_by_hash(claim_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired claim_hash")
+    return FastJSONResponse({**result, "claim_hash": claim_id})
+
+
+def run_verify(payload: VerifyRequest, ledger: Optional[CostLedger] = None) -> dict:
+    """
+    Fast-path verification: verdict cache, near-duplicate lookup, then compute.
+    """
+    try:
+        claim = extract_claim(payload.text)
+        key = normalize_claim_key(claim)
+        result = lookup_verdict(claim, key)
+        if result is not None:
+            return result
     except Exception as e:
         logger.error(f"Verification error: {str(e)}")
-        return {
-            "verdict": "unverified",
-            "confidence": 0.10,
-            "claim": payload.text,
-            "search_queries": [],
-            "top_sources": [],
-            "reasoning": ["Internal error — safe fallback applied."]
-        }
+        return _fallback(payload.text)
+    return _compute_or_fallback(payload.text, claim, key, ledger=ledger)
+
+
+def lookup_verdict(claim: str, key: str):
+    """
+    Cached, fact-checked, "not a claim" or near-duplicate verdict for a
+    claim, or None. No upstream calls. The fact-check index is consulted
+    before the pre-filter, so known misinformation phrased as reported
+    speech or a short sentence still gets its verdict.
+    """
+    too_short = _too_short(claim)
+    if too_short is not None:
+        return too_short
+
+    cached, state = get_verdict(key)
+    if cached is not None:
+        if state in ("stale", "expiring"):
+            refresh_in_background(key, lambda: _cacheable(compute_verdict(claim, refresh=True)))
+        return {**cached, "claim_hash": claim_hash(key)}
+
+    factcheck = match_factcheck(claim)
+    if factcheck is not None:
+        result = _factcheck_result(claim, factcheck)
+        put_verdict(key, result, claim=claim)
+        return {**result, "claim_hash": claim_hash(key)}
+
+    not_a_claim = _not_a_claim(claim)
+    if not_a_claim is not None:
+        return not_a_claim
+
+    similar, matched_key = get_similar_verdict(claim)
+    if similar is not None:
+        return {**similar, "claim": claim, "claim_hash": claim_hash(matched_key)}
+    return None
+
+
+def _too_short(claim: str):
+    """
+    Immediate "not a claim" result for empty or too-short claims (a tweet
+    of only URLs, mentions or punctuation normalizes to ""), or None.
+    Checked before the cache, the fact-check index and the pre-filter.
+    """
+    if is_valid_claim(claim):
+        return None
+    return {
+        "verdict": "not_a_claim",
+        "confidence": 1.0,
+        "claim": claim,
+        "search_queries": [],
+        "top_sources": [],
+        "reasoning": ["Empty or too short to be a factual claim; no search performed."],
+    }
+
+
+def _not_a_claim(claim: str):
+    """
+    Immediate result for opinions, jokes and greetings (check-worthiness
+    below threshold), or None if the claim is worth searching.
+    """
+    worthiness = check_worthiness(claim)
+    if worthiness >= CHECK_WORTHY_THRESHOLD:
+        return None
+    return {
+        "verdict": "not_a_claim",
+        "confidence": round(1.0 - worthiness, 2),
+        "claim": claim,
+        "search_queries": [],
+        "top_sources": [],
+        "reasoning": [f"Not a check-worthy factual claim (score {worthiness:.2f}); no search performed."],
+    }
+
+
+def _factcheck_result(claim: str, factcheck: dict) -> dict:
+    """
+    Verdict straight from a published fact-check (no web search).
+    """
+    publisher = factcheck.get("publisher") or "fact-checker"
+    return {
+        "verdict": factcheck["verdict"],
+        "confidence": 0.95 if factcheck["verdict"] != "unverified" else 0.50,
+        "claim": claim,
+        "search_queries": [],
+        "top_sources": [{
+            "title": f"Fact check by {publisher}: {factcheck.get('rating') or 'rated'}",
+            "link": factcheck.get("url", ""),
+            "snippet": factcheck["claim"],
+        }],
+        "reasoning": [
+            f"Matched fact-check corpus ({publisher}, similarity {factcheck['similarity']:.2f}).",
+            f"Fact-checked claim: \"{factcheck['claim']}\" rated {factcheck.get('rating') or 'unrated'}.",
+        ],
+    }
+
+
+def prewarm_claim(text: str) -> str:
+    """
+    Fill the search and verdict caches for one seed claim ahead of traffic,
+    searching at batch priority. Returns the prewarm outcome: "cached",
+    "not_a_claim", "factcheck", "warmed" or "no_evidence".
+    """
+    claim = extract_claim(text)
+    if _too_short(claim) is not None:
+        return "not_a_claim"
+    key = normalize_claim_key(claim)
+    if has_fresh_verdict(key):
+        return "cached"
+    factcheck = match_factcheck(claim)
+    if factcheck is not None:
+        put_verdict(key, _factcheck_result(claim, factcheck), claim=claim)
+        return "factcheck"
+    if _not_a_claim(claim) is not None:
+        return "not_a_claim"
+    result = _cacheable(compute_verdict(claim, priority=PRIORITY_BATCH))
+    if result is None:
+        return "no_evidence"
+    put_verdict(key, result, claim=claim)
+    return "warmed"
+
+
+def _compute_or_fallback(text: str, claim: str, key: str, cancel=None, ledger=None) -> dict:
+    try:
+        result = compute_verdict(claim, cancel=cancel, ledger=ledger)
+        if _cacheable(result):
+            put_verdict(key, result, claim=claim)
+        return {**result, "claim_hash": claim_hash(key)}
+    except RequestCancelled as e:
+        logger.info(f"Verification cancelled ({e}); remaining searches skipped")
+        return _fallback(text, "Request cancelled — remaining searches skipped.")
+    except Exception as e:
+        logger.error(f"Verification error: {str(e)}")
+        return _fallback(text)
+
+
+def _fallback(text: str, reason: str = "Internal error — safe fallback applied.") -> dict:
+    return {
+        "verdict": "unverified",
+        "confidence": 0.10,
+        "claim": text,
+        "search_queries": [],
+        "top_sources": [],
+        "reasoning": [reason]
+    }
+
+
+def _cacheable(result: dict):
+    """
+    Results without any evidence usually mean every search failed; don't pin those.
+    """
+    return result if result["top_sources"] else None
+
+
+@router.post("/verify/agent", response_class=FastJSONResponse, responses={200: {"model": AgentVerifyResponse}})
+async def verify_agent(payload: AgentVerifyRequest, request: Request, debug: bool = False):
+    """
+    Deep verification through the LangGraph agent, within per-request budgets.
+    Falls back to the fast /verify path when a budget runs out before the
+    agent reaches its confidence target. A client disconnect or cancel by
+    id stops the agent and skips the fast path. The agent run and the
+    fast path share one upstream cost budget; debug=1 reports its use.
+    """
+    claim = extract_claim(payload.text)
+    # fact-checked claims go to the agent even if the pre-filter scores them low
+    not_a_claim = _too_short(claim)
+    if not_a_claim is None and match_factcheck(claim) is None:
+        not_a_claim = _not_a_claim(claim)
+    if not_a_claim is not None:
+        return FastJSONResponse({**not_a_claim, "mode": "prefilter", "budget": None})
+    record_claim_request(normalize_claim_key(claim), claim)
+
+    deadline_s = payload.deadline_ms / 1000.0
+    ledger = CostLedger()
+    state = new_agent_state(
+        payload.text,
+        max_attempts=payload.max_attempts,
+        max_searches=payload.max_searches,
+        deadline=time.monotonic() + deadline_s,
+        cost_ledger=ledger,
+    )
+
+    result = None
+    exhausted = None
+    token = cancellations.register(payload.id)
+    # a task, so a disconnect or cancel stops the agent mid-pass (in-flight MCP calls included)
+    run = asyncio.ensure_future(asyncio.wait_for(get_agent().ainvoke(state), timeout=deadline_s))
+    try:
+        async with cancel_on_disconnect(request, token, run):
+            result = await run
+        exhausted = result.get("budget_exhausted")
+    except asyncio.TimeoutError:
+        exhausted = "deadline"
+    except asyncio.CancelledError:
+        if not token.cancelled:
+            raise
+        exhausted = "cancelled"
+    except Exception as e:
+        logger.error(f"Agent verification error: {str(e)}")
+        exhausted = "error"
+    finally:
+        if not run.done():
+            run.cancel()
+        cancellations.unregister(payload.id, token)
+
+    confident = result is not None and (result.get("confidence") or 0.0) >= state["confidence_target"]
+    if result is not None and (not exhausted or confident):
+        response = agent_response(result)
+        response["mode"] = "agent"
+    elif token.cancelled:
+        logger.info(f"Agent verification cancelled ({token.reason})")
+        response = _fallback(payload.text, "Request cancelled — agent stopped.")
+        response["mode"] = "cancelled"
+    else:
+        response = await run_in_threadpool(run_verify, payload, ledger)
+        response["mode"] = "fast_path"
+        response["reasoning"] = [f"Agent budget exhausted ({exhausted}); used fast path."] + response["reasoning"]
+
+    response["budget"] = {
+        "exhausted": exhausted,
+        "searches_used": result.get("searches_used", 0) if result else None,
+        "max_searches": payload.max_searches,
+        "attempts": result.get("attempts", 0) if result else None,
+        "max_attempts": payload.max_attempts,
+        "deadline_ms": payload.deadline_ms,
+    }
+    cost_meter.record_request("verify_agent", ledger)
+    if debug:
+        response["cost"] = ledger.summary()
+    return FastJSONResponse(response)
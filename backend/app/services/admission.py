@@ -0,0 +1,70 @@
+import asyncio
+import os
+
+# Verification calls allowed to run at once, and how many may wait for a slot.
+# Each running call holds a threadpool thread while it waits on upstream HTTP.
+VERIFY_MAX_IN_FLIGHT = int(os.getenv("VERIFY_MAX_IN_FLIGHT", "24"))
+VERIFY_MAX_QUEUE = int(os.getenv("VERIFY_MAX_QUEUE", "48"))
+VERIFY_QUEUE_TIMEOUT_MS = int(os.getenv("VERIFY_QUEUE_TIMEOUT_MS", "400"))
+
+
+class AdmissionController:
+    """
+    Bounded concurrency with a bounded, deadline-limited wait queue.
+
+    acquire() returns False instead of waiting when the queue is full or
+    the wait would exceed queue_timeout; the caller should then shed the
+    request (cached answer or safe fallback) rather than time out.
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int, queue_timeout: float):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+        self._queued = 0
+        self._stats = {"admitted": 0, "queued": 0, "shed_queue_full": 0, "shed_timeout": 0}
+
+    async def acquire(self) -> bool:
+        if not self._slots.locked():
+            # free slot: Semaphore.acquire() returns without suspending
+            await self._slots.acquire()
+        elif self._queued >= self.max_queue:
+            self._stats["shed_queue_full"] += 1
+            return False
+        else:
+            self._queued += 1
+            self._stats["queued"] += 1
+            try:
+                await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+            except asyncio.TimeoutError:
+                self._stats["shed_timeout"] += 1
+                return False
+            finally:
+                self._queued -= 1
+
+        self._in_flight += 1
+        self._stats["admitted"] += 1
+        return True
+
+    def release(self):
+        self._in_flight -= 1
+        self._slots.release()
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": self._in_flight,
+            "waiting": self._queued,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "queue_timeout_ms": int(self.queue_timeout * 1000),
+            **self._stats,
+        }
+
+
+verify_admission = AdmissionController(
+    VERIFY_MAX_IN_FLIGHT,
+    VERIFY_MAX_QUEUE,
+    VERIFY_QUEUE_TIMEOUT_MS / 1000.0,
+)
@@ -0,0 +1,27 @@
+from agent.graph import build_async_agent_graph
+
+# compiled once; the compiled graph is safe to share across concurrent runs
+_agent = None
+
+
+def get_agent():
+    global _agent
+    if _agent is None:
+        _agent = build_async_agent_graph()
+    return _agent
+
+
+def agent_response(result: dict) -> dict:
+    """
+    Shape a final agent state like the /verify response.
+    """
+    sources = sorted(result.get("sources") or [], key=lambda s: s.score or 0, reverse=True)
+    return {
+        "verdict": result.get("verdict") or "unverified",
+        "confidence": float(result.get("confidence") or 0.0),
+        "claim": result.get("claim"),
+        "search_queries": result.get("queries") or [],
+        "top_sources": [s.to_dict() for s in sources[:3]],
+        "attempts": result.get("attempts", 0),
+        "reasoning": result.get("reasoning") or [],
+    }
@@ -1,15 +1,23 @@
+import os
+import sys
+
+# ----- Make project root importable for the shared infra.search package -----
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from infra.search.tweet_normalizer import first_sentence
+from infra.search.results import as_evidence
+
+
 def extract_claim(text: str) -> str:
     """
-    Minimal claim extraction:
-    - Remove URLs
-    - Take first sentence or first line
-    - Strip whitespace
+    Claim extraction via the shared single-pass tweet normalizer:
+    - Remove URLs, mentions and hashtags
+    - Collapse whitespace
+    - Take the first sentence
     """
-    parts = text.split("http")[0]
-    claim = parts.split(".")[0]
-    claim = claim.split("\n")[0]
-    claim = claim.strip()
-    return claim
+    return first_sentence(text)
 
 
 def generate_queries(claim: str):
@@ -27,16 +35,16 @@ def score_sources(sources, claim_tokens):
     """
     Score each source by matching claim tokens against its title/snippet.
     Produces a normalized score 0–1.
+    Returns new Evidence records; the (possibly cached) inputs are not mutated.
     """
     scored = []
-    for s in sources:
-        text = (s.get("title") or "") + " " + (s.get("snippet") or "")
+    for s in as_evidence(sources):
+        text = (s.title + " " + s.snippet).lower()
         score = 0
         for tok in claim_tokens:
-            if tok.lower() in text.lower():
+            if tok.lower() in text:
                 score += 1
-        s["score"] = score / max(1, len(claim_tokens))  # normalize
-        scored.append(s)
+        scored.append(s.with_score(score / max(1, len(claim_tokens))))  # normalize
     return scored
 
 
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+# How often an in-flight request checks whether its client went away (seconds)
+DISCONNECT_POLL_INTERVAL = 0.1
+
+
+class RequestCancelled(Exception):
+    """
+    Raised inside verification work whose request was cancelled.
+    """
+
+
+class CancelToken:
+    """
+    Cancellation flag shared between the request handler, the disconnect
+    watcher and the (possibly threaded) work doing upstream calls.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled"):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self):
+        """
+        Checkpoint: call before each upstream call.
+        """
+        if self._event.is_set():
+            raise RequestCancelled(self.reason)
+
+
+class CancellationRegistry:
+    """
+    In-flight requests by client request id, so a client can cancel
+    explicitly (e.g. when a tweet scrolls out of view).
+    """
+
+    def __init__(self):
+        self._tokens: Dict[str, CancelToken] = {}
+        self._lock = threading.Lock()
+        self._stats = {"cancelled_by_client": 0, "cancelled_on_disconnect": 0}
+
+    def register(self, request_id: Optional[str]) -> CancelToken:
+        token = CancelToken()
+        if request_id:
+            with self._lock:
+                self._tokens[request_id] = token
+        return token
+
+    def unregister(self, request_id: Optional[str], token: CancelToken):
+        if request_id:
+            with self._lock:
+                if self._tokens.get(request_id) is token:
+                    del self._tokens[request_id]
+
+    def cancel(self, request_id: str) -> bool:
+        """
+        Cancel an in-flight request. Returns False if the id is unknown
+        (never sent, or already finished).
+        """
+        with self._lock:
+            token = self._tokens.get(request_id)
+        if token is None or token.cancelled:
+            return False
+        token.cancel("cancelled_by_client")
+        self._stats["cancelled_by_client"] += 1
+        return True
+
+    def record_disconnect(self):
+        self._stats["cancelled_on_disconnect"] += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"in_flight": len(self._tokens), **self._stats}
+
+
+cancellations = CancellationRegistry()
+
+
+@asynccontextmanager
+async def cancel_on_disconnect(request, token: CancelToken, task: Optional[asyncio.Future] = None):
+    """
+    While the block runs, cancel `token` when the client disconnects, and
+    cancel `task` (async work, e.g. an agent run) once `token` is cancelled
+    for any reason. Threaded work must poll the token itself.
+    """
+    async def watch():
+        while not token.cancelled:
+            if request is not None and await request.is_disconnected():
+                token.cancel("client_disconnected")
+                cancellations.record_disconnect()
+                break
+            await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
+        if task is not None:
+            task.cancel()
+
+    watcher = asyncio.create_task(watch())
+    try:
+        yield token
+    finally:
+        watcher.cancel()
@@ -0,0 +1,174 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger("misinfo_guardian")
+
+# Claims warmed per minute. Searches also go out at batch priority, so the
+# scheduler serves live /verify traffic first.
+PREWARM_RATE_PER_MIN = float(os.getenv("PREWARM_RATE_PER_MIN", "30"))
+
+# Seed sources read at startup: a claim list (one claim per line, or JSONL
+# with "text" / "claim" / "claimReviewed") and a replay log of the claims
+# requested before the last shutdown (written at shutdown)
+PREWARM_SEED_FILE = os.getenv("PREWARM_SEED_FILE", "")
+PREWARM_REPLAY_LOG = os.getenv("PREWARM_REPLAY_LOG", "")
+PREWARM_ON_STARTUP = os.getenv("PREWARM_ON_STARTUP", "1") != "0"
+PREWARM_MAX_CLAIMS = int(os.getenv("PREWARM_MAX_CLAIMS", "500"))
+
+# Outcomes a warm() callable reports for one claim
+OUTCOMES = ("warmed", "cached", "factcheck", "not_a_claim", "no_evidence", "failed")
+
+
+def load_seed_claims(path: str, limit: int = PREWARM_MAX_CLAIMS) -> List[str]:
+    """
+    Claims from a seed file or replay log, first occurrence of each kept.
+    Missing files yield an empty list.
+    """
+    claims: List[str] = []
+    if not path or not os.path.exists(path):
+        return claims
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                line = (record.get("text") or record.get("claim") or record.get("claimReviewed") or "").strip()
+                if not line:
+                    continue
+            claims.append(line)
+    return dedupe_claims(claims)[:limit]
+
+
+def save_replay_log(path: str, claims: Iterable[str], limit: int = PREWARM_MAX_CLAIMS) -> int:
+    """
+    Write claims as a JSONL replay log for the next startup. Returns the
+    number written.
+    """
+    claims = dedupe_claims(claims)[:limit]
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for claim in claims:
+            f.write(json.dumps({"claim": claim}, ensure_ascii=False) + "\n")
+    os.replace(tmp_path, path)
+    return len(claims)
+
+
+def dedupe_claims(claims: Iterable[str]) -> List[str]:
+    seen = set()
+    unique = []
+    for claim in claims:
+        key = " ".join(claim.casefold().split())
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(claim)
+    return unique
+
+
+class PrewarmWorker:
+    """
+    Background job that runs seed claims through the fast path, one at a
+    time and at most rate_per_min a minute, so search and verdict caches
+    are filled before live traffic asks for them. One job runs at a time.
+    """
+
+    def __init__(self, rate_per_min: float = PREWARM_RATE_PER_MIN):
+        self.rate_per_min = rate_per_min
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._job: Dict = {"state": "idle"}
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, claims: Iterable[str], warm: Callable[[str], str], source: str = "claims") -> bool:
+        """
+        Start warming `claims` in a daemon thread.
+
+        Args:
+            claims: Seed claims (tweet text or extracted claims)
+            warm: Warms one claim and returns one of OUTCOMES
+            source: Label for status reports (file, replay, trending, ...)
+
+        Returns:
+            False if a job is already running
+        """
+        claims = dedupe_claims(claims)
+        with self._lock:
+            if self.running:
+                return False
+            self._stop.clear()
+            self._job = {
+                "state": "running",
+                "source": source,
+                "total": len(claims),
+                "done": 0,
+                "outcomes": dict.fromkeys(OUTCOMES, 0),
+                "started_at": time.time(),
+                "finished_at": None,
+            }
+            self._thread = threading.Thread(
+                target=self._run, args=(claims, warm), name="cache-prewarm", daemon=True
+            )
+            self._thread.start()
+        logger.info(f"Pre-warming caches with {len(claims)} claims from {source}")
+        return True
+
+    def cancel(self) -> bool:
+        if not self.running:
+            return False
+        self._stop.set()
+        return True
+
+    def _run(self, claims: List[str], warm: Callable[[str], str]):
+        interval = 60.0 / self.rate_per_min if self.rate_per_min > 0 else 0.0
+        for claim in claims:
+            if self._stop.is_set():
+                break
+            began = time.monotonic()
+            try:
+                outcome = warm(claim)
+            except Exception as e:
+                logger.warning(f"Pre-warm error: {e}")
+                outcome = "failed"
+            with self._lock:
+                self._job["done"] += 1
+                self._job["outcomes"][outcome if outcome in OUTCOMES else "failed"] += 1
+            # only claims that cost upstream calls count against the rate
+            if outcome in ("warmed", "no_evidence", "failed") and self._stop.wait(
+                max(0.0, interval - (time.monotonic() - began))
+            ):
+                break
+        with self._lock:
+            self._job["state"] = "cancelled" if self._stop.is_set() else "finished"
+            self._job["finished_at"] = time.time()
+        logger.info(f"Pre-warm {self._job['state']}: {self._job['outcomes']}")
+
+    def status(self) -> Dict:
+        with self._lock:
+            job = {**self._job}
+            if "outcomes" in job:
+                job["outcomes"] = dict(job["outcomes"])
+        if job["state"] == "running":
+            elapsed = time.time() - job["started_at"]
+            job["elapsed_s"] = round(elapsed, 1)
+            job["remaining"] = job["total"] - job["done"]
+            job["eta_s"] = round(job["remaining"] * 60.0 / self.rate_per_min, 1) if self.rate_per_min > 0 else None
+        job["rate_per_min"] = self.rate_per_min
+        return job
+
+
+prewarm_worker = PrewarmWorker()
@@ -1,72 +1,161 @@
 import os
+import sys
 import requests
 
+# ----- Make project root importable for the shared infra.search package -----
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from infra.search.canonical import canonicalize_query
+from infra.search.results import Evidence, RESULT_FIELDS
+from infra.search.evidence_index import get_evidence_index
+from infra.search.rate_limiter import scheduler, retry_after_seconds, PRIORITY_INTERACTIVE, QUOTA_STATUS_CODES
+from infra.search.adaptive_timeout import adaptive_timeouts
+from infra.search.negative_cache import negative_cache
+from infra.search.cost_ledger import acquire_upstream
+
 SERPER_API_KEY = os.getenv("SERPER_API_KEY")
 
-# Simple in-memory cache for search results
+# Simple in-memory cache for search results, keyed by canonicalize_query(query)
 _search_cache = {}
 
 
-def search_manager(query: str):
+def search_manager(query: str, top_k: int = 5, fields=None, priority: str = PRIORITY_INTERACTIVE,
+                   cancel=None, ledger=None):
     """
     Ultra-resilient search manager:
-    - Serper: timeout=2 seconds
+    - Serper: adaptive timeout (observed p99 x factor), asks only for top_k results (`num`)
+    - Every upstream call takes a slot from the shared rate-limit scheduler
+      at `priority`; a provider without a free slot in time is skipped
     - If rate-limited or failed: fallback to DuckDuckGo Lite
     - Always returns quickly
+    - fields: optional subset of ("title", "link", "snippet") to keep
+    - Returns immutable Evidence records, safe to share from the cache
+    - Consults the local BM25 evidence index first; the web is only
+      searched when local recall is insufficient, and Serper results
+      are added to the index
+    - cancel: optional token; raise_if_cancelled() is called before each
+      upstream call so abandoned requests stop spending quota
+    - Negative cache: a provider is skipped for a query it recently
+      answered empty (long TTL) or failed on (short TTL), with
+      exponential backoff while that keeps happening
+    - ledger: optional per-request CostLedger charged for each upstream
+      call; a provider is skipped once the request's or the per-minute
+      budget is used up
     """
 
+    local = get_evidence_index().lookup(query, top_k=top_k)
+    if local is not None:
+        if ledger is not None:
+            ledger.record_free("local_index")
+        if fields is not None:
+            local = [Evidence.from_dict(ev.to_dict(), fields) for ev in local]
+        return local
+
+    # budget already spent: don't wait for rate-limit slots we can't use
+    if ledger is not None and ledger.exhausted:
+        return []
+
     results = []
 
     # --- Primary: Serper ---
-    if SERPER_API_KEY:
+    if cancel is not None:
+        cancel.raise_if_cancelled()
+    if SERPER_API_KEY and not negative_cache.blocked("serper", query) \
+            and acquire_upstream(ledger, "serper", priority):
         try:
-            resp = requests.post(
-                "https://google.serper.dev/search",
-                json={"q": query},
-                headers={
-                    "X-API-KEY": SERPER_API_KEY,
-                    "Content-Type": "application/json"
-                },
-                timeout=2
-            )
-            data = resp.json()
-            for item in data.get("organic", [])[:5]:
-                results.append({
-                    "title": item.get("title"),
-                    "link": item.get("link"),
-                    "snippet": item.get("snippet", "")
-                })
+            timeout = adaptive_timeouts.timeout_for("serper")
+            with adaptive_timeouts.measure("serper", timeout, requests.Timeout):
+                resp = requests.post(
+                    "https://google.serper.dev/search",
+                    json={"q": query, "num": top_k},
+                    headers={
+                        "X-API-KEY": SERPER_API_KEY,
+                        "Content-Type": "application/json"
+                    },
+                    timeout=timeout
+                )
+            if resp.status_code in QUOTA_STATUS_CODES:
+                # provider-wide, not this query's fault: the scheduler pauses Serper
+                scheduler.report_quota_exhausted("serper", retry_after_seconds(resp))
+            elif resp.status_code != 200:
+                negative_cache.record_failure("serper", query)
+            else:
+                data = resp.json()
+                for item in data.get("organic", [])[:top_k]:
+                    results.append(Evidence.from_dict(item, fields))
+                if results:
+                    negative_cache.record_success("serper", query)
+                else:
+                    negative_cache.record_empty("serper", query)
+            # only complete records are worth answering later queries from
+            if results and (fields is None or set(RESULT_FIELDS) <= set(fields)):
+                get_evidence_index().add(results)
         except Exception:
-            pass
+            negative_cache.record_failure("serper", query)
 
     # --- Fallback: DuckDuckGo Light ---
-    if not results:
+    if not results and cancel is not None:
+        cancel.raise_if_cancelled()
+    if not results and not negative_cache.blocked("duckduckgo", query) \
+            and acquire_upstream(ledger, "duckduckgo", priority):
         try:
-            r = requests.get(
-                "https://duckduckgo.com/",
-                params={"q": query},
-                timeout=2
-            )
+            timeout = adaptive_timeouts.timeout_for("duckduckgo")
+            with adaptive_timeouts.measure("duckduckgo", timeout, requests.Timeout):
+                r = requests.get(
+                    "https://duckduckgo.com/",
+                    params={"q": query},
+                    timeout=timeout
+                )
             # minimal parsing
             if "<title>" in r.text:
-                results.append({
+                results.append(Evidence.from_dict({
                     "title": f"DuckDuckGo result for: {query}",
                     "link": "https://duckduckgo.com/?q=" + query.replace(" ", "+"),
                     "snippet": "Fallback search result"
-                })
+                }, fields))
+                negative_cache.record_success("duckduckgo", query)
+            elif r.status_code == 200:
+                negative_cache.record_empty("duckduckgo", query)
+            elif r.status_code not in QUOTA_STATUS_CODES:
+                negative_cache.record_failure("duckduckgo", query)
         except Exception:
-            pass
+            negative_cache.record_failure("duckduckgo", query)
 
-    return results[:5]
+    return results[:top_k]
 
 
-def cached_search(query: str):
+def cached_search(query: str, refresh: bool = False, top_k: int = 5, fields=None,
+                  priority: str = PRIORITY_INTERACTIVE, cancel=None, ledger=None):
     """
     Cached wrapper around search_manager to avoid duplicate searches.
+    Variants of the same query (case, punctuation, word order) share one entry.
+    refresh=True bypasses the cached entry and overwrites it.
+    top_k / fields are passed down to the providers and are part of the key.
+    Empty results (throttled or failed providers) are not cached here;
+    search_manager's negative cache backs off repeat empties and failures.
+    cancel: optional token checked before every upstream call.
+    ledger: optional CostLedger; cache hits are recorded as free lookups.
     """
-    if query in _search_cache:
-        return _search_cache[query]
+    key = _cache_key(query, top_k, fields)
+    if not refresh and key in _search_cache:
+        if ledger is not None:
+            ledger.record_free("search_cache")
+        return _search_cache[key]
     
-    results = search_manager(query)
-    _search_cache[query] = results
+    results = search_manager(query, top_k=top_k, fields=fields, priority=priority, cancel=cancel, ledger=ledger)
+    if results:
+        _search_cache[key] = results
     return results
+
+
+def is_cached(query: str, top_k: int = 5, fields=None) -> bool:
+    """
+    True if cached_search would answer this query without an upstream call.
+    """
+    return _cache_key(query, top_k, fields) in _search_cache
+
+
+def _cache_key(query: str, top_k: int, fields):
+    return (canonicalize_query(query), top_k, tuple(fields) if fields else None)
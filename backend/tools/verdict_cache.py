@@ -0,0 +1,271 @@
+import hashlib
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+# ----- Make project root importable for the shared infra.search package -----
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from infra.search.near_duplicate import NearDuplicateIndex
+from infra.search.heavy_hitters import HeavyHitters, guaranteed
+
+# Verdicts are fresh for VERDICT_CACHE_TTL seconds, then served stale
+# (while a background refresh runs) until VERDICT_CACHE_STALE_TTL.
+VERDICT_CACHE_TTL = float(os.getenv("VERDICT_CACHE_TTL", "900"))
+VERDICT_CACHE_STALE_TTL = float(os.getenv("VERDICT_CACHE_STALE_TTL", "3600"))
+VERDICT_CACHE_SIZE = int(os.getenv("VERDICT_CACHE_SIZE", "10000"))
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.6"))
+
+# Trending claims: the top TRENDING_TOP_N by decayed request count (at least
+# TRENDING_MIN_COUNT) are pinned: never LRU-evicted, and refreshed in the
+# background once VERDICT_REFRESH_AHEAD of their TTL has passed
+TRENDING_TOP_N = int(os.getenv("TRENDING_TOP_N", "50"))
+TRENDING_MIN_COUNT = float(os.getenv("TRENDING_MIN_COUNT", "3"))
+VERDICT_REFRESH_AHEAD = float(os.getenv("VERDICT_REFRESH_AHEAD", "0.8"))
+_HOT_SET_MAX_AGE = 1.0
+
+# Most recently requested claims, kept as a replay log for cache pre-warming
+RECENT_CLAIMS_SIZE = int(os.getenv("RECENT_CLAIMS_SIZE", "1000"))
+
+# key -> (stored_at, result); ordered oldest-used first for LRU eviction
+_verdict_cache = OrderedDict()
+_lock = threading.Lock()
+_refreshing = set()
+_refresh_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="verdict-refresh")
+
+# claim_hash -> key, for clients fetching full detail after a compact response
+_hash_keys = {}
+
+# near-duplicate claims (retweets, copy-paste variants) -> verdict cache key
+_claim_index = NearDuplicateIndex(threshold=NEAR_DUPLICATE_THRESHOLD, max_items=VERDICT_CACHE_SIZE)
+
+_stats = {"fresh": 0, "stale": 0, "miss": 0, "refreshes": 0, "near_duplicate": 0, "refresh_ahead": 0, "pinned_skips": 0}
+
+# claim key -> decayed request count, fed by every verify / agent request
+trending_claims = HeavyHitters()
+# (computed_at, keys), replaced as a whole; _hot_lock lets one thread recompute
+_hot = (0.0, frozenset())
+_hot_lock = threading.Lock()
+_recent_claims = deque(maxlen=RECENT_CLAIMS_SIZE)
+
+
+def normalize_claim_key(claim: str) -> str:
+    """
+    Cache key for an extracted claim: casefolded, whitespace collapsed.
+    """
+    return " ".join((claim or "").casefold().split())
+
+
+def claim_hash(key: str) -> str:
+    """
+    Short stable id of a claim key (16 hex chars).
+    """
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def record_claim_request(key: str, claim: str = None):
+    """
+    Count a request for a claim in the trending sketch.
+    """
+    trending_claims.offer(key, claim)
+    if claim:
+        _recent_claims.append(claim)
+
+
+def recent_claims() -> list:
+    """
+    Distinct recently requested claims, most recent first.
+    """
+    seen = set()
+    claims = []
+    for claim in reversed(list(_recent_claims)):
+        key = normalize_claim_key(claim)
+        if key not in seen:
+            seen.add(key)
+            claims.append(claim)
+    return claims
+
+
+def hot_keys() -> frozenset:
+    """
+    Claim keys currently trending (recomputed at most once a second).
+    """
+    global _hot
+    at, keys = _hot
+    # callers arriving while another thread recomputes keep the previous set
+    if time.monotonic() - at > _HOT_SET_MAX_AGE and _hot_lock.acquire(blocking=False):
+        try:
+            at, keys = _hot
+            now = time.monotonic()
+            if now - at > _HOT_SET_MAX_AGE:
+                keys = frozenset(
+                    entry["item"] for entry in trending_claims.top(TRENDING_TOP_N)
+                    if guaranteed(entry) >= TRENDING_MIN_COUNT
+                )
+                _hot = (now, keys)
+        finally:
+            _hot_lock.release()
+    return keys
+
+
+def trending(n: int = 20) -> list:
+    """
+    Top-n trending claims with their cache status.
+    """
+    hot = hot_keys()
+    report = []
+    for entry in trending_claims.top(n):
+        key = entry["item"]
+        with _lock:
+            cached = _verdict_cache.get(key)
+        report.append({
+            "claim": entry["label"] or key,
+            "claim_hash": claim_hash(key),
+            "count": entry["count"],
+            "error": entry["error"],
+            "pinned": key in hot,
+            "cached": cached is not None,
+            "age_s": round(time.monotonic() - cached[0], 1) if cached is not None else None,
+        })
+    return report
+
+
+def get_verdict(key: str):
+    """
+    Look up a cached verdict.
+    Returns (result, state) where state is 'fresh', 'stale' or 'miss',
+    or 'expiring' for a fresh verdict of a trending claim that is due for
+    a refresh-ahead (serve it, and refresh in the background).
+    """
+    now = time.monotonic()
+    hot = hot_keys()
+    with _lock:
+        entry = _verdict_cache.get(key)
+        if entry is None:
+            _stats["miss"] += 1
+            return None, "miss"
+        stored_at, result = entry
+        age = now - stored_at
+        if age > VERDICT_CACHE_STALE_TTL:
+            del _verdict_cache[key]
+            _hash_keys.pop(claim_hash(key), None)
+            _stats["miss"] += 1
+            return None, "miss"
+        _verdict_cache.move_to_end(key)
+        state = "fresh" if age <= VERDICT_CACHE_TTL else "stale"
+        _stats[state] += 1
+        if state == "fresh" and age > VERDICT_CACHE_TTL * VERDICT_REFRESH_AHEAD and key in hot:
+            _stats["refresh_ahead"] += 1
+            state = "expiring"
+        return result, state
+
+
+def has_fresh_verdict(key: str) -> bool:
+    """
+    True if a fresh verdict is cached for the key. Unlike get_verdict,
+    does not count as a hit or miss, or touch LRU order.
+    """
+    with _lock:
+        entry = _verdict_cache.get(key)
+        return entry is not None and time.monotonic() - entry[0] <= VERDICT_CACHE_TTL
+
+
+def get_similar_verdict(claim: str):
+    """
+    Reuse the verdict of a near-duplicate claim (retweet, quote, copy-paste).
+    Returns (result, matched_key) or (None, None).
+    """
+    match = _claim_index.query(claim)
+    if match is None:
+        return None, None
+    matched_key = match[0]
+    with _lock:
+        entry = _verdict_cache.get(matched_key)
+        if entry is None or time.monotonic() - entry[0] > VERDICT_CACHE_STALE_TTL:
+            return None, None
+        _stats["near_duplicate"] += 1
+        return entry[1], matched_key
+
+
+def get_verdict_by_hash(hash_id: str):
+    """
+    Full cached verdict for a claim_hash (fresh or stale), or None.
+    """
+    with _lock:
+        key = _hash_keys.get(hash_id)
+        entry = _verdict_cache.get(key) if key is not None else None
+        if entry is None or time.monotonic() - entry[0] > VERDICT_CACHE_STALE_TTL:
+            return None
+        return entry[1]
+
+
+def put_verdict(key: str, result: dict, claim: str = None):
+    """
+    Store the final verdict, confidence and top sources for a claim key.
+    Passing the extracted claim also indexes it for near-duplicate reuse.
+    Trending claims are skipped by LRU eviction.
+    """
+    evicted = []
+    hot = hot_keys()
+    with _lock:
+        _verdict_cache[key] = (time.monotonic(), result)
+        _verdict_cache.move_to_end(key)
+        _hash_keys[claim_hash(key)] = key
+        while len(_verdict_cache) > VERDICT_CACHE_SIZE:
+            # oldest first, stepping over at most TRENDING_TOP_N pinned keys
+            old_key = None
+            for k in _verdict_cache:
+                if k not in hot:
+                    old_key = k
+                    break
+                _stats["pinned_skips"] += 1
+            if old_key is None:
+                break
+            del _verdict_cache[old_key]
+            _hash_keys.pop(claim_hash(old_key), None)
+            evicted.append(old_key)
+
+    for old_key in evicted:
+        _claim_index.remove(old_key)
+    if claim:
+        _claim_index.add(key, claim)
+
+
+def refresh_in_background(key: str, compute):
+    """
+    Recompute a stale verdict off the request path.
+    At most one refresh per key runs at a time.
+    """
+    with _lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+
+    def _run():
+        try:
+            result = compute()
+            if result is not None:
+                put_verdict(key, result)
+            with _lock:
+                _stats["refreshes"] += 1
+        except Exception as e:
+            print("verdict refresh error:", e)
+        finally:
+            with _lock:
+                _refreshing.discard(key)
+
+    _refresh_pool.submit(_run)
+
+
+def verdict_cache_stats() -> dict:
+    hot = hot_keys()
+    with _lock:
+        stats = {"size": len(_verdict_cache), "refreshing": len(_refreshing), "pinned": len(hot), **_stats}
+    stats["near_duplicate_index"] = _claim_index.stats()
+    stats["trending_sketch"] = trending_claims.stats()
+    return stats
@@ -10,6 +10,7 @@ const PROCESSED_ATTR = "data-misinfo-processed";
 function setupDwellObserver(tweetEl) {
   let visibleSince = null; // Timestamp when tweet became visible
   let hasSent = false;     // Guard to ensure we only process once
+  let inFlight = null;     // AbortController of the pending verify request
 
   // IntersectionObserver triggers when ~60% (threshold 0.6) of tweet area is visible.
   const observer = new IntersectionObserver(entries => {
@@ -25,12 +26,20 @@ function setupDwellObserver(tweetEl) {
           if (!hasSent && visibleSince !== null && (Date.now() - visibleSince) >= 1200) {
             hasSent = true;
             tweetEl.setAttribute(PROCESSED_ATTR, 'sent');
-            handleTweet(tweetEl);
+            inFlight = new AbortController();
+            handleTweet(tweetEl, inFlight.signal).then(done => {
+              inFlight = null;
+              // Aborted: verify again if the tweet is dwelled on later
+              if (!done) hasSent = false;
+            });
           }
         }, 1300); // Slightly longer than threshold to avoid borderline cases
       } else {
         // Visibility lost; reset until next intersect
         visibleSince = null;
+        // Scrolled past before the verdict arrived: abort, so the backend
+        // sees the disconnect and stops its remaining searches.
+        if (inFlight) inFlight.abort();
       }
     });
   }, { threshold: 0.6 });
@@ -39,30 +48,42 @@ function setupDwellObserver(tweetEl) {
 }
 
 // Handle a tweet that has met dwell criteria (placeholder for sending to backend / analysis)
-async function handleTweet(tweetEl) {
+// Resolves false if the request was aborted, true otherwise.
+async function handleTweet(tweetEl, signal) {
   // Extract text content; skip if empty/short.
   const text = extractTweetText(tweetEl);
-  if (!text) return;
+  if (!text) return true;
   console.log('[MisinfoGuardian] verifying tweet text:', text);
 
   try {
-    const res = await fetch('http://localhost:8000/verify', {
+    // compact=1: verdict, confidence, claim_hash and source links only.
+    // Full detail: GET /api/verify/claim/{claim_hash}
+    const res = await fetch('http://localhost:8000/api/verify?compact=1', {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ text })
+      body: JSON.stringify({ text }),
+      signal
     });
 
     if (res.ok) {
       const data = await res.json();
+      // Opinions, jokes and greetings: nothing to fact-check, no badge.
+      if (data.verdict === 'not_a_claim') return true;
       injectVerdictBadge(tweetEl, data);
     } else {
       console.error('[MisinfoGuardian] backend non-OK status', res.status);
       injectVerdictBadge(tweetEl, { verdict: 'Error', confidence: 0 });
     }
   } catch (err) {
+    if (err.name === 'AbortError') {
+      console.log('[MisinfoGuardian] verification aborted (scrolled past)');
+      tweetEl.setAttribute(PROCESSED_ATTR, 'pending');
+      return false;
+    }
     console.error('[MisinfoGuardian] backend error', err);
     injectVerdictBadge(tweetEl, { verdict: 'Error', confidence: 0 });
   }
+  return true;
 }
 
 // Extract visible tweet text from language-marked blocks.
@@ -0,0 +1,18 @@
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+from infra.search.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with infra.search.serialization.dumps (orjson).
+
+    Route handlers that return an instance directly skip FastAPI's
+    jsonable_encoder walk over the whole payload. Shared by the MCP
+    server and the backend API.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
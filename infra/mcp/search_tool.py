@@ -3,35 +3,60 @@ import requests
 from typing import List, Dict, Any
 from mcp.server.fastmcp import FastMCP, Tool
 
+from infra.search.adaptive_timeout import adaptive_timeouts
+from infra.search.rate_limiter import scheduler, retry_after_seconds, QUOTA_STATUS_CODES
+from infra.search.negative_cache import negative_cache
+from infra.search.cost_ledger import acquire_upstream
+
 SERPER_KEY = os.getenv("SERPER_API_KEY")
 
 mcp = FastMCP()
 
 @mcp.tool()
-def search_run(query: str) -> List[Dict[str, Any]]:
+def search_run(query: str, top_k: int = 3, priority: str = "interactive") -> List[Dict[str, Any]]:
     """
     MCP tool for searching the web using Serper.
+    Calls go through the shared rate-limit scheduler at `priority`;
+    recently empty or failed queries are skipped (negative cache), and
+    nothing is sent once this server's per-minute cost budget is used up.
     """
     if not SERPER_KEY:
         return []
+    if negative_cache.blocked("serper", query):
+        return []
+    if not acquire_upstream(None, "serper", priority):
+        return []
 
     url = "https://google.serper.dev/search"
     headers = {"X-API-KEY": SERPER_KEY, "Content-Type": "application/json"}
 
     try:
-        response = requests.post(url, json={"q": query}, headers=headers, timeout=6)
+        timeout = adaptive_timeouts.timeout_for("serper")
+        with adaptive_timeouts.measure("serper", timeout, requests.Timeout):
+            response = requests.post(url, json={"q": query, "num": top_k}, headers=headers, timeout=timeout)
+        if response.status_code in QUOTA_STATUS_CODES:
+            scheduler.report_quota_exhausted("serper", retry_after_seconds(response))
+            return []
+        if response.status_code != 200:
+            negative_cache.record_failure("serper", query)
+            return []
         data = response.json()
     except Exception:
+        negative_cache.record_failure("serper", query)
         return []
 
     results = []
-    for item in data.get("organic", [])[:3]:
+    for item in data.get("organic", [])[:top_k]:
         results.append({
             "title": item.get("title"),
             "link": item.get("link"),
             "snippet": item.get("snippet")
         })
 
+    if results:
+        negative_cache.record_success("serper", query)
+    else:
+        negative_cache.record_empty("serper", query)
     return results
 
 if __name__ == "__main__":
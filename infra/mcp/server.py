@@ -2,9 +2,11 @@ import os
 import sys
 import logging
 import importlib
+import inspect
 from typing import Any, Dict, List
 
 from fastapi import FastAPI, HTTPException, Request, Header
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
@@ -19,13 +21,16 @@ if BACKEND_PATH not in sys.path:
 
 # internal imports
 from infra.mcp import registry
+from infra.mcp.responses import FastJSONResponse
+from infra.search.adaptive_timeout import adaptive_timeouts
+from infra.search.cost_ledger import cost_meter
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
 logger = logging.getLogger("mcp_server")
 
 API_KEY = os.getenv("MCP_API_KEY", "")
 
-app = FastAPI(title="Local MCP Server")
+app = FastAPI(title="Local MCP Server", default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -41,6 +46,12 @@ class ToolCall(BaseModel):
     kwargs: Dict[str, Any] = {}
 
 
+class ToolCallResult(BaseModel):
+    # documented in OpenAPI only; call_tool returns FastJSONResponse directly
+    tool: str
+    result: Any = None
+
+
 # auto-load local tools (import module to trigger registration into registry.TOOL_REGISTRY)
 def load_local_tools():
     try:
@@ -56,7 +67,7 @@ def list_tools():
     return registry.list_tools()
 
 
-@app.post("/tools/{tool_name}/call")
+@app.post("/tools/{tool_name}/call", responses={200: {"model": ToolCallResult}})
 async def call_tool(tool_name: str, payload: ToolCall, request: Request, x_api_key: str | None = Header(None)):
     if API_KEY and x_api_key != API_KEY:
         raise HTTPException(status_code=401, detail="Invalid MCP API KEY")
@@ -68,14 +79,18 @@ async def call_tool(tool_name: str, payload: ToolCall, request: Request, x_api_k
     fn = entry["func"]
 
     try:
-        result = fn(*payload.args, **payload.kwargs)
+        if inspect.iscoroutinefunction(fn):
+            result = await fn(*payload.args, **payload.kwargs)
+        else:
+            # sync tools block on upstream HTTP; keep them off the event loop
+            result = await run_in_threadpool(fn, *payload.args, **payload.kwargs)
         if hasattr(result, "__await__"):
             result = await result
     except Exception as e:
         logger.exception("Tool execution error")
         raise HTTPException(status_code=500, detail=str(e))
 
-    return {"tool": tool_name, "result": result}
+    return FastJSONResponse({"tool": tool_name, "result": result})
 
 
 @app.get("/health")
@@ -83,6 +98,18 @@ def health():
     return {"status": "ok", "tools": list(registry.TOOL_REGISTRY.keys())}
 
 
+@app.get("/timeouts")
+def timeouts():
+    # adaptive upstream timeouts used by the tools in this process
+    return adaptive_timeouts.snapshot()
+
+
+@app.get("/costs")
+def costs():
+    # upstream calls made by the tools in this process, and per-minute budget refusals
+    return cost_meter.stats()
+
+
 # startup: ensure tools are loaded and print routes and registry
 @app.on_event("startup")
 def startup_event():
@@ -14,20 +14,25 @@ if BACKEND_PATH not in sys.path:
 from infra.mcp.registry import register_tool
 
 # ----- Import the resilient search_manager from backend -----
-from backend.tools.search_manager import search_manager
+from backend.tools.search_manager import cached_search
 
 
 @register_tool("search", description="Search web using resilient search_manager")
-def search_tool(query: str):
+def search_tool(query: str, top_k: int = 5, fields=None, priority: str = "interactive"):
     """
     MCP search wrapper.
-    Calls resilient backend.tools.search_manager(query).
+    Calls resilient backend.tools.search_manager(query) through its
+    canonical-key cache, so repeated agent queries skip upstream calls.
+    top_k / fields are passed down so providers don't fetch discarded results.
+    priority is the outbound scheduler class (interactive / batch / reflection).
+    Evidence records are returned as-is; the server's FastJSONResponse
+    encodes them directly.
     ALWAYS returns a list.
     NEVER raises exceptions.
     """
     try:
-        results = search_manager(query)
-        return results or []
+        results = cached_search(query, top_k=top_k, fields=fields, priority=priority)
+        return list(results or [])
     except Exception as e:
         print("search_tool error:", e)
         return []
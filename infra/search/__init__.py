@@ -8,7 +8,12 @@ from .claim_extractor import extract_claim, is_valid_claim
 from .query_builder import build_query
 from .serper import search_serper, is_serper_available
 from .duckduckgo import search_duckduckgo
+from .ddg_parser import parse_ddg_stream, parse_ddg_html_fast
 from .scoring import score_evidence, calculate_credibility_score
+from .near_duplicate import NearDuplicateIndex
+from .canonical import canonicalize_query
+from .tweet_normalizer import split_sentences, first_sentence, normalize_tweet
+from .check_worthiness import check_worthiness, is_check_worthy
 
 __all__ = [
     # Main pipeline
@@ -23,8 +28,17 @@ __all__ = [
     "search_serper",
     "is_serper_available",
     "search_duckduckgo",
+    "parse_ddg_stream",
+    "parse_ddg_html_fast",
     "score_evidence",
     "calculate_credibility_score",
+    "NearDuplicateIndex",
+    "canonicalize_query",
+    "split_sentences",
+    "first_sentence",
+    "normalize_tweet",
+    "check_worthiness",
+    "is_check_worthy",
 ]
 
 __version__ = "1.0.0"
@@ -0,0 +1,178 @@
+"""
+Adaptive Timeout Module
+Per-provider request timeouts derived from observed latency.
+
+Each provider keeps a rolling window of recent call latencies. Its
+timeout is p99 of the window times a safety factor, clamped to the
+provider's [min, max] range. Until enough samples exist the provider's
+default timeout is used.
+
+Timed-out calls are not latency samples (a dead provider would otherwise
+drag p99 to its max and keep it there). Instead, after BREAKER_THRESHOLD
+consecutive timeouts the provider's calls get its min timeout, so a dead
+provider fails fast; one call every BREAKER_PROBE_INTERVAL seconds still
+gets the normal timeout, and its success closes the breaker.
+"""
+
+import math
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+TIMEOUT_FACTOR = float(os.getenv("ADAPTIVE_TIMEOUT_FACTOR", "1.5"))
+WINDOW_SIZE = int(os.getenv("ADAPTIVE_TIMEOUT_WINDOW", "200"))
+MIN_SAMPLES = int(os.getenv("ADAPTIVE_TIMEOUT_MIN_SAMPLES", "20"))
+BREAKER_THRESHOLD = int(os.getenv("ADAPTIVE_TIMEOUT_BREAKER", "3"))
+BREAKER_PROBE_INTERVAL = float(os.getenv("ADAPTIVE_TIMEOUT_PROBE_INTERVAL", "10"))
+
+# provider -> (default, min, max) timeout in seconds; defaults are the
+# fixed timeouts used before adaptation
+DEFAULT_BOUNDS = {
+    "serper": (2.0, 0.5, 6.0),
+    "duckduckgo": (2.0, 1.0, 8.0),
+    "mcp": (10.0, 1.0, 10.0),
+}
+FALLBACK_BOUNDS = (5.0, 0.5, 10.0)
+
+
+def _percentile(sorted_values, q: float) -> float:
+    """
+    Nearest-rank percentile of an ascending list (q in 0..100).
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(q / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class _ProviderLatency:
+    def __init__(self, bounds):
+        self.default, self.min, self.max = bounds
+        self.samples = deque(maxlen=WINDOW_SIZE)
+        self.timeouts = 0
+        self.consecutive_timeouts = 0
+        self.probe_at = 0.0
+        self.calls = 0
+        self._sorted = None
+
+    def add(self, seconds: float):
+        self.samples.append(seconds)
+        self._sorted = None
+
+    def sorted_samples(self):
+        if self._sorted is None:
+            self._sorted = sorted(self.samples)
+        return self._sorted
+
+    @property
+    def tripped(self) -> bool:
+        return self.consecutive_timeouts >= BREAKER_THRESHOLD
+
+    def timeout(self, factor: float) -> float:
+        if len(self.samples) < MIN_SAMPLES:
+            return self.default
+        p99 = _percentile(self.sorted_samples(), 99)
+        return min(self.max, max(self.min, p99 * factor))
+
+    def next_timeout(self, factor: float, now: float) -> float:
+        """
+        Timeout for the next call: the min while the breaker is tripped,
+        except for one probe per BREAKER_PROBE_INTERVAL.
+        """
+        if self.tripped:
+            if now < self.probe_at:
+                return self.min
+            self.probe_at = now + BREAKER_PROBE_INTERVAL
+        return self.timeout(factor)
+
+
+class AdaptiveTimeouts:
+    """
+    Rolling latency percentiles and derived timeouts per provider.
+    """
+
+    def __init__(self, bounds: Optional[Dict[str, tuple]] = None, factor: float = TIMEOUT_FACTOR):
+        self.factor = factor
+        self._bounds = dict(bounds or DEFAULT_BOUNDS)
+        self._providers: Dict[str, _ProviderLatency] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, provider: str) -> _ProviderLatency:
+        entry = self._providers.get(provider)
+        if entry is None:
+            entry = self._providers[provider] = _ProviderLatency(self._bounds.get(provider, FALLBACK_BOUNDS))
+        return entry
+
+    def timeout_for(self, provider: str) -> float:
+        """
+        Current timeout for a provider, in seconds.
+        """
+        with self._lock:
+            return round(self._get(provider).next_timeout(self.factor, time.monotonic()), 3)
+
+    def observe(self, provider: str, seconds: float, timed_out: bool = False):
+        """
+        Record one call. A timed-out call only counts towards the breaker;
+        its duration is not a latency sample.
+        """
+        with self._lock:
+            entry = self._get(provider)
+            entry.calls += 1
+            if timed_out:
+                entry.timeouts += 1
+                entry.consecutive_timeouts += 1
+                return
+            entry.consecutive_timeouts = 0
+            entry.add(seconds)
+
+    @contextmanager
+    def measure(self, provider: str, timeout: float, timeout_errors=()):
+        """
+        Time the enclosed call and record it.
+
+        Args:
+            provider: Provider name
+            timeout: Timeout the call was given
+            timeout_errors: Exception types meaning the call timed out;
+                other exceptions (e.g. connection refused) are not recorded
+        """
+        start = time.monotonic()
+        try:
+            yield
+        except timeout_errors:
+            self.observe(provider, timeout, timed_out=True)
+            raise
+        else:
+            self.observe(provider, time.monotonic() - start)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Current timeout and latency percentiles for every provider seen.
+        """
+        with self._lock:
+            report = {}
+            for name in sorted(set(self._bounds) | set(self._providers)):
+                entry = self._get(name)
+                values = entry.sorted_samples()
+                report[name] = {
+                    "timeout": round(entry.min if entry.tripped else entry.timeout(self.factor), 3),
+                    "tripped": entry.tripped,
+                    "p50": round(_percentile(values, 50), 3),
+                    "p95": round(_percentile(values, 95), 3),
+                    "p99": round(_percentile(values, 99), 3),
+                    "samples": len(values),
+                    "calls": entry.calls,
+                    "timeouts": entry.timeouts,
+                    "consecutive_timeouts": entry.consecutive_timeouts,
+                    "min": entry.min,
+                    "max": entry.max,
+                }
+            return report
+
+
+# Process-wide instance shared by every search client
+adaptive_timeouts = AdaptiveTimeouts()
@@ -0,0 +1,122 @@
+"""
+Cache Replay Tool
+Replays a corpus of tweets through claim extraction and query building,
+and reports search-cache hit rates with raw query strings as keys versus
+canonicalize_query() keys. No network calls are made.
+
+Usage:
+    python -m infra.search.cache_replay                # built-in viral-variant corpus
+    python -m infra.search.cache_replay tweets.txt     # one tweet per line
+"""
+
+import sys
+from typing import Dict, Iterable, List
+
+from infra.search.canonical import canonicalize_query
+from infra.search.claim_extractor import extract_claim, is_valid_claim
+from infra.search.query_builder import build_query, build_alternative_query
+
+
+BASE_TWEETS = [
+    "Drinking bleach cures coronavirus",
+    "5G towers cause COVID-19",
+    "Vaccines cause autism says study from 1998",
+    "Elon Musk acquires Twitter for $44 billion",
+    "NASA announces discovery of Earth-like planet",
+    "Global warming is a hoax created by China",
+    "New study shows coffee reduces risk of heart disease",
+    "Election was rigged by voting machines",
+]
+
+
+def viral_variants(tweet: str) -> List[str]:
+    """
+    Surface variants the same claim takes as it spreads
+    (retweets, shouting, punctuation, reordering, added filler).
+    """
+    words = tweet.split()
+    swapped = " ".join(words[1:2] + words[:1] + words[2:]) if len(words) > 2 else tweet
+    return [
+        tweet,
+        tweet.upper(),
+        tweet.lower() + "!!",
+        f"RT @newsbot: {tweet}",
+        "  ".join(words) + " ?",
+        f"BREAKING - {tweet}. Share now",
+        tweet.replace(" ", "  ") + " #viral",
+        swapped,
+        "The " + tweet,
+        f"{tweet} https://t.co/abc123",
+    ]
+
+
+def default_corpus() -> List[str]:
+    corpus = []
+    for tweet in BASE_TWEETS:
+        corpus.extend(viral_variants(tweet))
+    return corpus
+
+
+def replay(tweets: Iterable[str]) -> Dict[str, float]:
+    """
+    Replay tweets through the query path and count cache hits per key scheme.
+
+    Args:
+        tweets: Raw tweet texts
+
+    Returns:
+        Dictionary with lookup count, distinct keys and hit rates
+    """
+    raw_keys = set()
+    canonical_keys = set()
+    lookups = raw_hits = canonical_hits = 0
+
+    for tweet in tweets:
+        claim = extract_claim(tweet)
+        if not is_valid_claim(claim):
+            continue
+        for query in (build_query(claim), build_alternative_query(claim)):
+            lookups += 1
+            if query in raw_keys:
+                raw_hits += 1
+            raw_keys.add(query)
+
+            key = canonicalize_query(query)
+            if key in canonical_keys:
+                canonical_hits += 1
+            canonical_keys.add(key)
+
+    return {
+        "lookups": lookups,
+        "raw_distinct_keys": len(raw_keys),
+        "canonical_distinct_keys": len(canonical_keys),
+        "raw_hit_rate": raw_hits / lookups if lookups else 0.0,
+        "canonical_hit_rate": canonical_hits / lookups if lookups else 0.0,
+    }
+
+
+def main():
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding="utf-8") as f:
+            tweets = [line.strip() for line in f if line.strip()]
+        name = sys.argv[1]
+    else:
+        tweets = default_corpus()
+        name = "built-in viral-variant corpus"
+
+    report = replay(tweets)
+
+    print("=" * 80)
+    print("CACHE REPLAY")
+    print("=" * 80)
+    print(f"Corpus: {name} ({len(tweets)} tweets)")
+    print(f"Cache lookups:            {report['lookups']}")
+    print(f"Distinct raw keys:        {report['raw_distinct_keys']}")
+    print(f"Distinct canonical keys:  {report['canonical_distinct_keys']}")
+    print(f"Raw-key hit rate:         {report['raw_hit_rate']:.1%}")
+    print(f"Canonical-key hit rate:   {report['canonical_hit_rate']:.1%}")
+    print(f"Improvement:              {report['canonical_hit_rate'] - report['raw_hit_rate']:+.1%}")
+
+
+if __name__ == "__main__":
+    main()
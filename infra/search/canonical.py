@@ -0,0 +1,44 @@
+"""
+Query Canonicalization Module
+Maps casing, whitespace, punctuation and word-order variants of a
+search query to a single cache key.
+"""
+
+import re
+import unicodedata
+
+from .scoring import STOP_WORDS
+
+
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+
+def canonicalize_query(query: str) -> str:
+    """
+    Build the cache key for a search query.
+
+    The key is only used for cache lookups; the original query is
+    still what gets sent to the search provider.
+
+    Args:
+        query: Raw search query
+
+    Returns:
+        Canonical key: NFKC-normalized, casefolded, punctuation and stop
+        words removed, remaining tokens de-duplicated and sorted
+    """
+    if not query:
+        return ""
+
+    text = unicodedata.normalize("NFKC", query).casefold()
+
+    # Drop apostrophes so "don't" and "dont" agree, split on other punctuation
+    text = text.replace("'", "").replace("’", "")
+    tokens = _NON_WORD_RE.sub(" ", text).split()
+
+    kept = [tok for tok in tokens if tok not in STOP_WORDS]
+    if not kept:
+        # Query made only of stop words: keep them rather than collapse to ""
+        kept = tokens
+
+    return " ".join(sorted(set(kept)))
@@ -0,0 +1,198 @@
+"""
+Check-Worthiness Module
+Cheap pre-filter that decides whether a tweet makes a checkable factual
+claim before any query is built or search quota is spent.
+
+Hand-picked lexical features are combined by a small logistic model.
+Opinions, jokes, greetings and questions score low; statements about
+named entities, numbers, causes and events score high. Scoring a claim
+costs a few microseconds and never touches the network.
+"""
+
+import math
+import os
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .claim_extractor import is_valid_claim
+
+
+# Claims scoring below this are answered "not a claim" without searching.
+# Tune on a labeled sample with tune_threshold() (see check_worthiness_eval).
+CHECK_WORTHY_THRESHOLD = float(os.getenv("CHECK_WORTHY_THRESHOLD", "0.4"))
+
+_WORD_RE = re.compile(r"[A-Za-z0-9$%']+")
+_NUMBER_RE = re.compile(r"\d")
+
+FACT_VERBS = frozenset({
+    "cause", "causes", "caused", "cure", "cures", "cured", "kill", "kills", "killed",
+    "announce", "announces", "announced", "confirm", "confirms", "confirmed",
+    "acquire", "acquires", "acquired", "release", "releases", "released",
+    "report", "reports", "reported", "reveal", "reveals", "revealed",
+    "show", "shows", "showed", "prove", "proves", "proved", "found", "finds",
+    "ban", "bans", "banned", "approve", "approves", "approved", "launch", "launches",
+    "launched", "die", "dies", "died", "arrest", "arrested", "rigged", "faked",
+    "reduce", "reduces", "reduced", "increase", "increases", "increased",
+    "spread", "spreads", "contain", "contains", "sign", "signs", "signed",
+    "win", "wins", "won", "lose", "loses", "lost", "raise", "raises", "raised",
+    "discovered", "discovery", "created", "invented", "hoax", "study", "says",
+    "say", "said", "claim", "claims", "claimed", "poison", "poisons", "poisoning", "poisoned",
+})
+COPULAS = frozenset({"is", "are", "was", "were", "has", "have", "had", "will"})
+OPINION_WORDS = frozenset({
+    "think", "feel", "believe", "imo", "imho", "love", "hate", "best", "worst",
+    "amazing", "awesome", "beautiful", "cute", "lol", "lmao", "omg", "ugh", "wow",
+    "yay", "should", "favorite", "favourite", "vibes", "mood", "literally", "cant",
+    "wait", "excited", "tired", "bored", "hope", "wish", "miss", "fun",
+})
+GREETING_WORDS = frozenset({
+    "good", "morning", "night", "hello", "hi", "hey", "thanks", "thank", "congrats",
+    "congratulations", "happy", "birthday", "welcome", "gm", "gn", "bye",
+})
+QUESTION_WORDS = frozenset({
+    "who", "what", "why", "how", "when", "where", "which", "anyone", "does", "do",
+    "did", "can", "could", "would", "should", "is", "are", "am",
+})
+FIRST_PERSON = frozenset({"i", "im", "i'm", "me", "my", "mine", "we", "us", "our", "lets", "let's"})
+
+FEATURES = (
+    "words", "number", "entities", "fact_verb", "copula",
+    "opinion", "greeting", "first_person", "question",
+)
+
+# Logistic model weights (fitted on check_worthiness_eval.LABELED_SAMPLE
+# with fit_weights, then rounded)
+WEIGHTS = {
+    "bias": -0.2,
+    "words": 0.5,
+    "number": 2.5,
+    "entities": 2.3,
+    "fact_verb": 2.4,
+    "copula": 0.3,
+    "opinion": -2.8,
+    "greeting": -3.2,
+    "first_person": -2.5,
+    "question": -1.7,
+}
+
+
+def claim_features(claim: str) -> Dict[str, float]:
+    """
+    Hand features of a claim, each in [0, 1].
+    """
+    words = _WORD_RE.findall(claim or "")
+    lowered = [w.lower() for w in words]
+    # capitalized words after the first, and acronyms / alphanumerics (NASA, 5G)
+    fact_verb = any(w in FACT_VERBS for w in lowered)
+    entities = sum(
+        1 for i, w in enumerate(words)
+        if (i > 0 and w[0].isupper() and lowered[i] not in FIRST_PERSON)
+        or (len(w) > 1 and w.isupper()) or (w[0].isdigit() and any(c.isalpha() for c in w))
+    )
+    return {
+        "words": min(len(words), 12) / 12.0,
+        "number": 1.0 if _NUMBER_RE.search(claim or "") else 0.0,
+        "entities": min(entities, 3) / 3.0,
+        "fact_verb": 1.0 if fact_verb else 0.0,
+        "copula": 1.0 if any(w in COPULAS for w in lowered) else 0.0,
+        # reported speech ("my uncle says X causes Y", "they are poisoning us")
+        # still carries a checkable claim: no opinion / first-person penalty
+        "opinion": 0.0 if fact_verb else min(sum(1 for w in lowered if w in OPINION_WORDS), 2) / 2.0,
+        "greeting": 1.0 if sum(1 for w in lowered[:4] if w in GREETING_WORDS) >= 1 and len(words) <= 8 else 0.0,
+        "first_person": 0.0 if fact_verb else (1.0 if any(w in FIRST_PERSON for w in lowered) else 0.0),
+        # first_sentence() drops the "?", so also look at the opening word
+        "question": 1.0 if (claim or "").rstrip().endswith("?") or (lowered and lowered[0] in QUESTION_WORDS) else 0.0,
+    }
+
+
+def check_worthiness(claim: str, weights: Optional[Dict[str, float]] = None) -> float:
+    """
+    Probability-like score (0-1) that a claim is a checkable factual claim.
+
+    Args:
+        claim: Extracted claim text
+        weights: Model weights (default: WEIGHTS)
+
+    Returns:
+        Score in [0, 1]; 0.0 for empty or too-short claims (see
+        is_valid_claim), which the model was never meant to score
+    """
+    if not is_valid_claim(claim):
+        return 0.0
+    weights = weights or WEIGHTS
+    features = claim_features(claim)
+    z = weights["bias"] + sum(weights[name] * value for name, value in features.items())
+    return 1.0 / (1.0 + math.exp(-z))
+
+
+def is_check_worthy(claim: str, threshold: Optional[float] = None) -> bool:
+    """
+    True if a claim is worth searching for (score >= threshold).
+    """
+    return check_worthiness(claim) >= (CHECK_WORTHY_THRESHOLD if threshold is None else threshold)
+
+
+def fit_weights(samples: Sequence[Tuple[str, bool]], epochs: int = 300,
+                learning_rate: float = 0.5) -> Dict[str, float]:
+    """
+    Fit the logistic model by batch gradient descent.
+
+    Args:
+        samples: (claim, is_check_worthy) pairs
+        epochs: Gradient steps over the whole sample
+        learning_rate: Step size
+
+    Returns:
+        Weights usable with check_worthiness()
+    """
+    # invalid claims are scored 0.0 before the model runs; don't fit on them
+    rows = [(claim_features(text), 1.0 if label else 0.0) for text, label in samples if is_valid_claim(text)]
+    weights = {"bias": 0.0, **{name: 0.0 for name in FEATURES}}
+    for _ in range(epochs):
+        grad = dict.fromkeys(weights, 0.0)
+        for features, label in rows:
+            z = weights["bias"] + sum(weights[name] * features[name] for name in FEATURES)
+            error = 1.0 / (1.0 + math.exp(-z)) - label
+            grad["bias"] += error
+            for name in FEATURES:
+                grad[name] += error * features[name]
+        for name in weights:
+            weights[name] -= learning_rate * grad[name] / len(rows)
+    return weights
+
+
+def tune_threshold(samples: Iterable[Tuple[str, bool]], min_recall: float = 0.95,
+                   weights: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """
+    Highest threshold that still keeps recall on check-worthy claims at
+    or above min_recall (dropping a real claim costs more than one
+    wasted search).
+
+    Args:
+        samples: (claim, is_check_worthy) pairs
+        min_recall: Share of check-worthy claims that must pass
+        weights: Model weights (default: WEIGHTS)
+
+    Returns:
+        {"threshold", "precision", "recall", "skipped"} where skipped is
+        the share of all samples filtered out before searching
+    """
+    scored = [(check_worthiness(text, weights), bool(label)) for text, label in samples]
+    positives = sum(1 for _, label in scored if label) or 1
+    best = {"threshold": 0.0, "precision": 0.0, "recall": 1.0, "skipped": 0.0}
+    for threshold in _candidate_thresholds(scored):
+        kept = [label for score, label in scored if score >= threshold]
+        recall = sum(kept) / positives
+        if recall < min_recall:
+            break
+        best = {
+            "threshold": round(threshold, 4),
+            "precision": sum(kept) / len(kept) if kept else 0.0,
+            "recall": recall,
+            "skipped": 1.0 - len(kept) / len(scored) if scored else 0.0,
+        }
+    return best
+
+
+def _candidate_thresholds(scored: List[Tuple[float, bool]]) -> List[float]:
+    return sorted({score for score, _ in scored})
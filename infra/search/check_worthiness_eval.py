@@ -0,0 +1,178 @@
+"""
+Check-Worthiness Evaluation
+Scores a labeled sample with the check-worthiness model, tunes the
+threshold for a target recall and measures per-claim cost.
+
+The built-in sample is the one WEIGHTS were fitted on, so its scores
+are optimistic; the held-out line (k-fold: each fold scored with weights
+fitted on the other folds) is the number to quote.
+
+Usage:
+    python -m infra.search.check_worthiness_eval               # built-in sample
+    python -m infra.search.check_worthiness_eval labeled.tsv   # "1<TAB>text" / "0<TAB>text"
+    python -m infra.search.check_worthiness_eval --fit         # also refit the weights
+"""
+
+import sys
+import time
+from typing import List, Tuple
+
+from infra.search.check_worthiness import (
+    CHECK_WORTHY_THRESHOLD,
+    WEIGHTS,
+    check_worthiness,
+    fit_weights,
+    tune_threshold,
+)
+from infra.search.claim_extractor import extract_claim
+
+
+# (tweet, is_check_worthy)
+LABELED_SAMPLE: List[Tuple[str, bool]] = [
+    ("Breaking: Drinking bleach cures coronavirus! #health #COVID19", True),
+    ("NASA announces discovery of Earth-like planet 100 light years away", True),
+    ("New study shows coffee reduces risk of heart disease by 30%", True),
+    ("FAKE NEWS: Election was rigged by voting machines!", True),
+    ("Scientists confirm 5G towers are safe and don't cause health issues", True),
+    ("President Biden announces new climate change initiative today", True),
+    ("Elon Musk acquires Twitter for $44 billion dollars", True),
+    ("Vaccines cause autism says discredited study from 1998", True),
+    ("Apple releases iPhone 15 with revolutionary new battery technology", True),
+    ("Global warming is a hoax created by China says conspiracy theorist", True),
+    ("The moon landing was faked in a Hollywood studio", True),
+    ("Unemployment fell to 3.5% in March according to the BLS", True),
+    ("The WHO declared a global health emergency over mpox", True),
+    ("Eating garlic prevents infection with the new coronavirus", True),
+    ("Tesla recalled 2 million cars over autopilot defects", True),
+    ("The Eiffel Tower was sold for scrap in 1925", True),
+    ("Masks cause dangerous CO2 buildup in children", True),
+    ("Drinking 8 glasses of water a day is required for health", True),
+    ("Bill Gates wants to put microchips in vaccines", True),
+    ("The Great Wall of China is visible from space", True),
+    # reported speech and short claims
+    ("My uncle says vaccines cause autism", True),
+    ("Chemtrails are poisoning us", True),
+    ("My neighbour claims the election was stolen", True),
+    ("Vaccines contain microchips", True),
+    ("5G spreads COVID", True),
+    ("Good morning everyone!! Have a great day", False),
+    ("I think pineapple on pizza is amazing lol", False),
+    ("Happy birthday to my best friend ever", False),
+    ("Can't wait for the weekend, so tired", False),
+    ("Who else is watching the game tonight?", False),
+    ("This song is literally my whole mood", False),
+    ("ugh mondays am I right", False),
+    ("Thanks for all the love on my last post", False),
+    ("I love my cat so much she is so cute", False),
+    ("What should I have for dinner tonight?", False),
+    ("Honestly the best coffee shop in town", False),
+    ("lmao this meme is killing me", False),
+    ("We should all be nicer to each other", False),
+    ("Congrats to the whole team on the launch!", False),
+    ("Anyone else feel like this week lasted forever?", False),
+    ("Just finished my first marathon, feeling amazing", False),
+    ("hey guys new video dropping soon", False),
+    ("I miss the old days when life was simple", False),
+    ("Sunsets like this never get old", False),
+    ("Good night world, see you tomorrow", False),
+    # empty and one-word inputs (URL-, mention- or punctuation-only tweets
+    # normalize to "")
+    ("", False),
+    ("https://t.co/abc123", False),
+    ("@someone @another", False),
+    ("!!!", False),
+    ("ok", False),
+    ("yes", False),
+    ("same", False),
+    ("Nice", False),
+]
+
+
+def load_labeled(path: str) -> List[Tuple[str, bool]]:
+    samples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            label, _, text = line.rstrip("\n").partition("\t")
+            if text.strip():
+                samples.append((text.strip(), label.strip() in ("1", "true", "yes")))
+    return samples
+
+
+def cross_validate(claims: List[Tuple[str, bool]], folds: int = 5,
+                   threshold: float = CHECK_WORTHY_THRESHOLD) -> dict:
+    """
+    Held-out precision and recall: every claim is scored with weights
+    fitted on the folds it is not in.
+    """
+    kept, missed = [], []
+    for k in range(folds):
+        weights = fit_weights([sample for i, sample in enumerate(claims) if i % folds != k])
+        for i, (claim, label) in enumerate(claims):
+            if i % folds != k:
+                continue
+            if check_worthiness(claim, weights) >= threshold:
+                kept.append(label)
+            elif label:
+                missed.append(claim)
+    positives = sum(1 for _, label in claims if label) or 1
+    return {
+        "precision": sum(kept) / len(kept) if kept else 0.0,
+        "recall": sum(kept) / positives,
+        "missed": missed,
+    }
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    samples = load_labeled(args[0]) if args else LABELED_SAMPLE
+    claims = [(extract_claim(text), label) for text, label in samples]
+
+    weights = WEIGHTS
+    if "--fit" in sys.argv:
+        weights = fit_weights(claims)
+        print("Fitted weights:")
+        for name, value in weights.items():
+            print(f"    {name:<14}{value:+.2f}")
+
+    print("=" * 80)
+    print("CHECK-WORTHINESS EVALUATION")
+    print("=" * 80)
+    print(f"Samples: {len(claims)} ({sum(1 for _, label in claims if label)} check-worthy)")
+
+    if not args:
+        print("Per threshold (fitting set: optimistic):")
+    for threshold in (0.2, 0.3, CHECK_WORTHY_THRESHOLD, 0.5, 0.6, 0.7):
+        kept = [label for claim, label in claims if check_worthiness(claim, weights) >= threshold]
+        positives = sum(1 for _, label in claims if label) or 1
+        precision = sum(kept) / len(kept) if kept else 0.0
+        print(f"  threshold {threshold:.2f}: precision {precision:.1%}  recall {sum(kept) / positives:.1%}  "
+              f"skipped {1 - len(kept) / len(claims):.1%}")
+
+    tuned = tune_threshold(claims, weights=weights)
+    print(f"Tuned threshold (recall >= 95%): {tuned['threshold']:.3f}  precision {tuned['precision']:.1%}  "
+          f"recall {tuned['recall']:.1%}  skipped {tuned['skipped']:.1%}")
+
+    held_out = cross_validate(claims)
+    print(f"Held-out (5-fold) at {CHECK_WORTHY_THRESHOLD:.2f}: precision {held_out['precision']:.1%}  "
+          f"recall {held_out['recall']:.1%}")
+    for claim in held_out["missed"]:
+        print(f"  held-out miss:  {claim}")
+
+    missed = [claim for claim, label in claims if label and check_worthiness(claim, weights) < CHECK_WORTHY_THRESHOLD]
+    passed = [claim for claim, label in claims if not label and check_worthiness(claim, weights) >= CHECK_WORTHY_THRESHOLD]
+    for claim in missed:
+        print(f"  missed claim:   {claim}")
+    for claim in passed:
+        print(f"  passed non-claim: {claim}")
+
+    rounds = 200
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for claim, _ in claims:
+            check_worthiness(claim, weights)
+    per_claim = (time.perf_counter() - start) / (rounds * len(claims))
+    print(f"Cost per claim: {per_claim * 1e6:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,16 @@ Claim Extractor Module
 Extracts factual claims from raw tweet text.
 """
 
-import re
+from .tweet_normalizer import first_sentence
 
 
 def extract_claim(text: str) -> str:
     """
     Extract a clean factual claim from raw tweet text.
     
+    URLs, mentions and hashtags are stripped, whitespace collapsed and
+    the first sentence taken, all in one scan (see tweet_normalizer).
+    
     Args:
         text: Raw tweet text
         
@@ -19,29 +22,7 @@ def extract_claim(text: str) -> str:
     if not text or not isinstance(text, str):
         return ""
     
-    # Remove URLs
-    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-    
-    # Remove mentions (@username)
-    text = re.sub(r'@\w+', '', text)
-    
-    # Remove hashtags (#tag)
-    text = re.sub(r'#\w+', '', text)
-    
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    
-    # Limit length to reasonable claim size (first sentence or 200 chars)
-    sentences = re.split(r'[.!?]+', text)
-    if sentences and sentences[0]:
-        claim = sentences[0].strip()
-    else:
-        claim = text[:200].strip()
-    
-    return claim
+    return first_sentence(text)
 
 
 def is_valid_claim(claim: str) -> bool:
@@ -0,0 +1,222 @@
+"""
+Cost Ledger Module
+Per-request accounting of upstream calls (Serper, DuckDuckGo, MCP round
+trips) with a per-request budget and process-wide per-minute budgets.
+
+A CostLedger travels with one verify or agent run and is charged right
+before each upstream call; a refused charge means the call is skipped,
+exactly like a provider without a free rate-limit slot. Calls made
+without a ledger (background refreshes, pre-warming, batch pipelines)
+still count against the per-minute budgets.
+
+The per-minute budgets are spend caps, not rate smoothing: the
+rate-limit scheduler paces calls, while these refuse them outright once
+the last 60 seconds have used up the budget.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from .rate_limiter import scheduler, PRIORITY_INTERACTIVE
+
+
+PROVIDERS = ("serper", "duckduckgo", "mcp")
+
+# Upstream calls one request may make across all providers (0: unlimited)
+COST_MAX_CALLS_PER_REQUEST = int(os.getenv("COST_MAX_CALLS_PER_REQUEST", "40"))
+
+# Upstream calls per rolling minute, all providers together and per
+# provider (COST_MAX_PER_MIN_SERPER, ...); 0: unlimited
+COST_MAX_CALLS_PER_MIN = int(os.getenv("COST_MAX_CALLS_PER_MIN", "0"))
+COST_MAX_PER_MIN = {p: int(os.getenv(f"COST_MAX_PER_MIN_{p.upper()}", "0")) for p in PROVIDERS}
+
+# Names reported as the exhausted budget
+REQUEST_BUDGET = "max_upstream_calls"
+GLOBAL_BUDGET = "global_budget"
+
+_WINDOW_SECONDS = 60.0
+_RECENT_REQUESTS = 1000
+
+
+class CostMeter:
+    """
+    Process-wide per-minute budgets, and per-request cost aggregates for
+    metrics.
+    """
+
+    def __init__(self, max_per_min: int = COST_MAX_CALLS_PER_MIN,
+                 max_per_min_by_provider: Optional[Dict[str, int]] = None):
+        self.max_per_min = max_per_min
+        self.max_per_min_by_provider = dict(COST_MAX_PER_MIN if max_per_min_by_provider is None
+                                            else max_per_min_by_provider)
+        self._lock = threading.Lock()
+        # (timestamp, provider) of calls in the last minute, oldest first
+        self._window = deque()
+        self._window_counts: Dict[str, int] = dict.fromkeys(PROVIDERS, 0)
+        self._calls: Dict[str, int] = dict.fromkeys(PROVIDERS, 0)
+        self._denied = {REQUEST_BUDGET: 0, GLOBAL_BUDGET: 0}
+        # kind (verify, agent, ...) -> aggregates; totals of recent requests
+        self._requests: Dict[str, dict] = {}
+        self._recent: Dict[str, deque] = {}
+
+    def _expire(self, now: float):
+        while self._window and now - self._window[0][0] > _WINDOW_SECONDS:
+            _, provider = self._window.popleft()
+            self._window_counts[provider] -= 1
+
+    def admit(self, provider: str) -> bool:
+        """
+        Count one call to `provider` if the per-minute budgets allow it.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            limit = self.max_per_min_by_provider.get(provider, 0)
+            if (self.max_per_min and len(self._window) >= self.max_per_min) or \
+                    (limit and self._window_counts.get(provider, 0) >= limit):
+                self._denied[GLOBAL_BUDGET] += 1
+                return False
+            self._window.append((now, provider))
+            self._window_counts[provider] = self._window_counts.get(provider, 0) + 1
+            self._calls[provider] = self._calls.get(provider, 0) + 1
+            return True
+
+    def record_denied(self, budget: str):
+        with self._lock:
+            self._denied[budget] = self._denied.get(budget, 0) + 1
+
+    def record_request(self, kind: str, ledger: "CostLedger"):
+        """
+        Aggregate a finished request's ledger under `kind`.
+        """
+        summary = ledger.summary()
+        with self._lock:
+            agg = self._requests.setdefault(kind, {
+                "requests": 0, "calls": dict.fromkeys(PROVIDERS, 0), "free": {},
+                "max_calls": 0, "budget_exhausted": 0,
+            })
+            agg["requests"] += 1
+            for provider, n in summary["calls"].items():
+                agg["calls"][provider] = agg["calls"].get(provider, 0) + n
+            for source, n in summary["free"].items():
+                agg["free"][source] = agg["free"].get(source, 0) + n
+            agg["max_calls"] = max(agg["max_calls"], summary["total"])
+            if summary["exhausted"]:
+                agg["budget_exhausted"] += 1
+            self._recent.setdefault(kind, deque(maxlen=_RECENT_REQUESTS)).append(summary["total"])
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            requests = {}
+            for kind, agg in self._requests.items():
+                totals = sorted(self._recent[kind])
+                requests[kind] = {
+                    **agg,
+                    "calls": dict(agg["calls"]),
+                    "free": dict(agg["free"]),
+                    "mean_calls": round(sum(agg["calls"].values()) / agg["requests"], 2),
+                    "p95_calls": totals[min(len(totals) - 1, int(len(totals) * 0.95))],
+                }
+            return {
+                "last_minute": {**self._window_counts, "total": len(self._window)},
+                "budgets": {
+                    "max_calls_per_request": COST_MAX_CALLS_PER_REQUEST,
+                    "max_calls_per_min": self.max_per_min,
+                    "max_per_min_by_provider": dict(self.max_per_min_by_provider),
+                },
+                "calls": dict(self._calls),
+                "denied": dict(self._denied),
+                "requests": requests,
+            }
+
+
+# Process-wide instance shared by every search client
+cost_meter = CostMeter()
+
+
+class CostLedger:
+    """
+    Upstream calls made on behalf of one request.
+    """
+
+    def __init__(self, max_calls: int = COST_MAX_CALLS_PER_REQUEST, meter: Optional[CostMeter] = None):
+        self.max_calls = max_calls
+        self.meter = meter or cost_meter
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = dict.fromkeys(PROVIDERS, 0)
+        self.free: Dict[str, int] = {}
+        self.denied = 0
+        self.exhausted: Optional[str] = None
+        self._started = time.monotonic()
+
+    @property
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+    def charge(self, provider: str) -> bool:
+        """
+        Record one call to `provider` about to be made. False (and the
+        call must be skipped) if the request or per-minute budget is used up.
+        """
+        with self._lock:
+            if self.max_calls and self.total >= self.max_calls:
+                self.denied += 1
+                self.exhausted = REQUEST_BUDGET
+                self.meter.record_denied(REQUEST_BUDGET)
+                return False
+            if not self.meter.admit(provider):
+                self.denied += 1
+                self.exhausted = self.exhausted or GLOBAL_BUDGET
+                return False
+            self.calls[provider] = self.calls.get(provider, 0) + 1
+            return True
+
+    def record_free(self, source: str):
+        """
+        Count a lookup answered without an upstream call (cache, local index).
+        """
+        with self._lock:
+            self.free[source] = self.free.get(source, 0) + 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "calls": dict(self.calls),
+                "total": sum(self.calls.values()),
+                "free": dict(self.free),
+                "denied": self.denied,
+                "max_calls": self.max_calls or None,
+                "exhausted": self.exhausted,
+                "elapsed_ms": round((time.monotonic() - self._started) * 1000, 1),
+            }
+
+
+def charge_upstream(ledger: Optional[CostLedger], provider: str) -> bool:
+    """
+    Charge one upstream call to the request's ledger, or only to the
+    per-minute budgets when there is no ledger. False: skip the call.
+    """
+    if ledger is not None:
+        return ledger.charge(provider)
+    return cost_meter.admit(provider)
+
+
+def acquire_upstream(ledger: Optional[CostLedger], provider: str,
+                     priority: str = PRIORITY_INTERACTIVE) -> bool:
+    """
+    Rate-limit slot plus cost charge for one upstream call. A slot whose
+    charge is refused is refunded to the scheduler, so a spent budget
+    doesn't drain the provider bucket other callers share. False: skip
+    the call.
+    """
+    if not scheduler.acquire(provider, priority):
+        return False
+    if charge_upstream(ledger, provider):
+        return True
+    scheduler.refund(provider)
+    return False
@@ -0,0 +1,201 @@
+"""
+DuckDuckGo Streaming Parser Module
+Incremental extraction of DuckDuckGo HTML results. Input is fed in
+chunks (like html.parser.HTMLParser.feed); the scanner jumps between
+result anchors with str.find instead of tokenizing every tag, and stops
+as soon as enough results are collected, so callers can also stop
+downloading the rest of the page.
+"""
+
+import html as html_lib
+import re
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import unquote
+
+
+DEFAULT_MAX_RESULTS = 10
+
+# Feed size when parsing an in-memory page
+CHUNK_SIZE = 8192
+
+
+def decode_ddg_link(href: str) -> str:
+    """
+    Resolve a DuckDuckGo redirect link to the target URL.
+
+    Args:
+        href: href attribute of a result link
+
+    Returns:
+        Target URL (the uddg parameter), or the href unchanged
+    """
+    if not href:
+        return ""
+    start = href.find("uddg=")
+    if start != -1:
+        end = href.find("&", start)
+        return unquote(href[start + 5:end if end != -1 else len(href)])
+    if href.startswith("//"):
+        return "https:" + href
+    return href
+
+
+def _is_ad_link(href: str) -> bool:
+    return "duckduckgo.com/y.js" in href or "ad_provider" in href
+
+
+_TITLE_MARK = 'class="result__a"'
+_SNIPPET_MARK = 'class="result__snippet"'
+_HREF_RE = re.compile(r'href="([^"]*)"')
+_TAG_RE = re.compile(r"<[^>]+>")
+_TAG_NAME_RE = re.compile(r"<\s*([a-zA-Z0-9]+)")
+
+# Bytes kept from an unfinished scan so a marker split across chunks is not lost
+_KEEP_TAIL = 2048
+
+
+def _clean_text(fragment: str) -> str:
+    """
+    Strip tags, decode all entities and collapse whitespace.
+    """
+    return " ".join(html_lib.unescape(_TAG_RE.sub("", fragment)).split())
+
+
+def _element_at(buf: str, mark_pos: int):
+    """
+    Locate the element whose start tag contains mark_pos.
+
+    Returns:
+        (start_tag, content_start, content_end) or None if the element
+        is not complete in buf yet
+    """
+    tag_start = buf.rfind("<", 0, mark_pos)
+    tag_end = buf.find(">", mark_pos)
+    if tag_start == -1 or tag_end == -1:
+        return None
+    start_tag = buf[tag_start:tag_end + 1]
+    name = _TAG_NAME_RE.match(start_tag)
+    closing = f"</{name.group(1) if name else 'a'}>"
+    content_end = buf.find(closing, tag_end + 1)
+    if content_end == -1:
+        return None
+    return start_tag, tag_end + 1, content_end
+
+
+class DDGResultParser:
+    """
+    Incremental parser collecting title, link and snippet per result.
+
+    feed() text chunks, then close(). Once max_results results are
+    collected, `done` is set and further input is ignored.
+    """
+
+    def __init__(self, max_results: int = DEFAULT_MAX_RESULTS):
+        self.max_results = max_results
+        self.results: List[Dict[str, str]] = []
+        self.done = False
+        self._buf = ""
+
+    def feed(self, chunk: str):
+        if self.done or not chunk:
+            return
+        self._buf += chunk
+        self._scan(final=False)
+
+    def close(self):
+        if not self.done:
+            self._scan(final=True)
+        self._buf = ""
+
+    def _scan(self, final: bool):
+        buf = self._buf
+        pos = 0
+
+        while not self.done:
+            title_pos = buf.find(_TITLE_MARK, pos)
+            if title_pos == -1:
+                pos = max(pos, len(buf) - _KEEP_TAIL)
+                break
+
+            title = _element_at(buf, title_pos)
+            if title is None:
+                # result anchor not fully received yet
+                pos = max(0, buf.rfind("<", 0, title_pos))
+                break
+            start_tag, content_start, content_end = title
+
+            next_pos = buf.find(_TITLE_MARK, content_end)
+            limit = next_pos if next_pos != -1 else len(buf)
+            snippet_pos = buf.find(_SNIPPET_MARK, content_end, limit)
+
+            snippet = ""
+            if snippet_pos != -1:
+                element = _element_at(buf, snippet_pos)
+                if element is None:
+                    pos = max(0, buf.rfind("<", 0, title_pos))
+                    break
+                snippet = _clean_text(buf[element[1]:element[2]])
+                resume = element[2]
+            elif next_pos == -1 and not final:
+                # snippet may still be on its way
+                pos = max(0, buf.rfind("<", 0, title_pos))
+                break
+            else:
+                resume = limit
+
+            href = _HREF_RE.search(start_tag)
+            href = href.group(1) if href else ""
+            self._emit(_clean_text(buf[content_start:content_end]), html_lib.unescape(href), snippet)
+            pos = resume
+
+        self._buf = buf[pos:] if not self.done else ""
+
+    def _emit(self, title: str, href: str, snippet: str):
+        if _is_ad_link(href) or not (title or snippet):
+            return
+        self.results.append({"title": title, "link": decode_ddg_link(href), "snippet": snippet})
+        if len(self.results) >= self.max_results:
+            self.done = True
+
+
+def parse_ddg_stream(chunks: Iterable[str], max_results: int = DEFAULT_MAX_RESULTS) -> List[Dict[str, str]]:
+    """
+    Parse DuckDuckGo HTML from an iterable of text chunks.
+
+    Stops consuming chunks once max_results results are found, so a
+    streaming HTTP body is not downloaded further than needed.
+
+    Args:
+        chunks: Decoded HTML chunks (e.g. from a streamed response)
+        max_results: Maximum number of results to extract
+
+    Returns:
+        List of results: [{"title": ..., "link": ..., "snippet": ...}, ...]
+    """
+    parser = DDGResultParser(max_results=max_results)
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.done:
+            break
+    if not parser.done:
+        parser.close()
+    return parser.results
+
+
+def parse_ddg_html_fast(html: str, max_results: int = DEFAULT_MAX_RESULTS) -> List[Dict[str, str]]:
+    """
+    Parse an in-memory DuckDuckGo HTML page with the streaming parser.
+
+    Args:
+        html: Raw HTML content from DuckDuckGo
+        max_results: Maximum number of results to extract
+
+    Returns:
+        List of results: [{"title": ..., "link": ..., "snippet": ...}, ...]
+    """
+    if not html:
+        return []
+    return parse_ddg_stream(
+        (html[i:i + CHUNK_SIZE] for i in range(0, len(html), CHUNK_SIZE)),
+        max_results=max_results,
+    )
@@ -3,25 +3,52 @@ DuckDuckGo Search Module
 Fallback search engine using DuckDuckGo HTML parser.
 """
 
+import codecs
+import html as html_lib
 import re
 import requests
-from typing import List, Dict
+from typing import List, Dict, Iterable, Optional
 from urllib.parse import quote_plus
 
+from .ddg_parser import parse_ddg_stream, DEFAULT_MAX_RESULTS
+from .results import project_fields
+from .adaptive_timeout import adaptive_timeouts
+from .rate_limiter import scheduler, retry_after_seconds, PRIORITY_INTERACTIVE, QUOTA_STATUS_CODES
+from .negative_cache import negative_cache
+from .cost_ledger import CostLedger, acquire_upstream
+
 
 DDG_HTML_URL = "https://duckduckgo.com/html/"
 
+_TAG_RE = re.compile(r'<[^>]+>')
+
 
-def search_duckduckgo(query: str) -> List[Dict[str, str]]:
+def search_duckduckgo(
+    query: str,
+    top_k: Optional[int] = None,
+    fields: Optional[Iterable[str]] = None,
+    priority: str = PRIORITY_INTERACTIVE,
+    ledger: Optional[CostLedger] = None
+) -> List[Dict[str, str]]:
     """
     Search using DuckDuckGo HTML interface.
     
     Args:
         query: Search query string
+        top_k: Maximum number of results; parsing and downloading
+            stop once this many are found
+        fields: Result fields to keep (default: title, link, snippet)
+        priority: Scheduler priority class; returns [] without calling
+            DuckDuckGo when no rate-limit slot is free in time
+        ledger: Per-request cost ledger charged for the call; returns []
+            once the request's or the per-minute budget is used up
+        
+    Queries that recently came back empty or failed are answered []
+    without calling DuckDuckGo (see negative_cache).
         
     Returns:
-        List of search results with title and snippet
-        Format: [{"title": "...", "snippet": "..."}, ...]
+        List of search results with title, link and snippet
+        Format: [{"title": "...", "link": "...", "snippet": "..."}, ...]
     """
     if not query:
         return []
@@ -34,30 +61,71 @@ def search_duckduckgo(query: str) -> List[Dict[str, str]]:
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
     }
     
+    if negative_cache.blocked("duckduckgo", query):
+        return []
+    
+    if not acquire_upstream(ledger, "duckduckgo", priority):
+        return []
+    
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        
-        if response.status_code != 200:
-            return []
+        # measures time to response headers; the body is streamed below
+        timeout = adaptive_timeouts.timeout_for("duckduckgo")
+        with adaptive_timeouts.measure("duckduckgo", timeout, requests.Timeout):
+            response = requests.get(url, headers=headers, timeout=timeout, stream=True)
         
-        html = response.text
-        
-        # Parse results using regex
-        results = parse_ddg_html(html)
+        try:
+            if response.status_code in QUOTA_STATUS_CODES:
+                scheduler.report_quota_exhausted("duckduckgo", retry_after_seconds(response))
+                return []
+            if response.status_code != 200:
+                negative_cache.record_failure("duckduckgo", query)
+                return []
+            
+            # Parse while downloading; stop reading once enough results are in
+            results = parse_ddg_stream(
+                _iter_text(response),
+                max_results=top_k or DEFAULT_MAX_RESULTS
+            )
+        finally:
+            response.close()
         
+        if results:
+            negative_cache.record_success("duckduckgo", query)
+        else:
+            negative_cache.record_empty("duckduckgo", query)
+        if fields is not None:
+            results = [project_fields(r, fields) for r in results]
         return results
         
     except requests.RequestException:
         # Network error or timeout
+        negative_cache.record_failure("duckduckgo", query)
         return []
     except Exception:
         # Any other error
+        negative_cache.record_failure("duckduckgo", query)
         return []
 
 
+def _iter_text(response, chunk_size: int = 8192):
+    """
+    Decode a streamed response body incrementally.
+    """
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if chunk:
+            yield decoder.decode(chunk)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
 def parse_ddg_html(html: str) -> List[Dict[str, str]]:
     """
-    Parse DuckDuckGo HTML results.
+    Parse DuckDuckGo HTML results with regexes.
+    
+    Kept for comparison; search_duckduckgo uses the streaming parser
+    in ddg_parser.
     
     Args:
         html: Raw HTML content from DuckDuckGo
@@ -105,17 +173,10 @@ def clean_html(text: str) -> str:
         Cleaned plain text
     """
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = _TAG_RE.sub('', text)
     
-    # Decode HTML entities
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
-    text = text.replace('&nbsp;', ' ')
+    # Decode all HTML entities (named, decimal and hex)
+    text = html_lib.unescape(text)
     
     # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    return " ".join(text.split())
@@ -0,0 +1,336 @@
+"""
+Evidence Index Module
+Local full-text store of every search result fetched so far, with an
+inverted index and BM25 retrieval. Repeat topics are answered from it
+instead of paying for another web search.
+
+Records are appended to a JSONL file (one result per line) and loaded
+back on startup, so the store survives restarts.
+
+The store is bounded: beyond EVIDENCE_INDEX_MAX_DOCS records the least
+recently used one is dropped from memory, and once the file holds
+EVIDENCE_INDEX_COMPACT_FACTOR times that many lines it is rewritten with
+only the most recent records. Backend and MCP processes share the file;
+appends and compaction take a sidecar lock file where the platform has
+flock.
+"""
+
+import json
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter, OrderedDict, deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are still atomic per line, compaction is unlocked
+    fcntl = None
+
+from .results import Evidence, as_evidence, orjson
+from .scoring import STOP_WORDS
+
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# A hit must contain this share of the query's terms to count as recall
+MIN_TERM_COVERAGE = float(os.getenv("EVIDENCE_MIN_COVERAGE", "0.75"))
+# Local recall is sufficient with this many qualifying hits (or top_k if smaller)
+MIN_LOCAL_RESULTS = int(os.getenv("EVIDENCE_MIN_RESULTS", "3"))
+
+# Records kept in memory (least recently used dropped first), and file
+# lines allowed per kept record before the file is compacted
+MAX_DOCS = int(os.getenv("EVIDENCE_INDEX_MAX_DOCS", "50000"))
+COMPACT_FACTOR = float(os.getenv("EVIDENCE_INDEX_COMPACT_FACTOR", "2"))
+
+DEFAULT_INDEX_PATH = os.getenv(
+    "EVIDENCE_INDEX_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "data", "evidence_index.jsonl"),
+)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Index terms: NFKC-normalized, casefolded words without stop words.
+    """
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKC", text).casefold().replace("'", "").replace("’", "")
+    return [tok for tok in _TOKEN_RE.findall(text) if tok not in STOP_WORDS]
+
+
+class EvidenceIndex:
+    """
+    In-memory inverted index over Evidence records with BM25 ranking.
+
+    Records are de-duplicated by link (or title when there is no link),
+    and at most max_docs are kept (least recently used evicted).
+    """
+
+    def __init__(self, path: Optional[str] = None, max_docs: int = MAX_DOCS):
+        self.path = path
+        self.max_docs = max(1, max_docs)
+        self._lock = threading.Lock()
+        # doc id -> record, least recently used first
+        self._docs: "OrderedDict[int, Evidence]" = OrderedDict()
+        self._doc_len: Dict[int, int] = {}
+        self._next_id = 0
+        self._total_len = 0
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._keys: Dict[str, int] = {}
+        self._file_lines = 0
+        self._latencies = deque(maxlen=1000)
+        self._stats = {"queries": 0, "hits": 0, "evicted": 0, "compactions": 0}
+        if path:
+            self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, records: Iterable, persist: bool = True) -> int:
+        """
+        Index new results; already-known links are skipped.
+
+        Args:
+            records: Evidence records or result dicts
+            persist: Append new records to the JSONL file
+
+        Returns:
+            Number of records added
+        """
+        added = []
+        with self._lock:
+            for ev in as_evidence(records):
+                key = ev.link or ev.title
+                if not key or key in self._keys:
+                    continue
+                if ev.score is not None:
+                    ev = Evidence(ev.title, ev.link, ev.snippet)
+                self._insert(key, ev)
+                added.append(ev)
+        # outside the index lock: a compaction must not stall lookups
+        if persist and added and self.path:
+            self._append(added)
+        return len(added)
+
+    def _insert(self, key: str, ev: Evidence):
+        doc_id = self._next_id
+        self._next_id += 1
+        terms = Counter(tokenize(f"{ev.title} {ev.snippet}"))
+        self._docs[doc_id] = ev
+        length = sum(terms.values())
+        self._doc_len[doc_id] = length
+        self._total_len += length
+        self._keys[key] = doc_id
+        for term, tf in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = tf
+        while len(self._docs) > self.max_docs:
+            self._evict()
+
+    def _evict(self):
+        doc_id, ev = self._docs.popitem(last=False)
+        self._total_len -= self._doc_len.pop(doc_id)
+        self._keys.pop(ev.link or ev.title, None)
+        for term in set(tokenize(f"{ev.title} {ev.snippet}")):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[term]
+        self._stats["evicted"] += 1
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[Evidence, float, float]]:
+        """
+        BM25 retrieval.
+
+        Args:
+            query: Search query
+            top_k: Maximum number of hits
+
+        Returns:
+            [(evidence, bm25_score, term_coverage), ...] best first;
+            term_coverage is the share of query terms the record contains
+        """
+        return [hit[1:] for hit in self._search(query, top_k)]
+
+    def _search(self, query: str, top_k: int):
+        start = time.perf_counter()
+        terms = set(tokenize(query))
+        with self._lock:
+            hits = self._rank(terms, top_k)
+            self._stats["queries"] += 1
+            self._latencies.append(time.perf_counter() - start)
+        return hits
+
+    def _rank(self, terms, top_k: int):
+        n = len(self._docs)
+        if not terms or not n:
+            return []
+        avg_len = self._total_len / n or 1.0
+        scores: Dict[int, float] = {}
+        matched: Dict[int, int] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, tf in postings.items():
+                norm = tf * (BM25_K1 + 1) / (tf + BM25_K1 * (1 - BM25_B + BM25_B * self._doc_len[doc_id] / avg_len))
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * norm
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+        best = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:top_k]
+        return [(doc_id, self._docs[doc_id], score, matched[doc_id] / len(terms)) for doc_id, score in best]
+
+    def lookup(self, query: str, top_k: int = 5, min_results: int = MIN_LOCAL_RESULTS,
+               min_coverage: float = MIN_TERM_COVERAGE) -> Optional[List[Evidence]]:
+        """
+        Local answer for a query, or None when local recall is insufficient
+        and the caller should search the web.
+
+        Returns:
+            Up to top_k records covering at least min_coverage of the query
+            terms, if there are at least min(min_results, top_k) of them
+        """
+        hits = [(doc_id, ev) for doc_id, ev, _, coverage in self._search(query, top_k) if coverage >= min_coverage]
+        if len(hits) < min(min_results, top_k):
+            return None
+        with self._lock:
+            self._stats["hits"] += 1
+            for doc_id, _ in hits:
+                if doc_id in self._docs:
+                    self._docs.move_to_end(doc_id)
+        return [ev for _, ev in hits]
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            latencies = sorted(self._latencies)
+            queries = self._stats["queries"]
+            return {
+                "documents": len(self._docs),
+                "max_documents": self.max_docs,
+                "file_lines": self._file_lines,
+                "terms": len(self._postings),
+                "postings": sum(len(p) for p in self._postings.values()),
+                "queries": queries,
+                "local_hits": self._stats["hits"],
+                "evicted": self._stats["evicted"],
+                "compactions": self._stats["compactions"],
+                "hit_rate": round(self._stats["hits"] / queries, 4) if queries else 0.0,
+                "query_ms_p50": round(latencies[len(latencies) // 2] * 1000, 3) if latencies else 0.0,
+                "query_ms_max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            }
+
+    def _append(self, records: List[Evidence]):
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with _file_lock(self.path):
+                with open(self.path, "ab") as f:
+                    for ev in records:
+                        f.write(_dumps(ev.to_dict()) + b"\n")
+                self._file_lines += len(records)
+                if self._file_lines > COMPACT_FACTOR * self.max_docs:
+                    self._compact()
+        except OSError as e:
+            print("evidence index write error:", e)
+
+    def _compact(self):
+        """
+        Rewrite the file with its max_docs most recent unique records
+        (re-read from disk, so other processes' appends are kept).
+        Called with the file lock held.
+        """
+        latest: "OrderedDict[str, bytes]" = OrderedDict()
+        for key, line, _ in _read_records(self.path):
+            latest.pop(key, None)
+            latest[key] = line
+        kept = list(latest.values())[-self.max_docs:]
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            for line in kept:
+                f.write(line + b"\n")
+        os.replace(tmp_path, self.path)
+        self._file_lines = len(kept)
+        self._stats["compactions"] += 1
+
+    def _load(self, path: str):
+        if not os.path.exists(path):
+            return
+        for key, _, data in _read_records(path):
+            self._file_lines += 1
+            if key not in self._keys:
+                self._insert(key, Evidence.from_dict(data))
+
+
+def _read_records(path: str):
+    """
+    (key, raw line, parsed record) for every readable record in a JSONL file.
+    """
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                data = _loads(line)
+            except ValueError:
+                continue  # torn last line after a crash
+            key = data.get("link") or data.get("title") if isinstance(data, dict) else None
+            if key:
+                yield key, line, data
+
+
+class _file_lock:
+    """
+    Exclusive inter-process lock on `<path>.lock` (no-op without flock).
+    """
+
+    def __init__(self, path: str):
+        self._path = f"{path}.lock"
+        self._f = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self._f = open(self._path, "a")
+            fcntl.flock(self._f, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        if self._f is not None:
+            fcntl.flock(self._f, fcntl.LOCK_UN)
+            self._f.close()
+            self._f = None
+
+
+def _dumps(data) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(line: bytes):
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+_default_index = None
+_default_lock = threading.Lock()
+
+
+def get_evidence_index() -> EvidenceIndex:
+    """
+    Process-wide index backed by EVIDENCE_INDEX_PATH (loaded on first use).
+    """
+    global _default_index
+    if _default_index is None:
+        with _default_lock:
+            if _default_index is None:
+                _default_index = EvidenceIndex(DEFAULT_INDEX_PATH)
+    return _default_index
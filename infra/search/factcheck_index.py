@@ -0,0 +1,294 @@
+"""
+Fact-Check Corpus Index
+Instant lookups of recycled, already-debunked claims against a local
+fact-check corpus (ClaimReview-style JSONL).
+
+The corpus is compiled once into a binary index file that is opened
+with mmap: a sorted (shingle, record) postings array, a record table
+and the record payloads. Matching reuses the near-duplicate claim
+shingles, so casing, punctuation, filler words and small rewordings
+still match, while a claim and its negation never do.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, Optional
+from urllib.parse import urlparse
+
+from .near_duplicate import claim_tokens, claim_shingles, NEGATION_WORDS
+
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(_PACKAGE_DIR))
+
+DEFAULT_CORPUS_PATH = os.getenv("FACTCHECK_CORPUS_PATH", os.path.join(_PACKAGE_DIR, "data", "factchecks.jsonl"))
+DEFAULT_INDEX_PATH = os.getenv("FACTCHECK_INDEX_PATH", os.path.join(_PROJECT_ROOT, "data", "factchecks.idx"))
+
+# A match must cover this share of the fact-checked claim's shingles...
+MIN_CONTAINMENT = float(os.getenv("FACTCHECK_MIN_CONTAINMENT", "0.8"))
+# ...and overlap the incoming claim at least this much (Jaccard)
+MIN_JACCARD = float(os.getenv("FACTCHECK_MIN_JACCARD", "0.3"))
+
+# ClaimReview rating text -> our verdicts
+FALSE_RATINGS = frozenset({
+    "false", "pants on fire", "fake", "incorrect", "wrong", "fabricated",
+    "hoax", "mostly false", "baseless", "debunked", "not true", "scam",
+})
+TRUE_RATINGS = frozenset({"true", "correct", "accurate", "mostly true"})
+
+# Spellings fact-checkers and posts use interchangeably for the same thing
+TOKEN_ALIASES = {
+    "coronavirus": "covid", "covid19": "covid", "sarscov2": "covid",
+    "vaccine": "vaccines", "vaccination": "vaccines", "vaccinations": "vaccines",
+    "jab": "vaccines", "jabs": "vaccines",
+}
+
+_MAGIC = b"FCIDX001"
+_HEADER = struct.Struct("<8sII")      # magic, records, postings
+_RECORD = struct.Struct("<QII")       # payload offset, payload length, shingle count
+_POSTING = struct.Struct("<II")       # shingle hash, record id
+
+
+def rating_to_verdict(rating: str) -> str:
+    """
+    Map a ClaimReview rating (e.g. "False", "Pants on Fire") to
+    accurate / contradicted / unverified.
+    """
+    text = (rating or "").strip().lower()
+    if text in FALSE_RATINGS:
+        return "contradicted"
+    if text in TRUE_RATINGS:
+        return "accurate"
+    return "unverified"
+
+
+def _claim_terms(text: str):
+    """
+    Near-duplicate claim tokens with aliases folded ("COVID-19",
+    "coronavirus" -> "covid"), and their shingles.
+    """
+    tokens = []
+    for tok in claim_tokens(text):
+        if tok == "19" and tokens and tokens[-1] == "covid":
+            continue
+        tokens.append(TOKEN_ALIASES.get(tok, tok))
+    return tokens, claim_shingles(tokens)
+
+
+def load_claimreview_jsonl(path: str) -> Iterator[Dict[str, str]]:
+    """
+    Read a fact-check corpus, one JSON object per line.
+
+    Accepts schema.org ClaimReview objects (claimReviewed, reviewRating,
+    author, url) as well as flat records (claim, rating, publisher, url).
+    Records without a link to the fact-check article itself (no url, or
+    just a site's homepage) are skipped: the link is the verdict's only
+    source.
+
+    Yields:
+        {"claim", "rating", "verdict", "publisher", "url"}
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                item = json.loads(line)
+            except ValueError:
+                continue
+            claim = item.get("claimReviewed") or item.get("claim") or ""
+            rating = item.get("reviewRating") or item.get("rating") or ""
+            if isinstance(rating, dict):
+                rating = rating.get("alternateName") or rating.get("name") or ""
+            author = item.get("author") or item.get("publisher") or ""
+            if isinstance(author, dict):
+                author = author.get("name") or ""
+            url = item.get("url") or ""
+            if not claim or not _is_article_url(url):
+                continue
+            yield {
+                "claim": claim,
+                "rating": rating,
+                "verdict": item.get("verdict") or rating_to_verdict(rating),
+                "publisher": author,
+                "url": url,
+            }
+
+
+def _is_article_url(url: str) -> bool:
+    parsed = urlparse(url)
+    return parsed.scheme in ("http", "https") and bool(parsed.netloc) and parsed.path.strip("/") != ""
+
+
+def build_factcheck_index(records: Iterable[Dict[str, str]], index_path: str) -> int:
+    """
+    Compile fact-check records into a binary index file.
+
+    Args:
+        records: Records as yielded by load_claimreview_jsonl
+        index_path: Output file (written atomically)
+
+    Returns:
+        Number of indexed records
+    """
+    table, postings, payloads = [], [], []
+    offset = 0
+    for record in records:
+        tokens, shingles = _claim_terms(record["claim"])
+        if not shingles:
+            continue
+        record_id = len(table)
+        payload = json.dumps(
+            {**record, "negations": sorted(t for t in tokens if t in NEGATION_WORDS)},
+            ensure_ascii=False, separators=(",", ":"),
+        ).encode("utf-8")
+        table.append((offset, len(payload), len(shingles)))
+        payloads.append(payload)
+        offset += len(payload)
+        postings.extend((shingle, record_id) for shingle in shingles)
+    postings.sort()
+
+    os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+    tmp_path = f"{index_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(table), len(postings)))
+        for entry in table:
+            f.write(_RECORD.pack(*entry))
+        for entry in postings:
+            f.write(_POSTING.pack(*entry))
+        for payload in payloads:
+            f.write(payload)
+    os.replace(tmp_path, index_path)
+    return len(table)
+
+
+class FactCheckIndex:
+    """
+    Read-only, memory-mapped fact-check index.
+    """
+
+    def __init__(self, index_path: str):
+        self.path = index_path
+        with open(index_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.num_records, self.num_postings = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"Not a fact-check index: {index_path}")
+        self._table_at = _HEADER.size
+        self._postings_at = self._table_at + self.num_records * _RECORD.size
+        self._payloads_at = self._postings_at + self.num_postings * _POSTING.size
+        self._stats = {"queries": 0, "hits": 0}
+        # match() runs on the event loop and in threadpool workers
+        self._stats_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.num_records
+
+    def _posting(self, i: int):
+        return _POSTING.unpack_from(self._mm, self._postings_at + i * _POSTING.size)
+
+    def _records_with(self, shingle: int) -> Iterator[int]:
+        lo, hi = 0, self.num_postings
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._posting(mid)[0] < shingle:
+                lo = mid + 1
+            else:
+                hi = mid
+        while lo < self.num_postings:
+            value, record_id = self._posting(lo)
+            if value != shingle:
+                break
+            yield record_id
+            lo += 1
+
+    def record(self, record_id: int) -> Dict[str, Any]:
+        offset, length, _ = _RECORD.unpack_from(self._mm, self._table_at + record_id * _RECORD.size)
+        start = self._payloads_at + offset
+        return json.loads(self._mm[start:start + length])
+
+    def match(self, claim: str) -> Optional[Dict[str, Any]]:
+        """
+        Best fact-check for a claim, if the match is confident.
+
+        Args:
+            claim: Extracted claim text
+
+        Returns:
+            Record with "similarity" (Jaccard) and "containment", or None
+        """
+        with self._stats_lock:
+            self._stats["queries"] += 1
+        tokens, shingles = _claim_terms(claim)
+        if not shingles:
+            return None
+        negations = sorted(t for t in tokens if t in NEGATION_WORDS)
+
+        overlap = Counter()
+        for shingle in shingles:
+            overlap.update(self._records_with(shingle))
+
+        best = None
+        for record_id, shared in overlap.most_common():
+            count = _RECORD.unpack_from(self._mm, self._table_at + record_id * _RECORD.size)[2]
+            containment = shared / count
+            similarity = shared / (len(shingles) + count - shared)
+            if containment < MIN_CONTAINMENT or similarity < MIN_JACCARD:
+                continue
+            if best is not None and (containment, similarity) <= (best["containment"], best["similarity"]):
+                continue
+            record = self.record(record_id)
+            if record.pop("negations", []) != negations:
+                continue
+            best = {**record, "containment": round(containment, 3), "similarity": round(similarity, 3)}
+
+        if best is not None:
+            with self._stats_lock:
+                self._stats["hits"] += 1
+        return best
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {"records": self.num_records, "postings": self.num_postings, **self._stats}
+
+
+_default_index = None
+_default_loaded = False
+_default_lock = threading.Lock()
+
+
+def get_factcheck_index() -> Optional[FactCheckIndex]:
+    """
+    Process-wide index for FACTCHECK_CORPUS_PATH, compiled to
+    FACTCHECK_INDEX_PATH when missing or older than the corpus.
+    Returns None when there is no corpus or the build failed; either
+    outcome is remembered, so the filesystem is checked once per process
+    (load it at startup, off the event loop).
+    """
+    global _default_index, _default_loaded
+    if not _default_loaded:
+        with _default_lock:
+            if not _default_loaded:
+                try:
+                    if os.path.exists(DEFAULT_CORPUS_PATH):
+                        if (not os.path.exists(DEFAULT_INDEX_PATH)
+                                or os.path.getmtime(DEFAULT_INDEX_PATH) < os.path.getmtime(DEFAULT_CORPUS_PATH)):
+                            build_factcheck_index(load_claimreview_jsonl(DEFAULT_CORPUS_PATH), DEFAULT_INDEX_PATH)
+                        _default_index = FactCheckIndex(DEFAULT_INDEX_PATH)
+                except (OSError, ValueError) as e:
+                    print("fact-check index error:", e)
+                _default_loaded = True
+    return _default_index
+
+
+def match_factcheck(claim: str) -> Optional[Dict[str, Any]]:
+    """
+    Confident fact-check match for a claim from the default index, or None.
+    """
+    index = get_factcheck_index()
+    return index.match(claim) if index is not None else None
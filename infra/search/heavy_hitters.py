@@ -0,0 +1,141 @@
+"""
+Heavy Hitters Module
+Streaming top-k of the most requested items (e.g. claims) in bounded
+memory, using the Space-Saving algorithm with exponential time decay.
+
+Space-Saving keeps `capacity` counters. An unseen item replaces the
+item with the smallest counter and inherits its count (recorded as the
+item's maximum overestimate), so every item whose true count exceeds
+total / capacity is guaranteed to be tracked.
+
+Decay makes the counts reflect what is hot *now*: each request is
+weighted 2^(t / half_life), which is equivalent to halving every count
+each half-life, without touching every counter.
+"""
+
+import heapq
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+HEAVY_HITTERS_CAPACITY = int(os.getenv("HEAVY_HITTERS_CAPACITY", "1000"))
+HEAVY_HITTERS_HALF_LIFE = float(os.getenv("HEAVY_HITTERS_HALF_LIFE", "900"))
+
+# Rescale stored weights before the exponential weights overflow
+_MAX_LOG2_WEIGHT = 512
+
+
+class HeavyHitters:
+    """
+    Thread-safe, time-decayed Space-Saving sketch.
+    """
+
+    def __init__(self, capacity: int = HEAVY_HITTERS_CAPACITY, half_life: float = HEAVY_HITTERS_HALF_LIFE):
+        self.capacity = max(1, capacity)
+        self.half_life = half_life
+        self._lock = threading.Lock()
+        self._origin = time.monotonic()
+        # item -> [weight, overestimate, label]
+        self._counters: Dict[Any, list] = {}
+        # (weight, item) min-heap; entries go stale as weights grow and are
+        # skipped lazily when they no longer match the counter
+        self._heap: List[Tuple[float, Any]] = []
+        self._offered = 0
+
+    def _weight(self, now: float) -> float:
+        exponent = (now - self._origin) / self.half_life if self.half_life > 0 else 0.0
+        if exponent > _MAX_LOG2_WEIGHT:
+            self._rescale(now)
+            exponent = 0.0
+        return 2.0 ** exponent
+
+    def _rescale(self, now: float):
+        factor = 2.0 ** (-(now - self._origin) / self.half_life)
+        for counter in self._counters.values():
+            counter[0] *= factor
+            counter[1] *= factor
+        self._origin = now
+        self._heap = [(counter[0], item) for item, counter in self._counters.items()]
+        heapq.heapify(self._heap)
+
+    def offer(self, item, label: Optional[str] = None):
+        """
+        Count one request for `item`; `label` (e.g. the claim text) is kept
+        for reporting.
+        """
+        with self._lock:
+            weight = self._weight(time.monotonic())
+            self._offered += 1
+            counter = self._counters.get(item)
+            if counter is None:
+                if len(self._counters) >= self.capacity:
+                    floor = self._evict_min()
+                    counter = [floor, floor, label]
+                else:
+                    counter = [0.0, 0.0, label]
+                self._counters[item] = counter
+            elif label is not None:
+                counter[2] = label
+            counter[0] += weight
+            heapq.heappush(self._heap, (counter[0], item))
+            if len(self._heap) > 4 * self.capacity:
+                self._heap = [(c[0], i) for i, c in self._counters.items()]
+                heapq.heapify(self._heap)
+
+    def _evict_min(self) -> float:
+        while self._heap:
+            weight, item = heapq.heappop(self._heap)
+            counter = self._counters.get(item)
+            if counter is not None and counter[0] == weight:
+                del self._counters[item]
+                return weight
+        return 0.0
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """
+        The n items with the highest decayed counts.
+
+        Returns:
+            [{"item", "label", "count", "error"}, ...] best first; count is
+            in requests-now units (decayed), error its maximum overestimate
+        """
+        with self._lock:
+            scale = 1.0 / self._weight(time.monotonic())
+            best = heapq.nlargest(n, self._counters.items(), key=lambda entry: entry[1][0])
+            return [
+                {
+                    "item": item,
+                    "label": counter[2],
+                    "count": round(counter[0] * scale, 3),
+                    "error": round(counter[1] * scale, 3),
+                }
+                for item, counter in best
+            ]
+
+    def count(self, item) -> float:
+        """
+        Decayed count of an item (0 if not tracked).
+        """
+        with self._lock:
+            counter = self._counters.get(item)
+            if counter is None:
+                return 0.0
+            return counter[0] / self._weight(time.monotonic())
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "tracked": len(self._counters),
+                "capacity": self.capacity,
+                "half_life_s": self.half_life,
+                "offered": self._offered,
+            }
+
+
+def guaranteed(entry: Dict[str, Any]) -> float:
+    """
+    Lower bound on an item's decayed count (count minus overestimate).
+    """
+    return max(0.0, entry["count"] - entry["error"])
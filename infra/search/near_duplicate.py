@@ -0,0 +1,211 @@
+"""
+Near-Duplicate Claim Index
+MinHash LSH over normalized claims, so retweets, quote tweets and
+copy-paste variants of a claim can reuse an earlier verdict.
+"""
+
+import random
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+
+# 20 bands x 3 rows: pairs at Jaccard 0.6 become candidates ~99% of the time,
+# pairs at 0.3 ~42%; candidates are then checked with exact Jaccard.
+NUM_BANDS = 20
+ROWS_PER_BAND = 3
+NUM_PERM = NUM_BANDS * ROWS_PER_BAND
+
+DEFAULT_THRESHOLD = 0.6
+
+# Fixed seed so signatures are identical across processes and restarts
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Filler that retweets and copy-paste variants add or drop freely
+FILLER_WORDS = frozenset({
+    "a", "an", "the", "is", "are", "was", "were", "of", "to", "in", "on",
+    "for", "and", "that", "this", "rt", "via", "breaking",
+})
+
+# A claim and its negation share almost every token; never merge them
+NEGATION_WORDS = frozenset({
+    "not", "no", "never", "nor", "none", "cannot", "without",
+    "dont", "doesnt", "didnt", "isnt", "arent", "wasnt", "werent",
+    "wont", "cant", "hasnt", "havent", "false", "fake", "hoax",
+})
+
+
+def claim_tokens(text: str) -> List[str]:
+    """
+    Tokenize a claim for similarity: lowercase alphanumeric words.
+
+    Args:
+        text: Normalized claim text
+
+    Returns:
+        List of tokens without filler words (apostrophes dropped, so "don't" -> "dont")
+    """
+    if not text:
+        return []
+    words = _TOKEN_RE.findall(text.lower().replace("'", "").replace("’", ""))
+    return [w for w in words if w not in FILLER_WORDS]
+
+
+def claim_shingles(tokens: List[str]) -> FrozenSet[int]:
+    """
+    Hash word unigrams and bigrams into 32-bit shingles.
+
+    Args:
+        tokens: Claim tokens
+
+    Returns:
+        Frozen set of shingle hashes
+    """
+    shingles = {zlib.crc32(tok.encode()) for tok in tokens}
+    for a, b in zip(tokens, tokens[1:]):
+        shingles.add(zlib.crc32(f"{a} {b}".encode()))
+    return frozenset(shingles)
+
+
+def minhash_signature(shingles: FrozenSet[int]) -> Tuple[int, ...]:
+    """
+    Compute the MinHash signature of a shingle set.
+
+    Args:
+        shingles: Shingle hashes
+
+    Returns:
+        Tuple of NUM_PERM minimum hash values
+    """
+    if not shingles:
+        return tuple()
+    return tuple(
+        min((a * x + b) % _MERSENNE_PRIME for x in shingles)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def jaccard(a: FrozenSet[int], b: FrozenSet[int]) -> float:
+    """
+    Exact Jaccard similarity of two shingle sets.
+    """
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """
+    Bounded, thread-safe MinHash LSH index of claims.
+
+    Each entry is stored under a caller-chosen key (e.g. the verdict cache
+    key) with an optional value. The oldest entries are evicted first once
+    max_items is reached.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, max_items: int = 50000):
+        self.threshold = threshold
+        self.max_items = max_items
+        self._entries: "OrderedDict[str, Tuple[FrozenSet[int], FrozenSet[str], Tuple[int, ...], Any]]" = OrderedDict()
+        self._buckets: Dict[Tuple[int, Tuple[int, ...]], set] = {}
+        self._lock = threading.Lock()
+        self._stats = {"queries": 0, "hits": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, key: str, text: str, value: Any = None) -> None:
+        """
+        Index a claim under key (replacing any previous entry for key).
+
+        Args:
+            key: Entry key
+            text: Normalized claim text
+            value: Optional payload returned by query()
+        """
+        tokens = claim_tokens(text)
+        shingles = claim_shingles(tokens)
+        if not shingles:
+            return
+        signature = minhash_signature(shingles)
+        negations = frozenset(t for t in tokens if t in NEGATION_WORDS)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+            self._entries[key] = (shingles, negations, signature, value)
+            for band in self._bands(signature):
+                self._buckets.setdefault(band, set()).add(key)
+            while len(self._entries) > self.max_items:
+                oldest = next(iter(self._entries))
+                self._remove_locked(oldest)
+
+    def remove(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove_locked(key)
+
+    def query(self, text: str) -> Optional[Tuple[str, float, Any]]:
+        """
+        Find the most similar indexed claim at or above the threshold.
+
+        Args:
+            text: Normalized claim text
+
+        Returns:
+            (key, similarity, value) of the best match, or None
+        """
+        tokens = claim_tokens(text)
+        shingles = claim_shingles(tokens)
+        if not shingles:
+            return None
+        signature = minhash_signature(shingles)
+        negations = frozenset(t for t in tokens if t in NEGATION_WORDS)
+
+        with self._lock:
+            self._stats["queries"] += 1
+            candidates = set()
+            for band in self._bands(signature):
+                bucket = self._buckets.get(band)
+                if bucket:
+                    candidates.update(bucket)
+
+            best = None
+            for key in candidates:
+                cand_shingles, cand_negations, _, value = self._entries[key]
+                if cand_negations != negations:
+                    continue
+                sim = jaccard(shingles, cand_shingles)
+                if sim >= self.threshold and (best is None or sim > best[1]):
+                    best = (key, sim, value)
+
+            if best is not None:
+                self._stats["hits"] += 1
+                self._entries.move_to_end(best[0])
+            return best
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "buckets": len(self._buckets), **self._stats}
+
+    def _bands(self, signature: Tuple[int, ...]):
+        for i in range(NUM_BANDS):
+            yield (i, signature[i * ROWS_PER_BAND:(i + 1) * ROWS_PER_BAND])
+
+    def _remove_locked(self, key: str) -> None:
+        _, _, signature, _ = self._entries.pop(key)
+        for band in self._bands(signature):
+            bucket = self._buckets.get(band)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band]
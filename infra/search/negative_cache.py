@@ -0,0 +1,98 @@
+"""
+Negative Cache Module
+Remembers queries a provider answered with nothing, or failed on, so
+they are not sent again on every request.
+
+Genuine empties (HTTP 200, no results) are held for a long TTL; failures
+(timeouts, connection errors, non-quota error statuses) for a short one.
+Both back off exponentially while the same query keeps coming back
+empty or failing, and a success clears the entry. Entries are per
+provider, so a query Serper failed on can still go to DuckDuckGo.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .canonical import canonicalize_query
+
+
+EMPTY = "empty"
+FAILED = "failed"
+
+# First TTL and cap for each kind (seconds); doubles per repeat
+EMPTY_TTL = float(os.getenv("NEGATIVE_EMPTY_TTL", "900"))
+EMPTY_TTL_MAX = float(os.getenv("NEGATIVE_EMPTY_TTL_MAX", "21600"))
+FAILURE_TTL = float(os.getenv("NEGATIVE_FAILURE_TTL", "10"))
+FAILURE_TTL_MAX = float(os.getenv("NEGATIVE_FAILURE_TTL_MAX", "600"))
+
+MAX_ENTRIES = int(os.getenv("NEGATIVE_CACHE_SIZE", "10000"))
+
+
+class NegativeCache:
+    """
+    Per-(provider, canonical query) backoff for empty and failed searches.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> [kind, repeats, blocked_until]; kept after expiry so the
+        # next failure backs off further
+        self._entries: "OrderedDict[tuple, list]" = OrderedDict()
+        self._stats = {"blocked": 0, "empties": 0, "failures": 0}
+
+    @staticmethod
+    def _key(provider: str, query: str) -> tuple:
+        return provider, canonicalize_query(query)
+
+    def blocked(self, provider: str, query: str) -> Optional[str]:
+        """
+        EMPTY or FAILED if the provider should not be asked for this query
+        yet, else None.
+        """
+        key = self._key(provider, query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() >= entry[2]:
+                return None
+            self._stats["blocked"] += 1
+            return entry[0]
+
+    def record_empty(self, provider: str, query: str):
+        self._record(provider, query, EMPTY, EMPTY_TTL, EMPTY_TTL_MAX)
+
+    def record_failure(self, provider: str, query: str):
+        self._record(provider, query, FAILED, FAILURE_TTL, FAILURE_TTL_MAX)
+
+    def record_success(self, provider: str, query: str):
+        with self._lock:
+            self._entries.pop(self._key(provider, query), None)
+
+    def _record(self, provider: str, query: str, kind: str, ttl: float, ttl_max: float):
+        key = self._key(provider, query)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            repeats = entry[1] + 1 if entry is not None and entry[0] == kind else 1
+            backoff = min(ttl_max, ttl * 2 ** (repeats - 1))
+            self._entries[key] = [kind, repeats, time.monotonic() + backoff]
+            self._stats["empties" if kind == EMPTY else "failures"] += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        now = time.monotonic()
+        with self._lock:
+            active = [entry[0] for entry in self._entries.values() if entry[2] > now]
+            return {
+                "entries": len(self._entries),
+                "blocking_empty": active.count(EMPTY),
+                "blocking_failed": active.count(FAILED),
+                **self._stats,
+            }
+
+
+# Process-wide instance shared by every search client
+negative_cache = NegativeCache()
@@ -0,0 +1,98 @@
+"""
+Claim Extraction Micro-Benchmark
+Per-tweet cost of the single-pass tweet normalizer versus the previous
+five-pass regex extraction, on a large synthetic tweet corpus.
+
+Usage:
+    python -m infra.search.normalizer_benchmark [num_tweets]
+"""
+
+import random
+import re
+import sys
+import time
+from typing import List
+
+from infra.search.claim_extractor import extract_claim
+
+
+def legacy_extract_claim(text: str) -> str:
+    """
+    The previous extract_claim: five separate re.sub/re.split passes.
+    """
+    if not text or not isinstance(text, str):
+        return ""
+    text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
+    text = re.sub(r'@\w+', '', text)
+    text = re.sub(r'#\w+', '', text)
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    sentences = re.split(r'[.!?]+', text)
+    if sentences and sentences[0]:
+        claim = sentences[0].strip()
+    else:
+        claim = text[:200].strip()
+    return claim
+
+
+WORDS = (
+    "vaccine bleach cures coronavirus government announces new policy study shows "
+    "scientists confirm election rigged planet discovered towers cause health "
+    "climate hoax billion dollars reports officials deny claims viral video"
+).split()
+
+
+def synthetic_corpus(n: int, seed: int = 7) -> List[str]:
+    """
+    Tweets of 8-40 words with mentions, hashtags, URLs and 1-3 sentences.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(n):
+        parts = []
+        if rng.random() < 0.3:
+            parts.append(f"RT @user{rng.randrange(1000)}:")
+        for s in range(rng.randint(1, 3)):
+            words = [rng.choice(WORDS) for _ in range(rng.randint(4, 14))]
+            if rng.random() < 0.3:
+                words.insert(rng.randrange(len(words)), f"@handle{rng.randrange(100)}")
+            parts.append(" ".join(words) + rng.choice([".", "!", "?", "!!", "..."]))
+        if rng.random() < 0.5:
+            parts.append(f"https://t.co/{rng.randrange(10**8):08d}")
+        parts.extend(f"#{rng.choice(WORDS)}" for _ in range(rng.randint(0, 3)))
+        corpus.append("  ".join(parts) if rng.random() < 0.2 else " ".join(parts))
+    return corpus
+
+
+def time_per_tweet(fn, corpus: List[str]) -> float:
+    start = time.perf_counter()
+    for tweet in corpus:
+        fn(tweet)
+    return (time.perf_counter() - start) / len(corpus) * 1e6
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    corpus = synthetic_corpus(n)
+
+    # warm up both paths
+    for tweet in corpus[:1000]:
+        legacy_extract_claim(tweet)
+        extract_claim(tweet)
+
+    legacy_us = time_per_tweet(legacy_extract_claim, corpus)
+    single_us = time_per_tweet(extract_claim, corpus)
+    mismatches = sum(1 for t in corpus if legacy_extract_claim(t) != extract_claim(t))
+
+    print("=" * 80)
+    print("CLAIM EXTRACTION BENCHMARK")
+    print("=" * 80)
+    print(f"Tweets:               {n}")
+    print(f"Legacy five-pass:     {legacy_us:.2f} us/tweet")
+    print(f"Single-pass:          {single_us:.2f} us/tweet")
+    print(f"Speedup:              {legacy_us / single_us:.2f}x")
+    print(f"Output differences:   {mismatches} ({mismatches / n:.1%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,46 @@ Search Pipeline Module
 Master orchestration for the search intelligence layer.
 """
 
-from typing import Dict, List, Any
+import os
+import time
+from typing import Dict, List, Any, Optional
 from .claim_extractor import extract_claim, is_valid_claim
 from .query_builder import build_query
 from .serper import search_serper, is_serper_available
 from .duckduckgo import search_duckduckgo
 from .scoring import score_evidence, calculate_credibility_score
+from .near_duplicate import NearDuplicateIndex
+from .results import as_evidence
+from .rate_limiter import PRIORITY_INTERACTIVE, PRIORITY_BATCH
+from .factcheck_index import match_factcheck
+from .check_worthiness import check_worthiness, CHECK_WORTHY_THRESHOLD
 
 
-def run_search_pipeline(text: str) -> Dict[str, Any]:
+# Earlier pipeline results, indexed by claim for near-duplicate reuse, as
+# (stored_at, result); older than PIPELINE_RESULT_TTL seconds they are
+# searched again (same default as the backend verdict cache)
+_result_index = NearDuplicateIndex()
+PIPELINE_RESULT_TTL = float(os.getenv("PIPELINE_RESULT_TTL", os.getenv("VERDICT_CACHE_TTL", "900")))
+
+# Credibility reported for a claim settled by a published fact-check
+FACTCHECK_CREDIBILITY = {"contradicted": 0.1, "accurate": 0.9, "unverified": 0.5}
+
+
+def run_search_pipeline(
+    text: str,
+    reuse_duplicates: bool = True,
+    top_k: Optional[int] = None,
+    priority: str = PRIORITY_INTERACTIVE
+) -> Dict[str, Any]:
     """
     Run the complete search pipeline for misinformation detection.
     
     Args:
         text: Raw tweet text
+        reuse_duplicates: Reuse the result of a near-duplicate claim seen
+            earlier instead of searching again
+        top_k: Maximum results to fetch per provider (None: provider default)
+        priority: Outbound scheduler priority class for provider calls
         
     Returns:
         Dictionary containing:
@@ -26,7 +52,8 @@ def run_search_pipeline(text: str) -> Dict[str, Any]:
             "score": {"matches": int, "contradictions": int, "total": int},
             "credibility": float,
             "results": [{"title": str, "snippet": str}, ...],
-            "source": str
+            "source": str,
+            "factcheck": dict  # only when source == "factcheck"
         }
     """
     # Step 1: Extract claim
@@ -43,6 +70,51 @@ def run_search_pipeline(text: str) -> Dict[str, Any]:
             "error": "Invalid or insufficient claim content"
         }
     
+    # Known, already fact-checked claims never reach a search provider
+    # (checked before the pre-filter: "my uncle says ..." may score low)
+    factcheck = match_factcheck(claim)
+    if factcheck is not None:
+        return {
+            "claim": claim,
+            "query": "",
+            "score": {"matches": 0, "contradictions": 0, "total": 0},
+            "credibility": FACTCHECK_CREDIBILITY.get(factcheck["verdict"], 0.5),
+            "results": [{"title": f"Fact check by {factcheck['publisher']}: {factcheck['rating']}",
+                         "link": factcheck["url"], "snippet": factcheck["claim"]}],
+            "source": "factcheck",
+            "factcheck": factcheck
+        }
+    
+    # Opinions, jokes and greetings are not worth a search
+    worthiness = check_worthiness(claim)
+    if worthiness < CHECK_WORTHY_THRESHOLD:
+        return {
+            "claim": claim,
+            "query": "",
+            "score": {"matches": 0, "contradictions": 0, "total": 0},
+            "credibility": 0.5,
+            "results": [],
+            "source": "none",
+            "check_worthiness": round(worthiness, 3),
+            "error": "Not a check-worthy claim"
+        }
+    
+    # Retweets and copy-paste variants reuse an earlier verdict and evidence
+    if reuse_duplicates:
+        match = _result_index.query(claim)
+        if match is not None and time.monotonic() - match[2][0] > PIPELINE_RESULT_TTL:
+            # expired: search again; the fresh result replaces it below
+            _result_index.remove(match[0])
+        elif match is not None:
+            matched_claim, similarity, (_, previous) = match
+            return {
+                **previous,
+                "results": [ev.to_dict() for ev in previous["results"]],
+                "claim": claim,
+                "duplicate_of": matched_claim,
+                "similarity": round(similarity, 3)
+            }
+    
     # Step 2: Build search query
     query = build_query(claim)
     
@@ -51,24 +123,24 @@ def run_search_pipeline(text: str) -> Dict[str, Any]:
     source = "none"
     
     if is_serper_available():
-        results = search_serper(query)
+        results = search_serper(query, top_k=top_k, priority=priority)
         if results:
             source = "serper"
     
     # Step 4: Fallback to DuckDuckGo if no results
     if not results:
-        results = search_duckduckgo(query)
+        results = search_duckduckgo(query, top_k=top_k, priority=priority)
         if results:
             source = "duckduckgo"
     
     # Step 5: Score evidence
-    evidence_score = score_evidence(claim, results)
+    evidence = as_evidence(results)
+    evidence_score = score_evidence(claim, evidence)
     
     # Step 6: Calculate credibility
     credibility = calculate_credibility_score(evidence_score)
     
-    # Return complete results
-    return {
+    result = {
         "claim": claim,
         "query": query,
         "score": evidence_score,
@@ -76,6 +148,13 @@ def run_search_pipeline(text: str) -> Dict[str, Any]:
         "results": results,
         "source": source
     }
+    
+    if results:
+        # keep compact immutable records in the index, not the result dicts
+        _result_index.add(claim, claim, (time.monotonic(), {**result, "results": tuple(evidence)}))
+    
+    # Return complete results
+    return result
 
 
 def run_batch_search(texts: List[str]) -> List[Dict[str, Any]]:
@@ -91,7 +170,8 @@ def run_batch_search(texts: List[str]) -> List[Dict[str, Any]]:
     results = []
     
     for text in texts:
-        result = run_search_pipeline(text)
+        # batch work queues behind interactive verification
+        result = run_search_pipeline(text, priority=PRIORITY_BATCH)
         results.append(result)
     
     return results
@@ -114,7 +194,7 @@ def validate_pipeline() -> Dict[str, bool]:
     
     # Test with sample text
     try:
-        test_result = run_search_pipeline("Breaking news: Scientists discover new planet")
+        test_result = run_search_pipeline("Breaking news: Scientists discover new planet", reuse_duplicates=False)
         status["pipeline"] = bool(test_result.get("claim"))
     except Exception:
         status["pipeline"] = False
@@ -0,0 +1,207 @@
+"""
+Rate Limiter Module
+Central outbound request scheduler: one token bucket per search
+provider, priority classes and bounded queueing with deadlines.
+
+Callers acquire() a slot before each upstream call. When a provider is
+over its rate (or its quota is reported exhausted) callers wait in
+priority order until their deadline, then give up quickly so they can
+fall back to another provider or a cached answer.
+"""
+
+import heapq
+import itertools
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+
+# Priority classes, most important first
+PRIORITY_INTERACTIVE = "interactive"   # extension /verify calls
+PRIORITY_BATCH = "batch"               # batch pipelines
+PRIORITY_REFLECTION = "reflection"     # agent retry passes
+
+PRIORITIES = {PRIORITY_INTERACTIVE: 0, PRIORITY_BATCH: 1, PRIORITY_REFLECTION: 2}
+
+# Default time a caller of each class may wait for a slot (seconds)
+DEFAULT_MAX_WAIT = {
+    PRIORITY_INTERACTIVE: float(os.getenv("SCHEDULER_WAIT_INTERACTIVE", "1.0")),
+    PRIORITY_BATCH: float(os.getenv("SCHEDULER_WAIT_BATCH", "10.0")),
+    PRIORITY_REFLECTION: float(os.getenv("SCHEDULER_WAIT_REFLECTION", "2.0")),
+}
+
+# Per-provider limits: (requests per second, burst)
+DEFAULT_LIMITS = {
+    "serper": (float(os.getenv("SERPER_RATE_PER_SEC", "5")), int(os.getenv("SERPER_BURST", "10"))),
+    "duckduckgo": (float(os.getenv("DDG_RATE_PER_SEC", "1")), int(os.getenv("DDG_BURST", "3"))),
+}
+
+# Upstream responses meaning "rate limited / out of quota"
+QUOTA_STATUS_CODES = frozenset({402, 429})
+
+# Provider pause after a quota/429 response without Retry-After (seconds)
+DEFAULT_QUOTA_BACKOFF = float(os.getenv("SCHEDULER_QUOTA_BACKOFF", "60"))
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at `rate` tokens/s up to `burst`.
+    Not thread-safe on its own; RequestScheduler holds the lock.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait_time(self, now: float, tokens: float = 1.0) -> float:
+        """
+        Seconds until `tokens` tokens are available (0 if available now).
+        """
+        self._refill(now)
+        pause = max(0.0, self.paused_until - now)
+        missing = tokens - self.tokens
+        if missing <= 0:
+            return pause
+        if self.rate <= 0:
+            return float("inf")
+        return max(pause, missing / self.rate)
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1.0
+
+    def give_back(self, now: float):
+        self._refill(now)
+        self.tokens = min(self.burst, self.tokens + 1.0)
+
+    def pause(self, now: float, seconds: float):
+        self.paused_until = max(self.paused_until, now + seconds)
+        self.tokens = 0.0
+        self.updated = now
+
+
+class RequestScheduler:
+    """
+    Per-provider token buckets with a priority queue of waiters.
+
+    Providers without configured limits are never throttled.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, tuple]] = None, max_wait: Optional[Dict[str, float]] = None):
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._buckets = {name: TokenBucket(rate, burst) for name, (rate, burst) in (limits or {}).items()}
+        self._waiting = {name: [] for name in self._buckets}
+        self._max_wait = dict(DEFAULT_MAX_WAIT, **(max_wait or {}))
+        self._stats = {name: {"granted": 0, "rejected": 0, "refunded": 0, "quota_pauses": 0} for name in self._buckets}
+
+    def acquire(self, provider: str, priority: str = PRIORITY_INTERACTIVE, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a slot to call `provider`.
+
+        Args:
+            provider: Provider name ("serper", "duckduckgo", ...)
+            priority: One of PRIORITIES; lower classes wait behind higher ones
+            timeout: Maximum wait in seconds (default: per-priority max wait)
+
+        Returns:
+            True if the call may proceed, False if no slot was available
+            before the deadline (the caller should degrade, not retry)
+        """
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            return True
+
+        if timeout is None:
+            timeout = self._max_wait.get(priority, self._max_wait[PRIORITY_BATCH])
+        deadline = time.monotonic() + timeout
+        ticket = (PRIORITIES.get(priority, len(PRIORITIES)), next(self._seq))
+
+        with self._cond:
+            queue = self._waiting[provider]
+            heapq.heappush(queue, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    # everyone ahead in the queue needs a token first
+                    ahead = sum(1 for t in queue if t < ticket)
+                    wait = bucket.wait_time(now, tokens=ahead + 1)
+                    if ahead == 0 and wait <= 0:
+                        bucket.take(now)
+                        self._stats[provider]["granted"] += 1
+                        return True
+                    remaining = deadline - now
+                    if wait > remaining:
+                        # can't be served in time: fail fast instead of queueing
+                        self._stats[provider]["rejected"] += 1
+                        return False
+                    self._cond.wait(min(remaining, max(wait, 0.001)))
+            finally:
+                queue.remove(ticket)
+                heapq.heapify(queue)
+                self._cond.notify_all()
+
+    def refund(self, provider: str):
+        """
+        Return a slot granted by acquire() for a call that was not made
+        (e.g. refused by the cost budget), so it isn't lost to other callers.
+        """
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            return
+        with self._cond:
+            bucket.give_back(time.monotonic())
+            self._stats[provider]["refunded"] += 1
+            self._cond.notify_all()
+
+    def report_quota_exhausted(self, provider: str, retry_after: Optional[float] = None):
+        """
+        Pause a provider after a 429 / quota error so queued and new calls
+        fall back immediately instead of hitting it again.
+        """
+        bucket = self._buckets.get(provider)
+        if bucket is None:
+            return
+        with self._cond:
+            bucket.pause(time.monotonic(), retry_after if retry_after is not None else DEFAULT_QUOTA_BACKOFF)
+            self._stats[provider]["quota_pauses"] += 1
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        now = time.monotonic()
+        with self._cond:
+            return {
+                name: {
+                    **self._stats[name],
+                    "rate": bucket.rate,
+                    "burst": bucket.burst,
+                    "tokens": round(min(bucket.burst, bucket.tokens + max(0.0, now - bucket.updated) * bucket.rate), 2),
+                    "paused_for": round(max(0.0, bucket.paused_until - now), 2),
+                    "waiting": len(self._waiting[name]),
+                }
+                for name, bucket in self._buckets.items()
+            }
+
+
+# Process-wide scheduler shared by every search client
+scheduler = RequestScheduler(DEFAULT_LIMITS)
+
+
+def retry_after_seconds(response) -> Optional[float]:
+    """
+    Retry-After header of an HTTP response in seconds, if present and numeric.
+    """
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
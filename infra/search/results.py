@@ -0,0 +1,189 @@
+"""
+Search Results Module
+Shared result record (Evidence) and helpers for the results returned
+by search providers.
+"""
+
+import json
+import sys
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson is absent
+    orjson = None
+
+
+# Fields every provider can fill
+RESULT_FIELDS = ("title", "link", "snippet")
+
+
+@lru_cache(maxsize=4096)
+def domain_of(link: str) -> str:
+    """
+    Interned, lowercased host of a link without a leading "www.".
+
+    Args:
+        link: Result URL
+
+    Returns:
+        Domain string shared by every record from the same site
+    """
+    if not link:
+        return ""
+    try:
+        host = urlsplit(link).hostname or ""
+    except ValueError:
+        return ""
+    if host.startswith("www."):
+        host = host[4:]
+    return sys.intern(host)
+
+
+class Evidence:
+    """
+    Immutable search result record.
+
+    Uses __slots__ (no per-instance __dict__) and interned domain strings,
+    so cached results cost far less memory than plain dicts. Supports
+    read-only dict-style access (`ev["title"]`, `ev.get("score", 0)`) so
+    code written against result dicts keeps working.
+    """
+
+    __slots__ = ("title", "link", "snippet", "domain", "score")
+
+    def __init__(self, title: str = "", link: str = "", snippet: str = "", score: Optional[float] = None):
+        _set = object.__setattr__
+        _set(self, "title", title or "")
+        _set(self, "link", link or "")
+        _set(self, "snippet", snippet or "")
+        _set(self, "domain", domain_of(link or ""))
+        _set(self, "score", score)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Evidence is immutable; use with_score()")
+
+    def __delattr__(self, name):
+        raise AttributeError("Evidence is immutable")
+
+    def __repr__(self):
+        return f"Evidence(title={self.title!r}, link={self.link!r}, score={self.score!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Evidence):
+            return NotImplemented
+        return (self.title, self.link, self.snippet, self.score) == (other.title, other.link, other.snippet, other.score)
+
+    def __hash__(self):
+        return hash((self.title, self.link, self.snippet, self.score))
+
+    def __getitem__(self, key: str):
+        if key in RESULT_FIELDS or (key == "score" and self.score is not None):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in RESULT_FIELDS or (key == "score" and self.score is not None)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def with_score(self, score: float) -> "Evidence":
+        """
+        Copy of this record with a score attached.
+        """
+        ev = object.__new__(Evidence)
+        _set = object.__setattr__
+        _set(ev, "title", self.title)
+        _set(ev, "link", self.link)
+        _set(ev, "snippet", self.snippet)
+        _set(ev, "domain", self.domain)
+        _set(ev, "score", score)
+        return ev
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Plain-dict form used in API responses.
+        """
+        data = {"title": self.title, "link": self.link, "snippet": self.snippet}
+        if self.score is not None:
+            data["score"] = self.score
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Union["Evidence", Dict[str, Any]], fields: Optional[Iterable[str]] = None) -> "Evidence":
+        """
+        Build a record from a result dict (an Evidence is returned as is).
+
+        Args:
+            data: Result dict with title / link / snippet / score
+            fields: Only copy these fields (others stay empty)
+
+        Returns:
+            Evidence record
+        """
+        if isinstance(data, Evidence):
+            return data
+        if fields is not None:
+            data = project_fields(data, fields)
+        return cls(
+            title=data.get("title") or "",
+            link=data.get("link") or "",
+            snippet=data.get("snippet") or "",
+            score=data.get("score"),
+        )
+
+
+def as_evidence(items: Iterable[Union[Evidence, Dict[str, Any]]]) -> List[Evidence]:
+    """
+    Convert result dicts (or records) to a list of Evidence.
+    """
+    return [Evidence.from_dict(item) for item in items]
+
+
+def json_default(obj: Any) -> Any:
+    """
+    JSON fallback encoder: Evidence records become plain dicts.
+    """
+    if isinstance(obj, Evidence):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def evidence_to_json(items: Iterable[Evidence]) -> bytes:
+    """
+    Serialize evidence records to JSON bytes (orjson when installed).
+    """
+    data = [item.to_dict() for item in items]
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def evidence_from_json(data: Union[bytes, str]) -> List[Evidence]:
+    """
+    Parse JSON (a list of result objects) into evidence records.
+    """
+    items = orjson.loads(data) if orjson is not None else json.loads(data)
+    return as_evidence(items)
+
+
+def project_fields(result: Dict[str, str], fields: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """
+    Keep only the requested fields of a result.
+
+    Args:
+        result: Result record
+        fields: Field names to keep; None keeps the record unchanged
+
+    Returns:
+        Result with only the requested fields
+    """
+    if fields is None:
+        return result
+    return {name: result.get(name, "") for name in fields}
@@ -14,6 +14,15 @@ CONTRADICTION_KEYWORDS = [
     "fabricated", "bogus", "conspiracy", "rumor", "unverified"
 ]
 
+# Common English stop words ignored for keyword matching
+STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for",
+    "from", "has", "he", "in", "is", "it", "its", "of", "on",
+    "that", "the", "to", "was", "will", "with", "this", "but",
+    "they", "have", "had", "what", "when", "where", "who", "which",
+    "their", "said", "been", "were", "more", "some", "can"
+})
+
 
 def score_evidence(claim: str, results: List[Dict[str, str]]) -> Dict[str, int]:
     """
@@ -83,15 +92,7 @@ def extract_keywords(text: str) -> List[str]:
     words = text.split()
     
     # Filter out common stop words
-    stop_words = {
-        "a", "an", "and", "are", "as", "at", "be", "by", "for",
-        "from", "has", "he", "in", "is", "it", "its", "of", "on",
-        "that", "the", "to", "was", "will", "with", "this", "but",
-        "they", "have", "had", "what", "when", "where", "who", "which",
-        "their", "said", "been", "has", "were", "more", "some", "can"
-    }
-    
-    keywords = [w for w in words if w not in stop_words and len(w) > 2]
+    keywords = [w for w in words if w not in STOP_WORDS and len(w) > 2]
     
     return keywords
 
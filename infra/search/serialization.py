@@ -0,0 +1,40 @@
+"""
+Serialization Module
+Fast JSON encode/decode for API and MCP responses. Uses orjson when it
+is installed and falls back to the stdlib json module otherwise.
+Evidence records are encoded directly, without an intermediate
+jsonable_encoder pass. The web apps wrap dumps() in their own response
+class (backend/app/responses.py, infra/mcp/responses.py), so this
+module does not depend on the web framework.
+"""
+
+import json
+from typing import Any, Union
+
+from infra.search.results import json_default, orjson
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON bytes.
+
+    Args:
+        content: JSON-compatible data; Evidence records are allowed anywhere
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(content, default=json_default)
+    return json.dumps(
+        content, default=json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse JSON bytes or text.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
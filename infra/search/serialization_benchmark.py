@@ -0,0 +1,101 @@
+"""
+Serialization Benchmark
+Encode/decode time and peak allocations for a large batch of verify-style
+responses: FastAPI's default path (jsonable_encoder + stdlib JSONResponse)
+versus serialization.dumps (the body FastJSONResponse renders), which
+encodes Evidence records directly.
+
+Usage:
+    python -m infra.search.serialization_benchmark [num_responses] [sources_per_response]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from infra.search.results import Evidence, orjson
+from infra.search.serialization import dumps, loads
+
+
+def synthetic_batch(num_responses: int, sources_per_response: int) -> List[Dict[str, Any]]:
+    batch = []
+    for i in range(num_responses):
+        sources = [
+            Evidence(
+                f"Fact check: claim {i} source {j} reviewed by reporters",
+                f"https://news{j}.example.org/story/{i}/{j}",
+                "Reporters looked into the claim and found no evidence; experts say the post is misleading. " * 2,
+                score=0.5 + j / 100,
+            )
+            for j in range(sources_per_response)
+        ]
+        batch.append({
+            "verdict": "misleading",
+            "confidence": 0.72,
+            "claim": f"Claim number {i} spreading online",
+            "search_queries": [f"claim {i}", f"claim {i} news", f"claim {i} fact check"],
+            "top_sources": sources,
+            "reasoning": ["Claim extracted", "Queries generated", f"Found {sources_per_response} evidence sources"],
+        })
+    return batch
+
+
+def default_encode(content: Any) -> bytes:
+    # what FastAPI does for a plain dict return value
+    return JSONResponse(jsonable_encoder(content, custom_encoder={Evidence: Evidence.to_dict})).body
+
+
+def fast_encode(content: Any) -> bytes:
+    # what FastJSONResponse.render does
+    return dumps(content)
+
+
+def measure(fn: Callable[[Any], Any], arg: Any, rounds: int):
+    """
+    Returns (ms per call, peak allocated KB for one call).
+    """
+    fn(arg)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(arg)
+    ms = (time.perf_counter() - start) / rounds * 1000
+
+    tracemalloc.start()
+    fn(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return ms, peak / 1024
+
+
+def main():
+    num_responses = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    sources_per_response = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    rounds = 20
+
+    batch = synthetic_batch(num_responses, sources_per_response)
+    body = fast_encode(batch)
+
+    enc_default = measure(default_encode, batch, rounds)
+    enc_fast = measure(fast_encode, batch, rounds)
+    dec_default = measure(json.loads, body, rounds)
+    dec_fast = measure(loads, body, rounds)
+
+    print("=" * 80)
+    print("SERIALIZATION BENCHMARK")
+    print("=" * 80)
+    print(f"Batch: {num_responses} responses x {sources_per_response} sources, {len(body) / 1024:.0f} KB JSON")
+    print(f"orjson available: {orjson is not None}")
+    print(f"Encode default (jsonable_encoder+json): {enc_default[0]:8.2f} ms   peak {enc_default[1]:8.0f} KB")
+    print(f"Encode dumps (FastJSONResponse):        {enc_fast[0]:8.2f} ms   peak {enc_fast[1]:8.0f} KB")
+    print(f"Decode json.loads:                      {dec_default[0]:8.2f} ms   peak {dec_default[1]:8.0f} KB")
+    print(f"Decode serialization.loads:             {dec_fast[0]:8.2f} ms   peak {dec_fast[1]:8.0f} KB")
+    print(f"Encode speedup: {enc_default[0] / enc_fast[0]:.1f}x   decode speedup: {dec_default[0] / dec_fast[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,22 +5,44 @@ Primary search engine using Google Serper API.
 
 import os
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional
+
+from .results import project_fields
+from .adaptive_timeout import adaptive_timeouts
+from .rate_limiter import scheduler, retry_after_seconds, PRIORITY_INTERACTIVE, QUOTA_STATUS_CODES
+from .negative_cache import negative_cache
+from .cost_ledger import CostLedger, acquire_upstream
 
 
 SERPER_API_URL = "https://google.serper.dev/search"
 
 
-def search_serper(query: str) -> List[Dict[str, str]]:
+def search_serper(
+    query: str,
+    top_k: Optional[int] = None,
+    fields: Optional[Iterable[str]] = None,
+    priority: str = PRIORITY_INTERACTIVE,
+    ledger: Optional[CostLedger] = None
+) -> List[Dict[str, str]]:
     """
     Search using Serper API.
     
     Args:
         query: Search query string
+        top_k: Maximum number of results; also sent to Serper as `num`
+            so it doesn't return results we would discard
+        fields: Result fields to keep (default: title, link, snippet)
+        priority: Scheduler priority class; returns [] without calling
+            Serper when no rate-limit slot is free in time
+        ledger: Per-request cost ledger charged for the call; returns []
+            once the request's or the per-minute budget is used up
+        
+    Queries that recently came back empty or failed are answered []
+    without calling Serper (see negative_cache).
         
     Returns:
-        List of search results with title and snippet
-        Format: [{"title": "...", "snippet": "..."}, ...]
+        List of search results with title, link and snippet
+        Format: [{"title": "...", "link": "...", "snippet": "..."}, ...]
     """
     api_key = os.environ.get("SERPER_API_KEY")
     
@@ -39,16 +61,30 @@ def search_serper(query: str) -> List[Dict[str, str]]:
     payload = {
         "q": query
     }
+    if top_k:
+        payload["num"] = top_k
+    
+    if negative_cache.blocked("serper", query):
+        return []
+    
+    if not acquire_upstream(ledger, "serper", priority):
+        return []
     
     try:
-        response = requests.post(
-            SERPER_API_URL,
-            json=payload,
-            headers=headers,
-            timeout=10
-        )
+        timeout = adaptive_timeouts.timeout_for("serper")
+        with adaptive_timeouts.measure("serper", timeout, requests.Timeout):
+            response = requests.post(
+                SERPER_API_URL,
+                json=payload,
+                headers=headers,
+                timeout=timeout
+            )
         
+        if response.status_code in QUOTA_STATUS_CODES:
+            scheduler.report_quota_exhausted("serper", retry_after_seconds(response))
+            return []
         if response.status_code != 200:
+            negative_cache.record_failure("serper", query)
             return []
         
         data = response.json()
@@ -62,21 +98,31 @@ def search_serper(query: str) -> List[Dict[str, str]]:
             snippet = item.get("snippet", "")
             
             if title or snippet:
-                results.append({
+                results.append(project_fields({
                     "title": title,
+                    "link": item.get("link", ""),
                     "snippet": snippet
-                })
+                }, fields))
+                if top_k and len(results) >= top_k:
+                    break
         
+        if results:
+            negative_cache.record_success("serper", query)
+        else:
+            negative_cache.record_empty("serper", query)
         return results
         
     except requests.RequestException:
         # Network error or timeout
+        negative_cache.record_failure("serper", query)
         return []
     except (KeyError, ValueError):
         # JSON parsing error
+        negative_cache.record_failure("serper", query)
         return []
     except Exception:
         # Any other error
+        negative_cache.record_failure("serper", query)
         return []
 
 
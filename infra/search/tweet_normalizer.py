@@ -0,0 +1,86 @@
+"""
+Tweet Normalizer Module
+Single-pass tweet cleanup shared by the search layer and the backend:
+strips URLs, mentions and hashtags, collapses whitespace and splits
+sentences in one scan over the text.
+"""
+
+import re
+from typing import List, Optional
+
+
+# One precompiled alternation: removable tokens and sentence terminators.
+# A line break also ends a sentence, so the first line of a multi-line
+# tweet is its claim. Whitespace is collapsed per sentence with
+# str.split(), which runs in C.
+_TOKEN_RE = re.compile(r"(?P<skip>https?://\S+|@\w+|#\w+)|(?P<end>[.!?]+|\n)")
+
+
+def split_sentences(text: str, max_sentences: Optional[int] = None) -> List[str]:
+    """
+    Clean tweet text and split it into sentences in a single regex scan.
+
+    Args:
+        text: Raw tweet text
+        max_sentences: Stop scanning once this many sentences are found
+
+    Returns:
+        Non-empty, whitespace-collapsed sentences without URLs,
+        mentions or hashtags
+    """
+    if not text or not isinstance(text, str):
+        return []
+
+    sentences = []
+    parts = []
+    pos = 0
+
+    for match in _TOKEN_RE.finditer(text):
+        parts.append(text[pos:match.start()])
+        pos = match.end()
+
+        if match.lastgroup == "skip":
+            # keep a word boundary where the token was
+            parts.append(" ")
+            continue
+
+        sentence = " ".join("".join(parts).split())
+        parts = []
+        if sentence:
+            sentences.append(sentence)
+            if max_sentences is not None and len(sentences) >= max_sentences:
+                return sentences
+
+    parts.append(text[pos:])
+    sentence = " ".join("".join(parts).split())
+    if sentence:
+        sentences.append(sentence)
+
+    return sentences
+
+
+def first_sentence(text: str) -> str:
+    """
+    First cleaned sentence of a tweet; scanning stops right after it.
+
+    Args:
+        text: Raw tweet text
+
+    Returns:
+        Cleaned first sentence, or "" when nothing remains
+    """
+    sentences = split_sentences(text, max_sentences=1)
+    return sentences[0] if sentences else ""
+
+
+def normalize_tweet(text: str) -> str:
+    """
+    Clean a whole tweet, keeping every sentence.
+
+    Args:
+        text: Raw tweet text
+
+    Returns:
+        Cleaned text with sentences joined by ". "
+    """
+    return ". ".join(split_sentences(text))